@@ -54,11 +54,47 @@ def load_console_scripts(project):
     return retval
 
 
+def _declared_plugin_name(plugin_file):
+    """Extracts the name of the Jenkins plugin supported by a PyJen plugin
+
+    The name is parsed from the return statement of the static
+    'get_jenkins_plugin_name' method defined in the plugin source file, so the
+    module does not need to be imported.
+
+    Args:
+        plugin_file (str):
+            path to the Python source file defining the plugin
+
+    Returns:
+        str:
+            name of the Jenkins plugin supported by the PyJen plugin, or None
+            if the name could not be determined statically
+    """
+    with open(plugin_file, encoding="utf-8") as source:
+        tree = ast.parse(source.read())
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.FunctionDef):
+            continue
+        if node.name != "get_jenkins_plugin_name":
+            continue
+        for statement in ast.walk(node):
+            if isinstance(statement, ast.Return):
+                try:
+                    return ast.literal_eval(statement.value)
+                except ValueError:
+                    return None
+    return None
+
+
 def load_plugins(project):
     """Generates list of plugins for use by Python setup tools
 
     Each element in this list defines the name and entry point function for each
-    plugin included with the current project.
+    plugin included with the current project. The name of each entry point is
+    the name of the Jenkins plugin supported by the PyJen plugin, which allows
+    PyJen to locate plugins from the package metadata without having to
+    import them.
 
     This script assumes that any python script found in a folder named 'plugins'
     under the project folder is to be registered as an extension point for
@@ -92,8 +128,10 @@ def load_plugins(project):
     for py_file in py_scripts:
         file_parts = os.path.splitext(py_file)
         if file_parts[1] == ".py" and file_parts[0] != '__init__':
+            plugin_name = _declared_plugin_name(
+                os.path.join(plugins_path, py_file)) or file_parts[0]
             script_config = \
-                f"{file_parts[0]}={plugins_namespace}.{file_parts[0]}:" \
+                f"{plugin_name}={plugins_namespace}.{file_parts[0]}:" \
                 f"PluginClass"
             retval.append(script_config)
 
@@ -319,6 +357,8 @@ def main():
         python_requires=PROJECT["SUPPORTED_PYTHON_VERSION"],
         extras_require={
             'dev': PROJECT["DEV_DEPENDENCIES"],
+            'aio': PROJECT["AIO_DEPENDENCIES"],
+            'lxml': PROJECT["LXML_DEPENDENCIES"],
         },
         license="Apache License 2.0",
         # https://pypi.org/classifiers/
@@ -0,0 +1,19 @@
+"""Asynchronous counterparts of the core PyJen APIs, for use with asyncio
+
+Requires the optional aiohttp package, which may be installed using
+'pip install pyjen[aio]'.
+
+Example:
+::
+
+    import asyncio
+    from pyjen.aio import Jenkins
+
+    async def main():
+        async with Jenkins.basic_auth(url, ("user", "token")) as jenkins:
+            jobs = await jenkins.jobs
+            names = await asyncio.gather(*(cur_job.name for cur_job in jobs))
+
+    asyncio.run(main())
+"""
+from pyjen.aio.jenkins import Jenkins
@@ -0,0 +1,140 @@
+"""Asynchronous primitives for interacting with Jenkins builds"""
+import asyncio
+import time
+from pyjen.aio.projection import async_json_property, property_data
+
+#: float: default minimum number of seconds between checks of a running build
+DEFAULT_POLL_INTERVAL = 1
+
+#: float: default maximum number of seconds between checks of a running build
+DEFAULT_MAX_POLL_INTERVAL = 60
+
+
+class Build:
+    """information about a single build / run of a :class:`~.job.Job`
+
+    Asynchronous counterpart of :class:`pyjen.build.Build`
+    """
+
+    def __init__(self, api):
+        """
+        Args:
+            api (AsyncJenkinsAPI):
+                Pre-initialized connection to the Jenkins REST API
+        """
+        super().__init__()
+        self._api = api
+
+    def __repr__(self):
+        return self._api.url
+
+    def __eq__(self, obj):
+        if not isinstance(obj, Build):
+            return False
+        return obj.url == self.url
+
+    def __ne__(self, obj):
+        return not self == obj
+
+    def __hash__(self):
+        return hash(self.url)
+
+    def invalidate(self):
+        """Discards any cached data for this build, so it gets reloaded from
+        the Jenkins server the next time it is accessed
+        """
+        self._api.invalidate()
+
+    @property
+    def url(self):
+        """str: URL of this build"""
+        return self._api.url
+
+    @async_json_property("number")
+    async def number(self):
+        """int: sequentially assigned numeric ID for the build"""
+        data = await property_data(self, "number")
+        return data['number']
+
+    @async_json_property("building")
+    async def is_building(self):
+        """bool: True if the build is currently executing otherwise False"""
+        data = await property_data(self, "is_building")
+        return data['building']
+
+    @async_json_property("result")
+    async def result(self):
+        """str: the state of the associated build
+
+        Typical values returned by this property are "SUCCESS", "FAILURE",
+        "UNSTABLE" and "ABORTED". Returns None while the build is running.
+        """
+        data = await property_data(self, "result")
+        return data['result']
+
+    @async_json_property("duration")
+    async def duration(self):
+        """int: duration of the build in milliseconds"""
+        data = await property_data(self, "duration")
+        return data['duration']
+
+    @async_json_property("estimatedDuration")
+    async def estimated_duration(self):
+        """int: estimated duration of the build in milliseconds"""
+        data = await property_data(self, "estimated_duration")
+        return data['estimatedDuration']
+
+    @property
+    def console_output(self):
+        """str: raw console output for this build, as plain text"""
+        return self._api.get_text("/consoleText")
+
+    async def wait_until_complete(self, timeout=None,
+                                  poll_interval=DEFAULT_POLL_INTERVAL,
+                                  max_poll_interval=DEFAULT_MAX_POLL_INTERVAL):
+        """Waits until this build completes
+
+        The build is checked with exponentially increasing delays, so many
+        long running builds may be waited on concurrently without flooding
+        the server with requests.
+
+        Args:
+            timeout (float):
+                Optional number of seconds to wait for the build to complete.
+                If this value is undefined, this method will wait
+                indefinitely.
+            poll_interval (float):
+                minimum number of seconds to wait between checks of the build
+            max_poll_interval (float):
+                maximum number of seconds to wait between checks of the build
+
+        Returns:
+            bool:
+                True if the build has completed before returning, otherwise
+                returns False
+        """
+        start = time.monotonic()
+        delay = poll_interval
+        while True:
+            self.invalidate()
+            if not await self.is_building:
+                return True
+            if timeout is not None:
+                remaining = timeout - (time.monotonic() - start)
+                if remaining <= 0:
+                    return False
+                delay = min(delay, remaining)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+
+    async def abort(self):
+        """Aborts this build before it completes"""
+        await self._api.post(self._api.url + "stop")
+
+    async def kill(self):
+        """Performs hard kill on this build"""
+        await self._api.post(self._api.url + "kill")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
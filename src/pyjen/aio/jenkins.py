@@ -0,0 +1,236 @@
+"""Asynchronous primitives for interacting with the main Jenkins dashboard"""
+import logging
+from base64 import b64encode
+import aiohttp
+from pyjen.node import SNAPSHOT_FIELDS
+from pyjen.aio.jenkins_api import AsyncJenkinsAPI, AsyncServerContext, \
+    DEFAULT_MAX_CONNECTIONS
+from pyjen.aio.job import Job, JOB_FIELDS
+from pyjen.aio.view import View
+from pyjen.aio.node import Node
+from pyjen.aio.queue import Queue
+from pyjen.aio.projection import async_json_property, property_data
+from pyjen.utils.helpers import node_url
+
+_VIEW_FIELDS = "[name,url]"
+
+
+class Jenkins:
+    """Python wrapper managing the Jenkins primary dashboard, for use with
+    asyncio
+
+    Asynchronous counterpart of :class:`pyjen.jenkins.Jenkins`. Properties
+    which load data from the server return awaitable objects, and methods
+    which communicate with the server are coroutines. All the objects created
+    from one instance of this class share a pool of connections to the
+    server, so any number of operations may be run concurrently without
+    overwhelming it.
+
+    Example:
+    ::
+
+        async with Jenkins.basic_auth(url, ("user", "token")) as jenkins:
+            jobs = await jenkins.jobs
+            results = await asyncio.gather(
+                *(cur_job.start_build() for cur_job in jobs))
+    """
+
+    def __init__(self, url, context):
+        """
+        Args:
+            url (str):
+                URL of the Jenkins service to connect to
+            context (AsyncServerContext):
+                pre-configured connection state to use for communicating with
+                the Jenkins REST API. Typically built using one of the factory
+                methods associated with this class such as
+                :py:meth:`basic_auth`.
+        """
+        super().__init__()
+        self._log = logging.getLogger(__name__)
+        self._api = AsyncJenkinsAPI(url, context)
+        self._context = context
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @classmethod
+    def basic_auth(cls, url, credentials=None, ssl_cert=None,
+                   max_connections=DEFAULT_MAX_CONNECTIONS):
+        """Factory method used to instantiate a connection to a Jenkins server
+        using HTTP basic auth protocol
+
+        Args:
+            url (str):
+                Full HTTP URL to the main Jenkins dashboard
+            credentials (tuple):
+                Optional 2-tuple containing the username and password / api
+                key to authenticate with. If not provided, anonymous access
+                will be assumed
+            ssl_cert:
+                Maybe be a boolean indicating whether SSL verification is
+                enabled or disabled, or may be a path to a certificate
+                authority bundle.
+            max_connections (int):
+                maximum number of concurrent connections to the server
+
+        Returns:
+            Jenkins:
+                instance of this class, preconfigured to connect to the
+                specified Jenkins service using an HTTP basic auth connection
+        """
+        headers = None
+        if credentials:
+            token = b64encode(
+                f"{credentials[0]}:{credentials[1]}".encode("utf-8"))
+            headers = {"Authorization": "Basic " + token.decode("ascii")}
+        context = AsyncServerContext(headers, ssl_cert, max_connections)
+        return cls(url, context)
+
+    async def close(self):
+        """Closes all connections to the server
+
+        Must be called once this object and all the objects created from it
+        are no longer needed, unless this object is used as an asynchronous
+        context manager.
+        """
+        await self._context.close()
+
+    @property
+    def connected(self):
+        """bool: True if API still connected to the service, False if not"""
+        return self._check_connection()
+
+    async def _check_connection(self):
+        """Checks whether the API is still connected to the service
+
+        Returns:
+            bool:
+                True if API still connected to the service, False if not
+        """
+        try:
+            if await self._api.jenkins_headers():
+                return True
+            return False
+        except aiohttp.ClientError as err:
+            self._log.error("Jenkins connection failed: %s.", err)
+            return False
+
+    @property
+    def version(self):
+        """tuple: version of Jenkins service, parsed into a tuple of integers"""
+        return self._api.jenkins_version()
+
+    @async_json_property("quietingDown")
+    async def is_shutting_down(self):
+        """bool: True if the Jenkins master is scheduled for a shutdown, False
+        if not"""
+        data = await property_data(self, "is_shutting_down")
+        return data['quietingDown']
+
+    @async_json_property("jobs[" + ",".join(JOB_FIELDS) + "]")
+    async def jobs(self):
+        """list (Job): all jobs managed by this Jenkins instance"""
+        data = await property_data(self, "jobs")
+        return [Job.from_json(j, self._api) for j in data['jobs']]
+
+    @async_json_property("views" + _VIEW_FIELDS)
+    async def views(self):
+        """list (View): all views directly managed by this Jenkins instance"""
+        data = await property_data(self, "views")
+        return [View.from_json(v, self._api) for v in data['views']]
+
+    @async_json_property("primaryView" + _VIEW_FIELDS)
+    async def default_view(self):
+        """View: the primary / default Jenkins view"""
+        data = await property_data(self, "default_view")
+        return View.from_json(data['primaryView'], self._api)
+
+    @property
+    def nodes(self):
+        """list (Node): list of build agents
+
+        The names and states of all build agents are loaded with a single
+        request.
+        """
+        return self._get_nodes()
+
+    async def _get_nodes(self):
+        """Loads the build agents managed by this Jenkins instance
+
+        Returns:
+            list (Node):
+                objects for every build agent, pre-loaded with the state of
+                the agent
+        """
+        data = await self._api.get_api_data(
+            target_url=self._api.url + "computer/",
+            fields=["computer[" + ",".join(SNAPSHOT_FIELDS) + "]"])
+        retval = []
+        for cur_node in data['computer']:
+            node_api = self._api.clone(
+                node_url(self._api.url, cur_node['displayName']))
+            node_api.seed(cur_node)
+            retval.append(Node(node_api))
+        return retval
+
+    async def find_job(self, job_name):
+        """Searches all jobs managed by this Jenkins instance for a specific job
+
+        Args:
+            job_name (str): the name of the job to search for
+
+        Returns:
+            Job:
+                If a job with the specified name can be found, and object to
+                manage the job will be returned, otherwise None
+        """
+        for cur_job in await self.jobs:
+            if await cur_job.name == job_name:
+                return cur_job
+        return None
+
+    async def find_view(self, view_name):
+        """Searches views for a specific one
+
+        Args:
+            view_name (str): the name of the view to search for
+
+        Returns:
+            View:
+                If a view with the specified name can be found, an object to
+                manage the view will be returned, otherwise returns None
+        """
+        for cur_view in await self.views:
+            if await cur_view.name == view_name:
+                return cur_view
+        return None
+
+    async def find_node(self, nodename):
+        """Locates a Jenkins build agent with the given name
+
+        Args:
+            nodename (str): name of node to locate
+
+        Returns:
+            Node:
+                reference to Jenkins object that manages this node's
+                information, or None if no node with the given name can be
+                found
+        """
+        for cur_node in await self.nodes:
+            if await cur_node.name == nodename:
+                return cur_node
+        return None
+
+    @property
+    def build_queue(self):
+        """Queue: interface for managing the Jenkins build queue"""
+        return Queue(self._api.clone(self._api.url + 'queue'))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
@@ -0,0 +1,395 @@
+"""Asynchronous abstraction around the raw Jenkins REST API"""
+import asyncio
+import json
+import logging
+import ssl
+from copy import deepcopy
+from urllib.parse import urljoin
+from requests.exceptions import InvalidHeader
+from pyjen.utils.api_state import ServerState, SeedData
+from pyjen.utils.projection import tree_query
+
+try:
+    import aiohttp
+except ImportError as _err:  # pragma: no cover
+    raise ImportError("The pyjen.aio package requires the aiohttp package. "
+                      "Install it using 'pip install pyjen[aio]'.") from _err
+
+#: int: default maximum number of concurrent connections to a Jenkins server
+DEFAULT_MAX_CONNECTIONS = 100
+
+
+class AsyncServerContext(ServerState):
+    """Connection state shared by all asynchronous REST API objects for one
+    Jenkins server
+
+    Holds the HTTP client session, whose connection pool limits the number
+    of requests made to the server at once, along with server-wide metadata
+    like the CSRF crumb, which is loaded only once no matter how many
+    requests need it concurrently.
+    """
+
+    def __init__(self, headers=None, ssl_cert=None,
+                 max_connections=DEFAULT_MAX_CONNECTIONS):
+        """
+        Args:
+            headers (dict):
+                optional HTTP headers to send with every request, like the
+                credentials to authenticate with
+            ssl_cert:
+                optional boolean indicating whether SSL verification is
+                enabled, or path to a certificate authority bundle
+            max_connections (int):
+                maximum number of concurrent connections to the server.
+                Requests made while all connections are in use wait for one
+                to become available.
+        """
+        super().__init__()
+        self._headers = headers
+        self._ssl_cert = ssl_cert
+        self._max_connections = max_connections
+        self._session = None
+        self._jenkins_headers_cache = None
+        # Serializes the loading of the cached server metadata, so concurrent
+        # requests needing it share a single query. Created on first use, so
+        # it is bound to the event loop the context is used from.
+        self._lock = None
+
+    @property
+    def session(self):
+        """aiohttp.ClientSession: HTTP session shared by all API objects
+
+        Created on first use, since it must be created from within a running
+        event loop.
+        """
+        if self._session is None:
+            if isinstance(self._ssl_cert, str):
+                ssl_context = ssl.create_default_context(cafile=self._ssl_cert)
+            elif self._ssl_cert is False:
+                ssl_context = False
+            else:
+                ssl_context = None
+            connector = aiohttp.TCPConnector(
+                limit=self._max_connections, ssl=ssl_context)
+            self._session = aiohttp.ClientSession(
+                connector=connector, headers=self._headers)
+        return self._session
+
+    @property
+    def lock(self):
+        """asyncio.Lock: lock guarding the cached server metadata
+
+        Created on first use, since it must be created from within a running
+        event loop.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def close(self):
+        """Closes all connections to the server"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def get_headers(self, root_url):
+        """Loads the HTTP headers from the main Jenkins dashboard
+
+        Args:
+            root_url (str):
+                URL of the main Jenkins dashboard
+
+        Returns:
+            dict:
+                HTTP headers returned by the dashboard
+        """
+        async with self.lock:
+            if self._jenkins_headers_cache is None:
+                async with self.session.get(
+                        urljoin(root_url, "api/python")) as req:
+                    req.raise_for_status()
+                    self._jenkins_headers_cache = req.headers
+        return self._jenkins_headers_cache
+
+    async def get_crumb(self, root_url):
+        """Loads the CSRF crumb used to authorize POST operations
+
+        Args:
+            root_url (str):
+                URL of the main Jenkins dashboard
+
+        Returns:
+            dict:
+                HTTP header containing the crumb, or an empty string if CSRF
+                protection has been disabled on the server
+        """
+        async with self.lock:
+            if self.crumbs.value is None:
+                async with self.session.get(self.crumbs.url(root_url)) as req:
+                    data = None
+                    if req.status != 404:
+                        req.raise_for_status()
+                        data = await req.json(content_type=None)
+                    self.crumbs.store(req.status, data)
+        return self.crumbs.value
+
+    def invalidate_crumb(self, crumb):
+        """Discards the cached crumb so it gets reloaded on next use
+
+        Args:
+            crumb (dict):
+                the crumb that was rejected by the server. See
+                :py:meth:`~pyjen.utils.api_state.CrumbCache.invalidate`.
+        """
+        self.crumbs.invalidate(crumb)
+
+
+class AsyncJenkinsAPI:
+    """Asynchronous abstraction around the raw Jenkins REST API
+
+    Counterpart of :class:`~pyjen.utils.jenkins_api.JenkinsAPI` for use
+    with asyncio. All methods which communicate with the server are
+    coroutines. Errors reported by the server are raised as
+    :class:`aiohttp.ClientResponseError` exceptions.
+    """
+
+    def __init__(self, url, context):
+        """
+        Args:
+            url (str):
+                URL of the Jenkins API endpoint to manage
+            context (AsyncServerContext):
+                connection state shared with other API objects connected to
+                the same server
+        """
+        self._log = logging.getLogger(__name__)
+        self._context = context
+        self._url = url.rstrip("/\\") + "/"
+        self._jenkins_root_url = self._url
+
+        # JSON data for this endpoint that was loaded ahead of time. See the
+        # seed() method.
+        self._seed = SeedData(context)
+
+    def __str__(self):
+        return self.url
+
+    def __repr__(self):
+        return f"({type(self)}: {self.url})"
+
+    def clone(self, api_url):
+        """Creates a copy of this instance, for a new endpoint URL
+
+        Args:
+            api_url (str):
+                URL for the new REST API endpoint to be managed
+
+        Returns:
+            AsyncJenkinsAPI:
+                reference to the newly created API interface
+        """
+        retval = AsyncJenkinsAPI(api_url, self._context)
+        retval._jenkins_root_url = self._jenkins_root_url  # pylint: disable=protected-access
+        return retval
+
+    @property
+    def url(self):
+        """str: the URL for the REST API endpoint managed by this object
+
+        NOTE: The URL returned by this property is guaranteed to end with a
+        trailing slash character
+        """
+        return self._url
+
+    @property
+    def root_url(self):
+        """str: URL of the main Jenkins dashboard associated with the current
+        object
+
+        NOTE: The URL returned by this property is guaranteed to end with a
+        trailing slash character
+        """
+        return self._jenkins_root_url
+
+    def seed(self, data, fields=None):
+        """Provides JSON data for this endpoint loaded ahead of time
+
+        Seeded data is used to satisfy requests for specific fields without
+        contacting the server, following the same rules as
+        :py:meth:`pyjen.utils.jenkins_api.JenkinsAPI.seed`. In particular,
+        seeded data is ignored once any change has been made to the server
+        through an API object sharing the same context.
+
+        Args:
+            data (dict):
+                JSON data describing this endpoint. Merged with any data
+                seeded previously.
+            fields (list):
+                optional list of tree expressions used to load the data
+        """
+        self._seed.update(data, fields)
+
+    def invalidate(self):
+        """Discards any data seeded into this object"""
+        self._seed.clear()
+
+    async def jenkins_headers(self):
+        """Gets the HTTP headers from the main Jenkins dashboard
+
+        Returns:
+            dict:
+                HTTP headers describing the Jenkins instance hosting the
+                REST API, including details such as the version number
+        """
+        return await self._context.get_headers(self.root_url)
+
+    async def jenkins_version(self):
+        """Gets the version number of the Jenkins server hosting this REST API
+
+        Returns:
+            tuple:
+                version number parsed into a tuple of integers, typically
+                containing the major, minor and update digits
+
+        Raises:
+            requests.exceptions.InvalidHeader:
+                if the server does not report its version number
+        """
+        headers = await self.jenkins_headers()
+        if 'x-jenkins' not in headers:
+            raise InvalidHeader("Jenkins header has no x-jenkins metadata "
+                                "attached to it. Can not load version info.")
+        return tuple(int(i) for i in headers['x-jenkins'].split("."))
+
+    async def get_api_data(self, target_url=None, query_params=None,
+                           fields=None):
+        """retrieves the Jenkins API specific data from the specified URL
+
+        Args:
+            target_url (str):
+                Full URL to the REST API endpoint to be queried. If not
+                provided, data will be loaded from the default 'url' for this
+                object
+            query_params (str):
+                optional set of query parameters to customize the returned data
+            fields (list):
+                optional list of JSON field names or tree expressions the
+                caller needs. Only those fields are loaded from the server,
+                using a "tree" query, and requests for the default 'url' of
+                this object may be satisfied by seeded data. Ignored when
+                query parameters are provided.
+
+        Returns:
+            dict:
+                The set of Jenkins attributes, converted to Python objects,
+                associated with the given URL.
+        """
+        if fields and query_params is None:
+            if target_url is None and self._seed.covers(fields):
+                return deepcopy(self._seed.data)
+            query_params = tree_query(fields)
+
+        temp_url = urljoin(target_url or self.url, "api/json")
+        if query_params is not None:
+            temp_url += "?" + query_params
+
+        async with self._context.session.get(temp_url) as req:
+            req.raise_for_status()
+            retval = await req.json(content_type=None)
+        self._log.debug(json.dumps(retval, indent=4))
+        return retval
+
+    async def get_text(self, path=None, params=None):
+        """ gets the raw text data from a Jenkins URL
+
+        Args:
+            path (str):
+                optional extension path to append to the root URL managed by
+                this object when performing the get operation
+            params (dict):
+                optional query parameters to be passed to the request
+
+        Returns:
+            str:
+                the text loaded from this objects' URL
+        """
+        temp_url = self.url
+        if path is not None:
+            temp_url = urljoin(temp_url, path.lstrip("/\\"))
+
+        async with self._context.session.get(temp_url, params=params) as req:
+            req.raise_for_status()
+            return await req.text()
+
+    async def post(self, target_url, args=None):
+        """sends data to or triggers an operation via a Jenkins URL
+
+        Args:
+            target_url (str):
+                Full URL to sent post request to
+            args (dict):
+                optional set of data arguments to be sent with the post
+                operation, like "params" or "headers"
+
+        Returns:
+            aiohttp.ClientResponse:
+                reference to the response returned by the post request, whose
+                content has been read
+
+        NOTE: Data seeded into this object is discarded by this operation, and
+        data seeded into any other object sharing the same context is no
+        longer used. See :py:meth:`invalidate`.
+        """
+        args = dict(args or {})
+        headers = dict(args.pop("headers", {}))
+
+        crumb = None
+        if await self.jenkins_version() >= (2, 0, 0):
+            crumb = await self._context.get_crumb(self.root_url)
+        if crumb:
+            headers.update(crumb)
+
+        req = await self._post(target_url, headers, args)
+
+        # Crumbs are bound to the web session they were issued for, so they
+        # may expire while we still hold a cached copy. When that happens we
+        # request a new crumb and try again, once.
+        if self._context.crumbs.is_rejected(crumb, req.status):
+            self._log.debug("POST to %s rejected. Refreshing crumb.",
+                            target_url)
+            self._context.invalidate_crumb(crumb)
+            self._context.crumbs.replace(
+                headers, crumb, await self._context.get_crumb(self.root_url))
+            req = await self._post(target_url, headers, args)
+
+        # Any operation may change the state of the server so we can no
+        # longer trust any data we have seeded for this or any other object
+        self.invalidate()
+        self._context.modified()
+
+        req.raise_for_status()
+        return req
+
+    async def _post(self, target_url, headers, args):
+        """Sends a single POST request
+
+        Args:
+            target_url (str):
+                Full URL to sent post request to
+            headers (dict):
+                HTTP headers to send with the request
+            args (dict):
+                additional arguments to pass to the HTTP client
+
+        Returns:
+            aiohttp.ClientResponse:
+                the response to the request, whose content has been read
+        """
+        async with self._context.session.post(
+                target_url, headers=headers, **args) as req:
+            await req.read()
+        return req
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
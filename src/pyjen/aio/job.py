@@ -0,0 +1,176 @@
+"""Asynchronous primitives for interacting with Jenkins jobs"""
+from pyjen.aio.build import Build
+from pyjen.aio.queue_item import QueueItem
+from pyjen.aio.projection import async_json_property, property_data
+
+#: list (str): JSON fields describing each job in a list of jobs, which are
+#: seeded into the objects for the jobs
+JOB_FIELDS = ["name", "url", "color"]
+
+
+class Job:
+    """Abstraction for operations common to all job types on Jenkins
+
+    Asynchronous counterpart of :class:`pyjen.job.Job`. Operations specific
+    to the different types of jobs provided by plugins are not supported.
+    """
+
+    def __init__(self, api):
+        """
+        Args:
+            api (AsyncJenkinsAPI):
+                Pre-initialized connection to the Jenkins REST API
+        """
+        super().__init__()
+        self._api = api
+
+    def __repr__(self):
+        return self._api.url
+
+    def __eq__(self, other):
+        if not isinstance(other, type(self)):
+            return False
+        return other._api.url == self._api.url  # pylint: disable=protected-access
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._api.url)
+
+    @staticmethod
+    def from_json(json_data, rest_api):
+        """Creates a job from the JSON data describing it in a list of jobs
+
+        Args:
+            json_data (dict):
+                data describing the job, containing at least its URL
+            rest_api (AsyncJenkinsAPI):
+                connection to the Jenkins REST API
+
+        Returns:
+            Job:
+                object managing the job, seeded with the given data
+        """
+        retval = Job(rest_api.clone(json_data["url"]))
+        retval._api.seed(json_data)  # pylint: disable=protected-access
+        return retval
+
+    def invalidate(self):
+        """Discards any cached data for this job, so it gets reloaded from
+        the Jenkins server the next time it is accessed
+        """
+        self._api.invalidate()
+
+    @async_json_property("name")
+    async def name(self):
+        """str: the name of the job"""
+        data = await property_data(self, "name")
+        return data['name']
+
+    @async_json_property("color")
+    async def is_disabled(self):
+        """bool: True if the job is disabled, False if not"""
+        data = await property_data(self, "is_disabled")
+        return data['color'] == "disabled"
+
+    @async_json_property("color")
+    async def has_been_built(self):
+        """bool: True if the job has been built at least once, False if not"""
+        data = await property_data(self, "has_been_built")
+        return data['color'] != "notbuilt"
+
+    @async_json_property("lastBuild[url]")
+    async def last_build(self):
+        """Build: the most recent build of this job, or None if the job has
+        never been built"""
+        data = await property_data(self, "last_build")
+        return self._build_from_json(data['lastBuild'])
+
+    @async_json_property("lastSuccessfulBuild[url]")
+    async def last_good_build(self):
+        """Build: the most recent successful build of this job, or None if
+        no successful build exists"""
+        data = await property_data(self, "last_good_build")
+        return self._build_from_json(data['lastSuccessfulBuild'])
+
+    @async_json_property("lastFailedBuild[url]")
+    async def last_failed_build(self):
+        """Build: the most recent failed build of this job, or None if no
+        failed build exists"""
+        data = await property_data(self, "last_failed_build")
+        return self._build_from_json(data['lastFailedBuild'])
+
+    def _build_from_json(self, bld):
+        """Creates a build from the JSON data describing it
+
+        Args:
+            bld (dict):
+                data containing the URL of the build, or None
+
+        Returns:
+            Build:
+                object managing the build, or None if no data was provided
+        """
+        if bld is None:
+            return None
+        return Build(self._api.clone(bld['url']))
+
+    def get_build_by_number(self, build_number):
+        """Gets a specific build of this job from the build history
+
+        Unlike its synchronous counterpart this method does not contact the
+        server, so the returned build may not exist.
+
+        Args:
+            build_number (int):
+                Numeric identifier of the build to retrieve
+
+        Returns:
+            Build:
+                object managing the build
+        """
+        return Build(self._api.clone(self._api.url + str(build_number)))
+
+    @property
+    def config_xml(self):
+        """str: raw XML configuration for this job"""
+        return self._api.get_text("/config.xml")
+
+    async def disable(self):
+        """Disables this job to prevent new builds from being executed"""
+        await self._api.post(self._api.url + "disable")
+
+    async def enable(self):
+        """Enables this job"""
+        await self._api.post(self._api.url + "enable")
+
+    async def delete(self):
+        """Deletes this job from the Jenkins dashboard"""
+        await self._api.post(self._api.url + "doDelete")
+
+    async def start_build(self, **kwargs):
+        """Forces a build of this job
+
+        Args:
+            kwargs (dict):
+                0 or more named arguments to pass as build parameters to the
+                job when triggering the build.
+
+        Returns:
+            QueueItem:
+                Reference to the Jenkins queue item that tracks the progress
+                of the triggered build prior to the build actually running.
+        """
+        if not kwargs.keys():
+            res = await self._api.post(self._api.url + "build")
+        else:
+            params = {"params": kwargs}
+            res = await self._api.post(
+                self._api.url + "buildWithParameters", params)
+
+        return QueueItem(self._api.clone(res.headers["Location"]))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
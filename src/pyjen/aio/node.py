@@ -0,0 +1,106 @@
+"""Asynchronous declarations for the abstraction of a Jenkins build agent"""
+import asyncio
+import time
+from urllib.parse import quote
+from pyjen.aio.projection import async_json_property, property_data
+
+
+class Node:
+    """Wrapper around a Jenkins build agent (aka: Node) configuration
+
+    Asynchronous counterpart of :class:`pyjen.node.Node`
+    """
+
+    def __init__(self, api):
+        """
+        Args:
+            api (AsyncJenkinsAPI):
+                Pre-initialized connection to the Jenkins REST API
+        """
+        super().__init__()
+        self._api = api
+
+    def __repr__(self):
+        return self._api.url
+
+    def invalidate(self):
+        """Discards any cached data for this node, so it gets reloaded from
+        the Jenkins server the next time it is accessed
+        """
+        self._api.invalidate()
+
+    @property
+    def url(self):
+        """str: URL of this node"""
+        return self._api.url
+
+    @async_json_property("displayName")
+    async def name(self):
+        """str: the display name of this Node"""
+        data = await property_data(self, "name")
+        return data['displayName']
+
+    @async_json_property("offline")
+    async def is_offline(self):
+        """bool: checks to see whether this Node is currently offline or not"""
+        data = await property_data(self, "is_offline")
+        return data['offline']
+
+    @async_json_property("idle")
+    async def is_idle(self):
+        """bool: checks to see whether any executors are in use on this Node
+        or not"""
+        data = await property_data(self, "is_idle")
+        return data['idle']
+
+    @async_json_property("numExecutors")
+    async def number_of_executors(self):
+        """int: the number of executors this node provides"""
+        data = await property_data(self, "number_of_executors")
+        return data['numExecutors']
+
+    async def toggle_offline(self, message=None):
+        """Toggles the online status of this Node
+
+        Args:
+            message (str):
+                optional descriptive message explaining the reason this node has
+                been taken offline.
+        """
+        post_cmd = self._api.url + "toggleOffline"
+        if message is not None:
+            post_cmd += "?offlineMessage=" + quote(message)
+
+        await self._api.post(post_cmd)
+
+    async def wait_for_idle(self, max_timeout=None, poll_interval=1):
+        """Waits until this Node enters an idle state
+
+        Args:
+            max_timeout (float):
+                Optional amount of time, in seconds, to wait for an idle
+                state. If this value is undefined, this method will wait
+                indefinitely.
+            poll_interval (float):
+                number of seconds to wait between checks of the node
+
+        Returns:
+            bool:
+                True if the Node has entered idle state before returning
+                otherwise returns False
+        """
+        start = time.monotonic()
+        idle = await self.is_idle
+        while not idle:
+            if max_timeout is not None and \
+                    time.monotonic() - start >= max_timeout:
+                break
+            await asyncio.sleep(poll_interval)
+            self.invalidate()
+            idle = await self.is_idle
+
+        return idle
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
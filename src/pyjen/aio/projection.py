@@ -0,0 +1,72 @@
+"""Awaitable counterparts of the primitives in :mod:`pyjen.utils.projection`
+"""
+from pyjen.utils.projection import JSONProperty, property_fields
+
+
+class AsyncJSONProperty(JSONProperty):
+    """Property computed from a subset of an objects' REST API data, loaded
+    asynchronously
+
+    The getter is a coroutine function, so reading the property returns a
+    coroutine which loads the data for the object and resolves to the value
+    of the property. Setters are not supported, since assignments can not be
+    awaited. See :py:func:`async_json_property` for details.
+    """
+
+
+def async_json_property(*fields):
+    """Decorator declaring an awaitable property derived from an objects'
+    REST API data
+
+    Example:
+    ::
+
+        @async_json_property("name")
+        async def name(self):
+            data = await property_data(self, "name")
+            return data["name"]
+
+        ...
+        print(await job.name)
+
+    See :py:func:`pyjen.utils.projection.json_property` for details.
+
+    Args:
+        fields (str):
+            1 or more JSON field names or tree expressions the property
+            depends on, like "name" or "lastBuild[url]"
+
+    Returns:
+        type:
+            :class:`AsyncJSONProperty` class to be used as a decorator
+    """
+    class _AsyncJSONProperty(AsyncJSONProperty):
+        """AsyncJSONProperty bound to a specific set of fields"""
+    _AsyncJSONProperty.fields = fields
+    return _AsyncJSONProperty
+
+
+async def property_data(obj, name):
+    """Loads the REST API data a property of an object depends on
+
+    Awaitable counterpart of :py:func:`pyjen.utils.projection.property_data`.
+    The object must store its :class:`~.jenkins_api.AsyncJenkinsAPI` in a
+    member named '_api'.
+
+    Args:
+        obj:
+            object declaring the property
+        name (str):
+            name of the property
+
+    Returns:
+        dict:
+            JSON data for the object, containing at least the fields the
+            property depends on
+    """
+    fields = property_fields(type(obj), name)
+    return await obj._api.get_api_data(fields=fields)  # pylint: disable=protected-access
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
@@ -0,0 +1,39 @@
+"""Asynchronous abstraction around the Jenkins build queue"""
+from pyjen.aio.queue_item import QueueItem
+
+
+class Queue:
+    """Abstraction around the Jenkins build queue
+
+    Asynchronous counterpart of :class:`pyjen.queue.Queue`
+    """
+
+    def __init__(self, api):
+        """
+        Args:
+            api (AsyncJenkinsAPI):
+                Pre-initialized connection to the Jenkins REST API
+        """
+        super().__init__()
+        self._api = api
+
+    @property
+    def items(self):
+        """list (QueueItem): list of scheduled builds waiting in the queue"""
+        return self._get_items()
+
+    async def _get_items(self):
+        """Loads the scheduled builds waiting in the queue
+
+        Returns:
+            list (QueueItem):
+                the queued builds
+        """
+        self._api.invalidate()
+        data = await self._api.get_api_data(fields=["items[url]"])
+        return [QueueItem(self._api.clone(self._api.root_url + cur["url"]))
+                for cur in data["items"]]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
@@ -0,0 +1,120 @@
+"""Asynchronous abstraction around a Jenkins build queue item"""
+import aiohttp
+from pyjen.aio.build import Build
+
+
+class QueueItem:
+    """Abstraction around a Jenkins build queue item
+
+    Asynchronous counterpart of :class:`pyjen.queue_item.QueueItem`
+    """
+
+    def __init__(self, api):
+        """
+        Args:
+            api (AsyncJenkinsAPI):
+                Pre-initialized connection to the Jenkins REST API
+        """
+        super().__init__()
+        self._api = api
+
+    def __repr__(self):
+        return self._api.url
+
+    def __eq__(self, other):
+        if not isinstance(other, QueueItem):
+            return False
+        return self._api.url == other._api.url  # pylint: disable=protected-access
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._api.url)
+
+    async def _get_data(self, fields):
+        """Loads API data describing the current state of the queued build
+
+        Args:
+            fields (list):
+                JSON fields to load
+
+        Returns:
+            dict:
+                the requested data, or an empty dictionary if the object is no
+                longer backed by a valid REST API endpoint
+        """
+        self._api.invalidate()
+        try:
+            return await self._api.get_api_data(fields=fields)
+        except aiohttp.ClientResponseError as err:
+            if err.status == 404:
+                return {}
+            raise
+
+    @property
+    def uid(self):
+        """int: numeric identifier of this queued build
+
+        Warning:
+            May return None if this queue item has been invalidated by Jenkins
+        """
+        return self._get_field("id")
+
+    @property
+    def cancelled(self):
+        """bool: Has this queued build been cancelled?
+
+        Warning:
+            May return None if this queue item has been invalidated by Jenkins
+        """
+        return self._get_field("cancelled")
+
+    async def _get_field(self, name):
+        """Loads a single field describing the queued build
+
+        Args:
+            name (str):
+                name of the JSON field to load
+
+        Returns:
+            value of the field, or None if the queue item no longer exists
+        """
+        data = await self._get_data([name])
+        return data.get(name)
+
+    @property
+    def build(self):
+        """Build: Once this scheduled build leaves the queue, this property
+        returns a reference to the running build. While the item is still
+        queued, this property returns None.
+        """
+        return self._get_build()
+
+    async def _get_build(self):
+        """Loads the build started for this queue item
+
+        Returns:
+            Build:
+                the build, or None if the item is still queued
+        """
+        data = await self._get_data(["executable[url]"])
+        exe_info = data.get("executable")
+        if exe_info is None:
+            return None
+        return Build(self._api.clone(exe_info["url"]))
+
+    async def cancel(self):
+        """Cancels this queued build"""
+        tmp_url = self._api.root_url + "queue/cancelItem"
+        params = {
+            # Have to send a referrer in the header to circumvent this bug:
+            # https://issues.jenkins-ci.org/browse/JENKINS-21311
+            "headers": {'Referer': self._api.root_url},
+            "params": {"id": await self.uid},
+        }
+        await self._api.post(tmp_url, params)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
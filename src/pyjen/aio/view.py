@@ -0,0 +1,93 @@
+"""Asynchronous primitives for interacting with Jenkins views"""
+import asyncio
+from pyjen.aio.job import Job, JOB_FIELDS
+from pyjen.aio.projection import async_json_property, property_data
+from pyjen.utils.helpers import view_url
+
+
+class View:
+    """generic Jenkins views providing a list of jobs
+
+    Asynchronous counterpart of :class:`pyjen.view.View`. Operations specific
+    to the different types of views provided by plugins are not supported.
+    """
+
+    def __init__(self, api):
+        """
+        Args:
+            api (AsyncJenkinsAPI):
+                Pre-initialized connection to the Jenkins REST API
+        """
+        super().__init__()
+        self._api = api
+
+    def __repr__(self):
+        return self._api.url
+
+    def __eq__(self, other):
+        if not isinstance(other, type(self)):
+            return False
+        return other._api.url == self._api.url  # pylint: disable=protected-access
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._api.url)
+
+    @staticmethod
+    def from_json(json_data, rest_api):
+        """Creates a view from the JSON data describing it in a list of views
+
+        Args:
+            json_data (dict):
+                data describing the view, containing at least its name and
+                URL
+            rest_api (AsyncJenkinsAPI):
+                connection to the Jenkins REST API
+
+        Returns:
+            View:
+                object managing the view, seeded with the given data
+        """
+        retval = View(rest_api.clone(view_url(json_data)))
+        retval._api.seed(json_data)  # pylint: disable=protected-access
+        return retval
+
+    def invalidate(self):
+        """Discards any cached data for this view, so it gets reloaded from
+        the Jenkins server the next time it is accessed
+        """
+        self._api.invalidate()
+
+    @async_json_property("name")
+    async def name(self):
+        """str: the name of the view"""
+        data = await property_data(self, "name")
+        return data['name']
+
+    @async_json_property("jobs[" + ",".join(JOB_FIELDS) + "]")
+    async def jobs(self):
+        """list (Job): list of 0 or more jobs associated with this view"""
+        data = await property_data(self, "jobs")
+        return [Job.from_json(j, self._api) for j in data['jobs']]
+
+    async def delete(self):
+        """Deletes this view from the dashboard"""
+        await self._api.post(self._api.url + "doDelete")
+
+    async def delete_all_jobs(self):
+        """Deletes all jobs contained within this view, concurrently"""
+        await asyncio.gather(*(j.delete() for j in await self.jobs))
+
+    async def disable_all_jobs(self):
+        """Disables all jobs contained within this view, concurrently"""
+        await asyncio.gather(*(j.disable() for j in await self.jobs))
+
+    async def enable_all_jobs(self):
+        """Enables all jobs contained within this view, concurrently"""
+        await asyncio.gather(*(j.enable() for j in await self.jobs))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
@@ -1,8 +1,21 @@
 """Primitives for interacting with Jenkins builds"""
+import codecs
 from datetime import datetime
 import logging
+import time
+from collections import Counter
+from concurrent.futures import wait, TimeoutError as FutureTimeoutError
 from urllib.parse import urljoin
 from pyjen.changeset import Changeset
+from pyjen.utils.projection import json_property, property_data, \
+    resolve_fields
+from pyjen.utils.artifacts import ArtifactDownloader, DEFAULT_WORKERS, \
+    DEFAULT_ZIP_THRESHOLD
+from pyjen.utils.build_waiter import BuildWaiter, DEFAULT_POLL_INTERVAL, \
+    DEFAULT_MAX_POLL_INTERVAL
+
+# Scheduler shared by all builds being waited on
+_WAITER = BuildWaiter()
 
 
 class Build:
@@ -16,6 +29,8 @@ class Build:
         """
         super().__init__()
         self._api = api
+        # Finished builds never change, except for their descriptions
+        self._api.persist_finished(volatile_fields=("description",))
         self._log = logging.getLogger(__name__)
 
     def __eq__(self, obj):
@@ -39,33 +54,54 @@ class Build:
     def __hash__(self):
         return hash(self.uid)
 
+    def invalidate(self):
+        """Discards any cached data for this build, so it gets reloaded from
+        the Jenkins server the next time it is accessed
+        """
+        self._api.invalidate()
+
+    def refresh(self):
+        """Discards any cached data for this build and reloads it from the
+        Jenkins server
+        """
+        self.invalidate()
+        self._api.get_api_data()
+
+    def fetch(self, fields):
+        """Loads the data for several properties of this build at once
+
+        See :py:meth:`~.job.Job.fetch` for details.
+
+        Args:
+            fields (list):
+                names of properties of this object to load. Raw JSON field
+                names or tree expressions may be provided as well.
+        """
+        self._api.fetch(resolve_fields(type(self), fields))
+
     @property
     def url(self):
         """str: URL of this build"""
         return self._api.url
 
-    @property
+    @json_property("number")
     def number(self):
         """int: sequentially assigned numeric ID for the build"""
-
-        data = self._api.get_api_data()
-
+        data = property_data(self, "number")
         return data['number']
 
-    @property
+    @json_property("timestamp")
     def start_time(self):
         """datetime.datetime: time stamp of when this build was started"""
-
-        data = self._api.get_api_data()
-
+        data = property_data(self, "start_time")
         time_in_seconds = data['timestamp'] * 0.001
 
         return datetime.fromtimestamp(time_in_seconds)
 
-    @property
+    @json_property("building")
     def is_building(self):
         """bool: True if the build is currently executing otherwise False"""
-        data = self._api.get_api_data()
+        data = property_data(self, "is_building")
         return data['building']
 
     @property
@@ -73,7 +109,109 @@ class Build:
         """str: raw console output for this build as plain text"""
         return self._api.get_text("/consoleText")
 
-    @property
+    def iter_console(self, chunk_size=64 * 1024, follow=True, start=0,
+                     poll_interval=1, max_poll_interval=30):
+        """Iterates over the console output for this build, incrementally
+
+        Unlike :py:attr:`console_output`, which loads the entire log into
+        memory at once, the log is streamed from the server in chunks. When
+        following a running build, new output is yielded as it is produced
+        until the build completes. The server is polled for new output less
+        frequently the longer the build remains silent.
+
+        Example:
+        ::
+
+            for text in bld.iter_console():
+                sys.stdout.write(text)
+
+        Args:
+            chunk_size (int):
+                maximum number of bytes of output to load into memory at once
+            follow (bool):
+                if True, keep polling for new output until the build
+                completes, otherwise stop once all the output produced so
+                far has been read
+            start (int):
+                byte offset within the log to start reading from. Used to
+                resume reading a log where a previous read left off, for
+                example by passing the number of bytes of UTF-8 encoded text
+                read previously.
+            poll_interval (float):
+                minimum number of seconds to wait between requests for new
+                output while following a running build
+            max_poll_interval (float):
+                maximum number of seconds to wait between requests for new
+                output while following a running build
+
+        Returns:
+            generator:
+                yields chunks of console output as strings
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        offset = start
+        delay = poll_interval
+        while True:
+            received = 0
+            response = self._api.get_stream(
+                "logText/progressiveText", params={"start": offset})
+            with response:
+                for chunk in response.iter_content(chunk_size):
+                    received += len(chunk)
+                    text = decoder.decode(chunk)
+                    if text:
+                        yield text
+                offset = int(response.headers.get(
+                    "X-Text-Size", offset + received))
+                more_data = response.headers.get("X-More-Data") == "true"
+
+            if not (follow and more_data):
+                break
+            if received:
+                delay = poll_interval
+            else:
+                delay = min(delay * 2, max_poll_interval)
+            time.sleep(delay)
+
+        text = decoder.decode(b"", final=True)
+        if text:
+            yield text
+
+    def wait_until_complete(self, timeout=None,
+                            poll_interval=DEFAULT_POLL_INTERVAL,
+                            max_poll_interval=DEFAULT_MAX_POLL_INTERVAL):
+        """Blocks execution until this build completes
+
+        The build is first checked once it is expected to have completed,
+        based on its estimated duration, and then with exponentially
+        increasing delays. See :py:func:`wait_all` for a way to wait for
+        several builds at once.
+
+        Args:
+            timeout (float):
+                Optional number of seconds to wait for the build to complete.
+                If this value is undefined, this method will block
+                indefinitely.
+            poll_interval (float):
+                minimum number of seconds to wait between checks of the build
+            max_poll_interval (float):
+                maximum number of seconds to wait between checks of the build
+
+        Returns:
+            bool:
+                True if the build has completed before returning, otherwise
+                returns False
+        """
+        future = _WAITER.wait(self._api, poll_interval, max_poll_interval)
+        try:
+            future.result(timeout)
+        except FutureTimeoutError:
+            # The build may have completed while the wait was being cancelled
+            if future.cancel():
+                return False
+        return True
+
+    @json_property("result")
     def result(self):
         """str: state of the associated job upon completion of this build.
         Typically one of the following:
@@ -83,22 +221,22 @@ class Build:
             * "FAILURE"
             * "ABORTED"
         """
-        data = self._api.get_api_data()
+        data = property_data(self, "result")
         return data['result']
 
-    @property
+    @json_property("changeSet[kind,items[msg,commitId,author[absoluteUrl],"
+                   "paths[file]]]")
     def changeset(self):
         """Changeset: Description of 0 or more SCM revisions associated with
         / included in this build"""
-        data = self._api.get_api_data()
-
+        data = property_data(self, "changeset")
         return Changeset(self._api, data['changeSet'])
 
-    @property
+    @json_property("description")
     def description(self):
         """str: Gets the descriptive text associated with this build. May be an
         empty string if no description given."""
-        data = self._api.get_api_data()
+        data = property_data(self, "description")
         retval = data["description"]
         if retval is None:
             return ""
@@ -114,17 +252,17 @@ class Build:
         }
         self._api.post(self.url + '/submitDescription', args=args)
 
-    @property
+    @json_property("id")
     def uid(self):
         """str: internal, unique identifier associated with this build"""
-        data = self._api.get_api_data()
+        data = property_data(self, "uid")
         return data["id"]
 
-    @property
+    @json_property("artifacts[fileName,relativePath]")
     def artifact_urls(self):
         """list (): list of 0 or more URLs to download published build artifacts
         """
-        data = self._api.get_api_data()
+        data = property_data(self, "artifact_urls")
         artifacts_node = data['artifacts']
         retval = []
 
@@ -135,18 +273,59 @@ class Build:
 
         return retval
 
-    @property
+    def download_artifacts(self, dest, pattern=None, workers=DEFAULT_WORKERS,
+                           zip_threshold=DEFAULT_ZIP_THRESHOLD):
+        """Downloads the artifacts published by this build
+
+        Artifacts are streamed to disk in fixed size chunks, several at a
+        time, and are saved in the destination folder using the same relative
+        paths they were archived with. Artifacts which have already been
+        downloaded are skipped, provided they were fingerprinted and the
+        fingerprints match, and partially downloaded artifacts are resumed.
+        Artifacts sharing the same file name can't be told apart by their
+        fingerprints, so they are downloaded without being verified.
+        When all the artifacts of a build with many artifacts are needed,
+        they are downloaded as a single zip archive instead. See
+        :class:`~.utils.artifacts.ArtifactDownloader` for details.
+
+        Args:
+            dest (str):
+                path to the folder to save the artifacts in
+            pattern (str):
+                optional glob-style pattern selecting the artifacts to
+                download by their relative paths, like "*.jar" or
+                "reports/*". All artifacts are downloaded when not provided.
+            workers (int):
+                maximum number of artifacts to download at once
+            zip_threshold (int):
+                minimum number of artifacts for them to be downloaded as a
+                single archive
+
+        Returns:
+            list (str):
+                paths to the local copies of the selected artifacts
+        """
+        data = self._api.get_api_data(
+            fields=["artifacts[relativePath]", "fingerprint[fileName,hash]"])
+        artifacts = _match_fingerprints(
+            [cur["relativePath"] for cur in data["artifacts"]],
+            data.get("fingerprint") or [])
+
+        downloader = ArtifactDownloader(self._api, dest, workers)
+        return downloader.download_all(artifacts, pattern, zip_threshold)
+
+    @json_property("duration")
     def duration(self):
         """int: total runtime of the build, in milliseconds. Returns 0 if
         build hasn't finished"""
-        data = self._api.get_api_data()
+        data = property_data(self, "duration")
         return data['duration']
 
-    @property
+    @json_property("estimatedDuration")
     def estimated_duration(self):
         """int: Estimated runtime for a running build, in milliseconds.
         Estimate is based off average duration of previous builds"""
-        data = self._api.get_api_data()
+        data = property_data(self, "estimated_duration")
         return data['estimatedDuration']
 
     def abort(self):
@@ -158,5 +337,77 @@ class Build:
         self._api.post(self._api.url + "kill")
 
 
+def _match_fingerprints(paths, fingerprints):
+    """Finds the MD5 fingerprint recorded for each artifact of a build
+
+    Fingerprints are usually recorded by file name only, so they can only be
+    matched to artifacts whose file names are unique within the build.
+
+    Args:
+        paths (list):
+            relative paths of the artifacts
+        fingerprints (list):
+            fingerprints recorded for the build, as reported by the REST API
+
+    Returns:
+        list (tuple):
+            the relative path of each artifact and its MD5 fingerprint, or
+            None if the fingerprint is unknown or ambiguous
+    """
+    hashes = {}
+    for cur_print in fingerprints:
+        hashes.setdefault(cur_print["fileName"], set()).add(cur_print["hash"])
+    file_names = Counter(cur.rsplit("/", 1)[-1] for cur in paths)
+
+    retval = []
+    for path in paths:
+        file_name = path.rsplit("/", 1)[-1]
+        matches = hashes.get(path)
+        if matches is None and file_names[file_name] == 1:
+            matches = hashes.get(file_name)
+        md5 = next(iter(matches)) if matches and len(matches) == 1 else None
+        retval.append((path, md5))
+    return retval
+
+
+def wait_all(builds, timeout=None, poll_interval=DEFAULT_POLL_INTERVAL,
+             max_poll_interval=DEFAULT_MAX_POLL_INTERVAL):
+    """Blocks execution until several builds have completed
+
+    The status of all the builds are checked by a single background thread,
+    shared with any other builds being waited on, and the status of all the
+    builds of each job are checked with a single request. See
+    :class:`~.utils.build_waiter.BuildWaiter` for details.
+
+    Args:
+        builds (list):
+            :class:`Build` objects to wait for
+        timeout (float):
+            Optional number of seconds to wait for the builds to complete.
+            If this value is undefined, this method will block indefinitely.
+        poll_interval (float):
+            minimum number of seconds to wait between checks of each build
+        max_poll_interval (float):
+            maximum number of seconds to wait between checks of each build
+
+    Returns:
+        bool:
+            True if all the builds completed before returning, otherwise
+            False
+    """
+    futures = [
+        _WAITER.wait(cur_build._api,  # pylint: disable=protected-access
+                     poll_interval, max_poll_interval)
+        for cur_build in builds
+    ]
+    _, not_done = wait(futures, timeout)
+    # Builds may complete while their waits are being cancelled
+    cancelled = [cur_future for cur_future in not_done if cur_future.cancel()]
+    for cur_future in futures:
+        if not cur_future.cancelled() and cur_future.exception() is not None:
+            raise cur_future.exception()
+    return not cancelled
+
+
 if __name__ == "__main__":  # pragma: no cover
     pass
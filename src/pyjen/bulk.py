@@ -0,0 +1,233 @@
+"""Primitives for running an operation on many Jenkins objects at once
+
+Operations like disabling every job in a view require a separate POST request
+for each job. Rather than sending those requests one after the other,
+:py:func:`apply` sends them concurrently from a bounded pool of threads,
+optionally limiting the rate at which requests are sent to each server:
+
+::
+
+    result = bulk.apply(view.jobs, "disable", workers=8, rate=20)
+    for cur_job, err in result.failed:
+        print(f"Failed to disable {cur_job}: {err}")
+
+A failure to process one object does not prevent the others from being
+processed. Failures are collected and reported once the operation has been
+applied to every object instead.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import methodcaller
+from requests.exceptions import HTTPError
+
+#: int: default number of objects processed concurrently
+DEFAULT_WORKERS = 8
+
+
+class BulkOperationError(HTTPError):
+    """Raised when a bulk operation failed for 1 or more objects
+
+    Derived from :class:`requests.HTTPError`, which was raised by the bulk
+    operations of :class:`~.view.View` before they were run concurrently, so
+    existing error handlers still apply. The response of the first failure
+    is available as the 'response' attribute, when it was an HTTP error.
+
+    Attributes:
+        result (BulkResult):
+            outcome of the bulk operation, including the failures
+    """
+
+    def __init__(self, result):
+        """
+        Args:
+            result (BulkResult):
+                outcome of the bulk operation
+        """
+        first_error = result.failed[0][1]
+        super().__init__(
+            f"Bulk operation failed for {len(result.failed)} of "
+            f"{len(result)} objects. First error: {first_error}",
+            response=getattr(first_error, "response", None))
+        self.result = result
+
+
+class BulkResult:
+    """Outcome of a bulk operation, as returned by :py:func:`apply`"""
+
+    def __init__(self):
+        #: list: 2-tuples containing each object the operation succeeded for
+        #: and the value returned by the operation, in their original order
+        self.succeeded = []
+        #: list: 2-tuples containing each object the operation failed for and
+        #: the exception raised by the operation, in their original order
+        self.failed = []
+
+    def __len__(self):
+        return len(self.succeeded) + len(self.failed)
+
+    def raise_for_errors(self):
+        """Raises an exception if the operation failed for any object
+
+        Raises:
+            BulkOperationError: if the operation failed for any object
+        """
+        if self.failed:
+            raise BulkOperationError(self)
+
+
+class RateLimiter:
+    """Spaces out calls made from any number of threads to a fixed rate"""
+
+    def __init__(self, rate):
+        """
+        Args:
+            rate (float):
+                maximum number of calls per second
+        """
+        self._interval = 1 / rate
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Blocks until the next call is allowed to proceed"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def _server_url(item):
+    """Gets the URL of the server managing a Jenkins object
+
+    Args:
+        item:
+            PyJen object wrapping a REST API endpoint, like a
+            :class:`~.job.Job`
+
+    Returns:
+        str:
+            URL of the main dashboard of the server, or None if it can not be
+            determined
+    """
+    api = getattr(item, "_api", None)
+    return getattr(api, "root_url", None)
+
+
+class _Worker:
+    """Runs a bulk operation on one object at a time, from worker threads"""
+
+    def __init__(self, operation, total, progress):
+        """
+        Args:
+            operation (callable):
+                function to call with each object
+            total (int):
+                number of objects to be processed
+            progress (callable):
+                optional function to report progress to. See
+                :py:func:`apply`.
+        """
+        self._log = logging.getLogger(__name__)
+        self._operation = operation
+        self._total = total
+        self._progress = progress
+        # Rate limiters keyed by the URL of the server they apply to
+        self._limiters = {}
+        self._completed = 0
+        self._lock = threading.Lock()
+
+    def limit(self, server, rate):
+        """Limits the rate at which objects managed by a server are processed
+
+        Args:
+            server (str):
+                URL of the server
+            rate (float):
+                maximum number of objects processed per second
+        """
+        if server not in self._limiters:
+            self._limiters[server] = RateLimiter(rate)
+
+    def __call__(self, item):
+        """Runs the operation on an object
+
+        Args:
+            item:
+                object to run the operation on
+
+        Returns:
+            tuple:
+                2-tuple containing True and the value returned by the
+                operation if it succeeded, or False and the exception raised
+                by the operation if it failed
+        """
+        limiter = self._limiters.get(_server_url(item))
+        if limiter is not None:
+            limiter.wait()
+        try:
+            return True, self._operation(item)
+        except Exception as err:  # pylint: disable=broad-except
+            self._log.debug("Bulk operation failed for %s: %s", item, err)
+            return False, err
+        finally:
+            with self._lock:
+                self._completed += 1
+                count = self._completed
+            if self._progress is not None:
+                self._progress(count, self._total)
+
+
+def apply(items, operation, workers=DEFAULT_WORKERS, rate=None,
+          progress=None):
+    """Runs an operation on many Jenkins objects concurrently
+
+    Args:
+        items (list):
+            objects to run the operation on, like a list of
+            :class:`~.job.Job` objects
+        operation:
+            either the name of a method to be called on each object with no
+            arguments, like "disable", or a callable accepting the object as
+            its only argument
+        workers (int):
+            maximum number of objects processed concurrently
+        rate (float):
+            optional maximum number of operations started per second, for
+            each server the objects are managed by. Defaults to no limit.
+        progress (callable):
+            optional function called after each object has been processed,
+            successfully or not, with the number of objects processed so far
+            and the total number of objects. Called from worker threads.
+
+    Returns:
+        BulkResult:
+            the outcome of the operation for every object. Exceptions raised
+            by the operation are collected in the result rather than
+            propagated. See :py:meth:`BulkResult.raise_for_errors`.
+    """
+    items = list(items)
+    if isinstance(operation, str):
+        operation = methodcaller(operation)
+    worker = _Worker(operation, len(items), progress)
+    if rate:
+        for cur_item in items:
+            worker.limit(_server_url(cur_item), rate)
+
+    result = BulkResult()
+    if not items:
+        return result
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as pool:
+        for cur_item, (success, value) in zip(items, pool.map(worker, items)):
+            if success:
+                result.succeeded.append((cur_item, value))
+            else:
+                result.failed.append((cur_item, value))
+    return result
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
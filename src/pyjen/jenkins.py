@@ -1,16 +1,29 @@
 """Primitives for interacting with the main Jenkins dashboard"""
 import logging
+import time
+from urllib.parse import unquote
 from requests.exceptions import RequestException
 from requests.sessions import Session
 from requests.auth import HTTPBasicAuth
 from pyjen.view import View
-from pyjen.node import Node
+from pyjen.node import Node, NodeSnapshot, SNAPSHOT_FIELDS
 from pyjen.job import Job
 from pyjen.user import User
 from pyjen.queue import Queue
 from pyjen.plugin_manager import PluginManager
 from pyjen.utils.jenkins_api import JenkinsAPI
-from pyjen.utils.helpers import create_view, create_job
+from pyjen.utils.helpers import create_view, create_job, node_url
+from pyjen.utils.crawler import crawl_jobs, DEFAULT_DEPTH, DEFAULT_WORKERS
+from pyjen.utils.projection import tree_query
+from pyjen.utils.config_store import fetch_configs, DEFAULT_FETCH_WORKERS
+from pyjen.utils.utilization import UtilizationSampler, DEFAULT_INTERVAL, \
+    DEFAULT_CAPACITY
+
+#: float: number of seconds the list of build agents loaded by
+#: :py:attr:`Jenkins.nodes` is reused for
+NODE_INDEX_TTL = 30
+
+_NODES_QUERY = tree_query(["computer[" + ",".join(SNAPSHOT_FIELDS) + "]"])
 
 
 class Jenkins:
@@ -36,6 +49,10 @@ class Jenkins:
         super().__init__()
         self._log = logging.getLogger(__name__)
         self._api = JenkinsAPI(url, session)
+        # Build agents keyed by name, and the time they were loaded. See the
+        # nodes property.
+        self._node_index = None
+        self._node_index_time = None
 
     @classmethod
     def basic_auth(cls, url, credentials=None, ssl_cert=None):
@@ -66,6 +83,154 @@ class Jenkins:
         session.verify = ssl_cert or True
         return cls(url, session)
 
+    def enable_cache(self, ttl=30, max_size=1000):
+        """Enables caching of REST API responses
+
+        Caching is disabled by default. Once enabled, data loaded from the
+        REST API is shared by all objects managed by this Jenkins instance,
+        so reading several properties of the same job, build or view only
+        downloads its data once. Call ``invalidate()`` or ``refresh()`` on any
+        object to discard its cached data early. Cached data for an object is
+        also discarded automatically after any change made through it.
+
+        Args:
+            ttl (float):
+                number of seconds cached data remains valid
+            max_size (int):
+                maximum number of REST API responses to retain. The least
+                recently used responses are discarded first.
+        """
+        self._api.enable_cache(ttl, max_size)
+
+    def disable_cache(self):
+        """Disables caching of REST API responses
+
+        See :py:meth:`enable_cache` for details.
+        """
+        self._api.disable_cache()
+
+    def enable_build_cache(self, path, max_size=100 * 1024 * 1024):
+        """Enables persistent caching of the data for finished builds
+
+        Once a build has finished, the data describing it no longer changes,
+        except for its description. When enabled, the data loaded for any
+        finished build is stored in an SQLite database, and is reused by any
+        session using the same database rather than being downloaded again.
+        The description of a build is always loaded from the server. Builds
+        which are still running are never cached.
+
+        Args:
+            path (str):
+                path to the SQLite database file to store the cache in. The
+                file is created if it doesn't exist.
+            max_size (int):
+                maximum number of bytes of build data to retain. The least
+                recently used builds are discarded first.
+        """
+        self._api.enable_build_cache(path, max_size)
+
+    def disable_build_cache(self):
+        """Disables persistent caching of the data for finished builds
+
+        See :py:meth:`enable_build_cache` for details.
+        """
+        self._api.disable_build_cache()
+
+    def sync_config_mirror(self, path, full=False,
+                           workers=DEFAULT_FETCH_WORKERS, max_age=None):
+        """Mirrors the config.xml of every job and view to a local folder
+
+        Only the configurations which appear to have changed since the last
+        sync to the same folder are downloaded, based on a single listing of
+        every job and view. See :py:mod:`~.utils.config_mirror` for details
+        on the layout of the mirror.
+
+        Warning:
+            Changes are detected using the settings reported by the REST API,
+            like the descriptions and parameters of jobs. Changes to other
+            settings, like build steps, source repositories or triggers, are
+            not detected, so the mirrored copies of those configurations
+            remain out of date. Use 'max_age' or a full sync to bound how out
+            of date the mirror can be.
+
+        Once synchronized, the configurations of jobs and views may be read
+        from the mirror rather than the server using
+        :py:meth:`mirrored_config`. Call :py:meth:`disable_config_mirror` to
+        stop.
+
+        Args:
+            path (str):
+                folder to store the mirror in. Created if it doesn't exist.
+            full (bool):
+                True to download every configuration regardless of whether it
+                appears to have changed
+            workers (int):
+                maximum number of configurations downloaded concurrently
+            max_age (float):
+                optional maximum number of seconds since a configuration was
+                downloaded. Older configurations are downloaded again, even
+                if they appear to be unchanged.
+
+        Returns:
+            SyncResult:
+                lists of the configurations downloaded, left unchanged, and
+                removed from the mirror
+        """
+        mirror = self._api.enable_config_mirror(path)
+        return mirror.sync(self._api, full, workers, max_age=max_age)
+
+    def disable_config_mirror(self):
+        """Stops reading configurations from a local mirror
+
+        See :py:meth:`sync_config_mirror` for details.
+        """
+        self._api.disable_config_mirror()
+
+    def mirrored_config(self, url, max_age=None):
+        """Reads the config.xml of a job or view from the local mirror
+
+        Mirrored configurations may be out of date, since not every change
+        is detected by :py:meth:`sync_config_mirror`, so they are never used
+        by the PyJen objects which modify configurations, like
+        :py:attr:`~.job.Job.config_xml`. Use this method for read-only
+        purposes, like searching the configurations of many jobs at once.
+
+        Args:
+            url (str):
+                URL of the job or view
+            max_age (float):
+                optional maximum number of seconds since the mirrored
+                configuration was downloaded. Older configurations are loaded
+                from the server again, and the mirror is updated.
+
+        Returns:
+            str:
+                the mirrored configuration, or the configuration loaded from
+                the server if the job or view has not been mirrored, or its
+                mirrored copy is older than the given age
+        """
+        return self._api.clone(url).get_mirrored_config(max_age)
+
+    @property
+    def projections(self):
+        """bool: whether properties load only the REST API fields they need
+
+        Disabled by default, in which case every property loads the full
+        JSON description of the object it belongs to. When enabled, each
+        property requests only the fields it depends on using a "tree"
+        query, which can dramatically reduce the amount of data transferred
+        for objects like jobs with long build histories. Applies to all
+        objects managed by this Jenkins instance.
+
+        See :py:meth:`~.job.Job.fetch` for a way to load several properties
+        with a single request.
+        """
+        return self._api.projections
+
+    @projections.setter
+    def projections(self, value):
+        self._api.projections = value
+
     @property
     def connected(self):
         """bool: True if API still connected to the service, False if not"""
@@ -92,22 +257,146 @@ class Jenkins:
 
     @property
     def nodes(self):
-        """list (Node): list of build agents"""
-        data = self._api.get_api_data(target_url=self._api.url + "computer/")
-        nodes = data['computer']
-        retval = []
-        for cur_node in nodes:
-            if cur_node['displayName'] == 'master':
-                node_url = self._api.url + 'computer/(master)'
-            elif cur_node['displayName'] == 'Built-In Node':
-                node_url = self._api.url + 'computer/(built-in)'
-            else:
-                node_url = self._api.url + 'computer/' + cur_node['displayName']
+        """list (Node): list of build agents
 
-            retval.append(Node(self._api.clone(node_url)))
+        The names and states of all build agents are loaded with a single
+        request, and the list is reused for a short period of time. See
+        :py:data:`NODE_INDEX_TTL`.
+        """
+        return list(self._get_node_index().values())
+
+    def _get_node_index(self):
+        """Loads the build agents managed by this Jenkins instance
 
+        Returns:
+            dict:
+                :class:`~.node.Node` objects for every build agent, pre-loaded
+                with the state of the agent and keyed by its display name
+        """
+        if self._node_index is not None and \
+                time.monotonic() - self._node_index_time < NODE_INDEX_TTL:
+            return self._node_index
+
+        data = self._api.get_api_data(
+            target_url=self._api.url + "computer/",
+            query_params=_NODES_QUERY)
+        retval = {}
+        for cur_node in data['computer']:
+            node_api = self._api.clone(
+                node_url(self._api.url, cur_node['displayName']))
+            node_api.seed(cur_node, SNAPSHOT_FIELDS)
+            retval[cur_node['displayName']] = Node(node_api)
+
+        self._node_index = retval
+        self._node_index_time = time.monotonic()
         return retval
 
+    @staticmethod
+    def _node_names(url):
+        """Determines the display names a build agent may be reported with
+
+        Args:
+            url (str):
+                URL of the build agent
+
+        Returns:
+            tuple (str):
+                possible display names of the build agent. The built-in node
+                is reported with different names by different Jenkins
+                versions.
+        """
+        name = unquote(url.rstrip('/').rsplit('/', 1)[-1])
+        if name in ('(master)', '(built-in)'):
+            return 'master', 'Built-In Node'
+        return (name,)
+
+    @property
+    def node_snapshots(self):
+        """list (NodeSnapshot): current state of every build agent, all loaded
+        with a single request"""
+        computer_api = self._api.clone(self._api.url + "computer")
+        computer_api.invalidate()
+        data = computer_api.get_api_data(query_params=_NODES_QUERY)
+        return [NodeSnapshot(cur_node) for cur_node in data["computer"]]
+
+    def start_utilization_sampler(self, interval=DEFAULT_INTERVAL,
+                                  capacity=DEFAULT_CAPACITY):
+        """Starts sampling the utilization of every build agent's executors
+
+        Samples are taken at a fixed rate on a background thread, each with a
+        single request, and are retained in memory so statistics like the
+        mean or 95th percentile utilization of each node can be calculated
+        later without contacting the server. See
+        :class:`~.utils.utilization.UtilizationSampler` for details.
+
+        Args:
+            interval (float):
+                number of seconds between samples
+            capacity (int):
+                maximum number of samples retained for each node. Once
+                reached, each new sample replaces the oldest one.
+
+        Returns:
+            UtilizationSampler:
+                the running sampler, which should be stopped once no more
+                samples are needed
+        """
+        retval = UtilizationSampler(self._api, interval, capacity)
+        retval.start()
+        return retval
+
+    def wait_for_nodes_idle(self, nodes, timeout=None, poll_interval=1):
+        """Blocks execution until several build agents are idle at once
+
+        Rather than polling each node separately, the state of every node is
+        loaded with a single request on each poll. See
+        :py:attr:`node_snapshots` for details. Nodes are matched by their
+        display names. Nodes which are removed while waiting are considered
+        idle.
+
+        Args:
+            nodes (list):
+                :class:`~.node.Node` objects to wait for
+            timeout (float):
+                Optional number of seconds to wait for the nodes to become
+                idle. If this value is undefined, this method will block
+                indefinitely.
+            poll_interval (float):
+                number of seconds to wait between polls
+
+        Returns:
+            bool:
+                True if all the nodes were idle before returning, otherwise
+                returns False
+
+        Raises:
+            ValueError:
+                if any of the nodes does not exist
+        """
+        pending = [self._node_names(cur_node.url) for cur_node in nodes]
+        first_poll = True
+        start = time.monotonic()
+        while True:
+            snapshots = self.node_snapshots
+            names = {cur_node.name for cur_node in snapshots}
+            if first_poll:
+                unknown = [cur[0] for cur in pending if names.isdisjoint(cur)]
+                if unknown:
+                    raise ValueError(f"Build agents not found: {unknown}")
+                first_poll = False
+            requested = {cur_name for cur in pending for cur_name in cur}
+            busy = [cur_node.name for cur_node in snapshots
+                    if not cur_node.is_idle and cur_node.name in requested]
+            if not busy:
+                return True
+            delay = poll_interval
+            if timeout is not None:
+                delay = min(delay, start + timeout - time.monotonic())
+                if delay <= 0:
+                    return False
+            self._log.debug("Waiting for busy nodes: %s", busy)
+            time.sleep(delay)
+
     @property
     def default_view(self):
         """View: the primary / default Jenkins view
@@ -143,36 +432,68 @@ class Jenkins:
 
         return retval
 
-    def _recursively_find_jobs(self, obj):
-        """Recursively locates all jobs managed by an arbitrary Jenkins object
+    @property
+    def all_jobs(self):
+        """list (Job): all jobs managed by this Jenkins instance, recursively
+
+        Unlike the :meth:`jobs` method, this method attempts to expose jobs
+        which are managed by custom jobs created from third party plugins which
+        support nesting jobs under sub-folders / sub-paths. See
+        :py:meth:`crawl_jobs` for details."""
+        return self.crawl_jobs()[0]
+
+    def crawl_jobs(self, depth=DEFAULT_DEPTH, max_workers=DEFAULT_WORKERS):
+        """Locates all jobs managed by this Jenkins instance, recursively
+
+        Several levels of jobs nested within folders, and other jobs that
+        contain other jobs, are loaded with a single query. Jobs nested deeper
+        than that are loaded with additional queries, run concurrently.
 
         Args:
-            obj:
-                An arbitrary Jenkins object which may contain jobs. The given
-                object may be one of any number of PyJen plugins, but it must
-                expose a 'jobs' property which can be used to load a list of
-                jobs managed by the object
+            depth (int):
+                number of levels of nested jobs to load with each query
+            max_workers (int):
+                maximum number of concurrent queries used to load jobs nested
+                deeper than the given depth
 
         Returns:
-            list (Job):
-                list of jobs nested within other jobs, recursively
+            tuple:
+                2-tuple containing the list of all jobs found, with each
+                container followed by its children, and a dictionary mapping
+                the URL of every container to the list of jobs it directly
+                contains. The URL of this Jenkins instance maps to the top
+                level jobs.
         """
-        retval = []
-        for cur_job in obj.jobs:
-            retval.append(cur_job)
-            if isinstance(getattr(type(cur_job), "jobs", None), property):
-                retval.extend(self._recursively_find_jobs(cur_job))
-        return retval
+        return crawl_jobs(self._api, depth, max_workers)
 
-    @property
-    def all_jobs(self):
-        """list (Job): all jobs managed by this Jenkins instance, recursively
+    def fetch_configs(self, jobs, workers=DEFAULT_FETCH_WORKERS):
+        """Loads the config.xml for several jobs concurrently
 
-        Unlike the :meth:`jobs` method, this method attempts to expose jobs
-        which are managed by custom jobs created from third party plugins which
-        support nesting jobs under sub-folders / sub-paths. Any job which
-        exposes a custom 'jobs' property."""
-        return self._recursively_find_jobs(self)
+        Intended for auditing the configurations of many jobs at once. Each
+        distinct configuration is stored and parsed only once, so jobs with
+        identical configurations, like those cloned from a common template,
+        share a single copy of the parsed XML. See
+        :py:mod:`~.utils.config_store` for details.
+
+        Args:
+            jobs (list):
+                :class:`~.job.Job` objects to load the configurations of
+            workers (int):
+                maximum number of configurations downloaded concurrently
+
+        Returns:
+            list (JobXML):
+                the configuration of each job, in the same order as the
+                given jobs. Each is an instance of the XML class appropriate
+                for the type of job, like :class:`~.freestylejob.FreestyleXML`.
+                Each takes a private copy of the shared XML tree when first
+                accessed, so they may be modified independently.
+        """
+        jobs = list(jobs)
+        # pylint: disable=protected-access
+        documents = fetch_configs([cur_job._api for cur_job in jobs], workers)
+        return [cur_job._xml_class(cur_job._api, cur_doc)
+                for cur_job, cur_doc in zip(jobs, documents)]
 
     def prepare_shutdown(self):
         """Starts a "quiet down" and prevents new builds from executing
@@ -311,25 +632,13 @@ class Jenkins:
                 information, or None if no node with the given name can be
                 found
         """
-        if nodename == "master":
-            temp_nodename = "(master)"
-        elif nodename == "Built-In Node":
-            temp_nodename = "(built-in)"
-        else:
-            temp_nodename = nodename
-
-        # TODO: Rework 'nodes' property to cache the node name for all nodes in
-        #       one query, so we can rework this implementation to simply call
-        #       self.nodes then iterate through them all to find the one
-        #       we're looking for. Then we don't have to guess the URL.
-
-        new_url = self._api.url + "computer/" + temp_nodename
-        try:
-            retval = Node(self._api.clone(new_url))
-            assert retval.name == nodename
-            return retval
-        except RequestException:
-            return None
+        start = time.monotonic()
+        retval = self._get_node_index().get(nodename)
+        if retval is None and self._node_index_time < start:
+            # The node may have been added since the list of nodes was loaded
+            self._node_index = None
+            retval = self._get_node_index().get(nodename)
+        return retval
 
     @property
     def plugin_manager(self):
@@ -1,5 +1,9 @@
 """Primitives for interacting with Jenkins jobs"""
 import logging
+from contextlib import contextmanager
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlsplit, urljoin
 import requests
 from requests.exceptions import HTTPError
@@ -7,6 +11,8 @@ from pyjen.build import Build
 from pyjen.queue_item import QueueItem
 from pyjen.utils.jobxml import JobXML
 from pyjen.utils.plugin_api import find_plugin, get_all_plugins
+from pyjen.utils.projection import json_property, property_data, \
+    resolve_fields, tree_query
 
 
 class Job:
@@ -38,6 +44,40 @@ class Job:
     def __hash__(self):
         return hash(self._api.url)
 
+    def invalidate(self):
+        """Discards any cached data for this job, so it gets reloaded from
+        the Jenkins server the next time it is accessed
+        """
+        self._api.invalidate()
+        self._xml_cache = None
+
+    def refresh(self):
+        """Discards any cached data for this job and reloads it from the
+        Jenkins server
+        """
+        self.invalidate()
+        self._api.get_api_data()
+
+    def fetch(self, fields):
+        """Loads the data for several properties of this job at once
+
+        Only the JSON fields needed by the given properties are loaded, using
+        a single request. Reading any of these properties afterwards does not
+        contact the Jenkins server again, until the loaded data is discarded
+        by :py:meth:`invalidate` or by any change made through this object.
+
+        Example:
+        ::
+
+            job.fetch(["name", "is_disabled", "build_health"])
+
+        Args:
+            fields (list):
+                names of properties of this object to load. Raw JSON field
+                names or tree expressions may be provided as well.
+        """
+        self._api.fetch(resolve_fields(type(self), fields))
+
     # ---------------------------------------------- CONFIG XML BASED PROPERTIES
     @property
     def _job_xml(self):
@@ -63,6 +103,31 @@ class Job:
     def config_xml(self, new_xml):
         self._job_xml.xml = new_xml
 
+    @contextmanager
+    def edit(self):
+        """Context manager which batches configuration changes to this job
+
+        Changing a setting of a job, like its quiet period, normally posts
+        the entire config.xml for the job back to Jenkins. Within this
+        context those posts are deferred until the context exits, at which
+        point the configuration is posted once, and only if it has changed.
+        Pending changes are discarded if the context exits with an exception.
+
+        Example:
+        ::
+
+            with job.edit() as cfg:
+                cfg.quiet_period = 5
+                cfg.assigned_node = "linux"
+                cfg.add_builder(ShellBuilder.instantiate("make"))
+
+        Yields:
+            Job:
+                this job
+        """
+        with self._job_xml.edit():
+            yield self
+
     @property
     def properties(self):
         """list (XMLPlugin): custom properties associated with this job,
@@ -93,40 +158,37 @@ class Job:
         return self._job_xml.plugin_name
 
     # ---------------------------------------------------- JSON BASED PROPERTIES
-    @property
+    @json_property("name")
     def name(self):
         """str: the name of the Jenkins job"""
-        data = self._api.get_api_data()
+        data = property_data(self, "name")
         return data['name']
 
-    @property
+    @json_property("color")
     def is_disabled(self):
         """bool: True if the job is disabled, otherwise False"""
-        data = self._api.get_api_data()
-
+        data = property_data(self, "is_disabled")
         return data['color'] == "disabled"
 
-    @property
+    @json_property("color")
     def is_unstable(self):
         """bool: True if the latest build of the job is unstable, otherwise
         False"""
-        data = self._api.get_api_data()
-
+        data = property_data(self, "is_unstable")
         return data['color'] == "yellow"
 
-    @property
+    @json_property("color")
     def is_failing(self):
         """bool: True if the latest build of the job is a failure, otherwise
         False"""
-        data = self._api.get_api_data()
+        data = property_data(self, "is_failing")
         return data['color'] == "red"
 
-    @property
+    @json_property("color")
     def has_been_built(self):
         """bool: True if the job has been built at least once, otherwise False
         """
-        data = self._api.get_api_data()
-
+        data = property_data(self, "has_been_built")
         return data['color'] != "notbuilt"
 
     @property
@@ -163,15 +225,74 @@ class Job:
 
         return retval
 
-    @property
+    def iter_builds(self, page_size=100, fields=None):
+        """Iterates over all recorded builds for this job, newest first
+
+        Unlike :py:attr:`all_builds`, which loads the entire build history at
+        once, builds are loaded in pages as the caller iterates over them.
+        The next page is loaded in the background while the caller processes
+        the current one, and no further pages are loaded once the caller stops
+        iterating.
+
+        Example:
+        ::
+
+            for cur_build in job.iter_builds(fields=["result", "duration"]):
+                if cur_build.result == "FAILURE":
+                    break
+
+        Args:
+            page_size (int):
+                number of builds to load with each request
+            fields (list):
+                optional names of properties of :class:`~.build.Build` to load
+                along with each page of builds, so reading them does not
+                require another request per build. Raw JSON field names or
+                tree expressions may be provided as well.
+
+        Returns:
+            generator:
+                yields one :class:`~.build.Build` object for each build of
+                this job
+        """
+        if page_size < 1:
+            raise ValueError("Page size must be a positive number")
+        build_fields = resolve_fields(Build, ["url"] + list(fields or []))
+        field_list = ",".join(build_fields)
+
+        def load_page(start):
+            query = tree_query(
+                [f"allBuilds[{field_list}]{{{start},{start + page_size}}}"])
+            return self._api.get_api_data(query_params=query)["allBuilds"]
+
+        pool = ThreadPoolExecutor(max_workers=1)
+        next_page = pool.submit(load_page, 0)
+        try:
+            start = 0
+            while next_page is not None:
+                page = next_page.result()
+                start += page_size
+                next_page = None
+                if len(page) == page_size:
+                    next_page = pool.submit(load_page, start)
+
+                for cur_build in page:
+                    new_api = self._api.clone(cur_build["url"])
+                    new_api.seed(cur_build, build_fields)
+                    yield Build(new_api)
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+            pool.shutdown(wait=False)
+
+    @json_property("lastSuccessfulBuild[url]")
     def last_good_build(self):
         """Build: the most recent successful build of this job
 
         Synonymous with the "Last successful build" permalink on the
         jobs' main status page
         """
-        data = self._api.get_api_data()
-
+        data = property_data(self, "last_good_build")
         lgb = data['lastSuccessfulBuild']
 
         if lgb is None:
@@ -179,30 +300,28 @@ class Job:
 
         return Build(self._api.clone(lgb['url']))
 
-    @property
+    @json_property("lastBuild[url]")
     def last_build(self):
         """Build: the most recent build of this job
 
         Synonymous with the "Last Build" permalink on the jobs'
         main status page
         """
-        data = self._api.get_api_data()
-
+        data = property_data(self, "last_build")
         if 'lastBuild' not in data or data['lastBuild'] is None:
             return None
         last_build = data['lastBuild']
 
         return Build(self._api.clone(last_build['url']))
 
-    @property
+    @json_property("lastFailedBuild[url]")
     def last_failed_build(self):
         """Build: the most recent build of this job with a status of "failed"
 
         Synonymous with the "Last failed build" permalink on the jobs'
         main status page
         """
-        data = self._api.get_api_data()
-
+        data = property_data(self, "last_failed_build")
         bld = data['lastFailedBuild']
 
         if bld is None:
@@ -210,15 +329,14 @@ class Job:
 
         return Build(self._api.clone(bld['url']))
 
-    @property
+    @json_property("lastCompletedBuild[url]")
     def last_stable_build(self):
         """Build: the most recent build of this job with a status of "stable"
 
         Synonymous with the "Last stable build" permalink on the jobs'
         main status page
         """
-        data = self._api.get_api_data()
-
+        data = property_data(self, "last_stable_build")
         bld = data['lastCompletedBuild']
 
         if bld is None:
@@ -226,15 +344,14 @@ class Job:
 
         return Build(self._api.clone(bld['url']))
 
-    @property
+    @json_property("lastUnsuccessfulBuild[url]")
     def last_unsuccessful_build(self):
         """Build: the most recent build of this job with a status of "unstable"
 
         Synonymous with the "Last unsuccessful build" permalink on the jobs'
         main status page
         """
-        data = self._api.get_api_data()
-
+        data = property_data(self, "last_unsuccessful_build")
         bld = data['lastUnsuccessfulBuild']
 
         if bld is None:
@@ -367,29 +484,39 @@ class Job:
         Returns:
             list (Build):
                 list of 0 or more builds of this job that began during the
-                time range provided
+                time range provided, newest first. The start time of each
+                build is loaded along with the list.
         """
         if start_time > end_time:
             end_time, start_time = start_time, end_time
 
-        builds = []
+        # Builds are listed newest first, and build numbers increase along
+        # with their start times, so we can locate the range of builds with a
+        # binary search over the start times in chronological order
+        fields = ["url", "number", "timestamp"]
+        data = self._api.get_api_data(
+            query_params=tree_query([f"allBuilds[{','.join(fields)}]"]))
+        builds = data["allBuilds"][::-1]
+        start_times = [datetime.fromtimestamp(cur_build["timestamp"] * 0.001)
+                       for cur_build in builds]
+        first = bisect_left(start_times, start_time)
+        last = bisect_right(start_times, end_time)
 
-        for run in self.all_builds:
-            if run.start_time < start_time:
-                break
-            if end_time >= run.start_time >= start_time:
-                builds.append(run)
-        return builds
+        retval = []
+        for cur_build in reversed(builds[first:last]):
+            new_api = self._api.clone(cur_build["url"])
+            new_api.seed(cur_build, fields)
+            retval.append(Build(new_api))
+        return retval
 
-    @property
+    @json_property("healthReport[description,score]")
     def build_health(self):
         """int: the percentage of good builds from recorded history of this job
 
         This metric is associated with the "weather" icon that can be shown
         next to jobs in certain views
         """
-        data = self._api.get_api_data()
-
+        data = property_data(self, "build_health")
         health_report = data['healthReport']
 
         for cur_report in health_report:
@@ -488,11 +615,6 @@ class Job:
             Job:
                 PyJen job object wrapping the REST API for the given job
         """
-        # TODO: Find some way to cache the json data given inside the view so
-        #       we can lazy-load API data. For example, the name of the view
-        #       is always included in the json data and therefore queries for
-        #       the View name after creation should not require another hit
-        #       to the REST API
         log = logging.getLogger(__name__)
 
         job_url = json_data["url"]
@@ -520,7 +642,12 @@ class Job:
             log.debug("Unable to find plugin for class %s", json_data["_class"])
             plugin_class = Job
 
-        return plugin_class(rest_api.clone(job_url))
+        # The summary data we were given typically includes the name, URL and
+        # status of the job, so we seed our new object with it to avoid
+        # having to hit the REST API again just to read those values
+        new_api = rest_api.clone(job_url)
+        new_api.seed(json_data)
+        return plugin_class(new_api)
 
     @classmethod
     def get_supported_plugins(cls):
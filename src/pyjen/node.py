@@ -1,6 +1,11 @@
 """Declarations for the abstraction of a Jenkins build agent"""
 import time
 from urllib.parse import quote
+from pyjen.utils.projection import json_property, property_data
+
+#: list (str): JSON fields describing the state of a node, loaded for every
+#: node at once to populate :class:`NodeSnapshot` objects
+SNAPSHOT_FIELDS = ["displayName", "idle", "offline", "numExecutors"]
 
 
 class Node:
@@ -18,31 +23,47 @@ class Node:
         super().__init__()
         self._api = api
 
+    def invalidate(self):
+        """Discards any cached data for this node, so it gets reloaded from
+        the Jenkins server the next time it is accessed
+        """
+        self._api.invalidate()
+
+    def refresh(self):
+        """Discards any cached data for this node and reloads it from the
+        Jenkins server
+        """
+        self.invalidate()
+        self._api.get_api_data()
+
     @property
+    def url(self):
+        """str: URL of this node"""
+        return self._api.url
+
+    @json_property("displayName")
     def name(self):
         """str: the display name of this Node"""
-        data = self._api.get_api_data()
-
+        data = property_data(self, "name")
         return data['displayName']
 
-    @property
+    @json_property("offline")
     def is_offline(self):
         """bool: checks to see whether this Node is currently offline or not"""
-        data = self._api.get_api_data()
-
+        data = property_data(self, "is_offline")
         return data['offline']
 
-    @property
+    @json_property("idle")
     def is_idle(self):
         """bool: checks to see whether any executors are in use on this Node
         or not"""
-        data = self._api.get_api_data()
+        data = property_data(self, "is_idle")
         return data['idle']
 
-    @property
+    @json_property("numExecutors")
     def number_of_executors(self):
         """int: the number of executors this node provides"""
-        data = self._api.get_api_data()
+        data = property_data(self, "number_of_executors")
         return data['numExecutors']
 
     def toggle_offline(self, message=None):
@@ -65,6 +86,9 @@ class Node:
     def wait_for_idle(self, max_timeout=None):
         """Blocks execution until this Node enters an idle state
 
+        See :py:meth:`~.jenkins.Jenkins.wait_for_nodes_idle` for a more
+        efficient way to wait for many nodes at once.
+
         Args:
             max_timeout (int):
                 Optional amount of time, in seconds, to wait for an idle
@@ -79,16 +103,57 @@ class Node:
         polling_period_in_seconds = 1
 
         total_wait_time = 0
-        while not self.is_idle:
+        idle = self.is_idle
+        while not idle:
+            if max_timeout is not None and total_wait_time >= max_timeout:
+                break
             time.sleep(polling_period_in_seconds)
-            if max_timeout is None:
-                continue
-
             total_wait_time += polling_period_in_seconds
-            if total_wait_time >= max_timeout:
-                break
+            self.invalidate()
+            idle = self.is_idle
+
+        return idle
+
+
+class NodeSnapshot:
+    """State of a Jenkins build agent at a specific point in time
 
-        return self.is_idle
+    Snapshots for every build agent are loaded at once, with a single
+    request. See :py:meth:`~.jenkins.Jenkins.node_snapshots` for details.
+    """
+
+    def __init__(self, data):
+        """
+        Args:
+            data (dict):
+                Dictionary of attributes describing a single build agent, as
+                provided by the Jenkins REST API, containing at least the
+                fields listed in :py:data:`SNAPSHOT_FIELDS`
+        """
+        self._data = data
+
+    def __repr__(self):
+        return f"({type(self)}: {self.name})"
+
+    @property
+    def name(self):
+        """str: the display name of the Node"""
+        return self._data["displayName"]
+
+    @property
+    def is_offline(self):
+        """bool: whether the Node was offline"""
+        return self._data["offline"]
+
+    @property
+    def is_idle(self):
+        """bool: whether all of the executors of the Node were idle"""
+        return self._data["idle"]
+
+    @property
+    def number_of_executors(self):
+        """int: the number of executors the Node provides"""
+        return self._data["numExecutors"]
 
 
 if __name__ == "__main__":  # pragma: no cover
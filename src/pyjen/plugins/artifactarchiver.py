@@ -1,5 +1,5 @@
 """Interface to the Jenkins 'archive artifacts' publishing plugin"""
-from xml.etree import ElementTree
+from pyjen.utils import xml_backend
 from pyjen.utils.xml_plugin import XMLPlugin
 
 
@@ -46,8 +46,8 @@ class ArtifactArchiverPublisher(XMLPlugin):
     <defaultExcludes>true</defaultExcludes>
     <caseSensitive>true</caseSensitive>
 </hudson.tasks.ArtifactArchiver>"""
-        root_node = ElementTree.fromstring(default_xml)
-        child = ElementTree.SubElement(root_node, "artifacts")
+        root_node = xml_backend.fromstring(default_xml)
+        child = xml_backend.SubElement(root_node, "artifacts")
         child.text = file_pattern
 
         return cls(root_node)
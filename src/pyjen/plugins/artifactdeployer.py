@@ -1,5 +1,5 @@
 """properties of the 'artifact deployer' publishing plugin"""
-from xml.etree import ElementTree
+from pyjen.utils import xml_backend
 from pyjen.utils.xml_plugin import XMLPlugin
 
 
@@ -22,7 +22,7 @@ class ArtifactDeployer(XMLPlugin):
     <entries class="empty-list"/>
     <deployEvenBuildFail>false</deployEvenBuildFail>
 </org.jenkinsci.plugins.artifactdeployer.ArtifactDeployerPublisher>"""
-        root_node = ElementTree.fromstring(default_xml)
+        root_node = xml_backend.fromstring(default_xml)
 
         return cls(root_node)
 
@@ -47,8 +47,7 @@ class ArtifactDeployer(XMLPlugin):
                 New publisher descriptor entry to be added
         """
         entries_node = self._root.find('entries')
-        entries_node.append(new_entry.node)
-        new_entry.parent = self
+        new_entry.attach(self, entries_node)
         self.update()
 
     @staticmethod
@@ -88,10 +87,10 @@ class ArtifactDeployerEntry(XMLPlugin):
     <failNoFilesDeploy>false</failNoFilesDeploy>
 </org.jenkinsci.plugins.artifactdeployer.ArtifactDeployerEntry>"""
 
-        root_node = ElementTree.fromstring(default_xml)
-        includes_node = ElementTree.SubElement(root_node, "includes")
+        root_node = xml_backend.fromstring(default_xml)
+        includes_node = xml_backend.SubElement(root_node, "includes")
         includes_node.text = include_pattern
-        remote_node = ElementTree.SubElement(root_node, "remote")
+        remote_node = xml_backend.SubElement(root_node, "remote")
         remote_node.text = remote_path
 
         return cls(root_node)
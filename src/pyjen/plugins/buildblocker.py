@@ -1,5 +1,5 @@
 """Interfaces for interacting with Build Blockers job property plugin"""
-from xml.etree import ElementTree
+from pyjen.utils import xml_backend
 from pyjen.utils.xml_plugin import XMLPlugin
 
 
@@ -109,8 +109,8 @@ class BuildBlockerProperty(XMLPlugin):
     <scanQueueFor>DISABLED</scanQueueFor>
 </hudson.plugins.buildblocker.BuildBlockerProperty>"""
 
-        root_node = ElementTree.fromstring(default_xml)
-        jobs_node = ElementTree.SubElement(root_node, "blockingJobs")
+        root_node = xml_backend.fromstring(default_xml)
+        jobs_node = xml_backend.SubElement(root_node, "blockingJobs")
         if isinstance(patterns, str):
             jobs_node.text = patterns
         else:
@@ -1,5 +1,5 @@
 """Interface to the Jenkins 'build trigger' publishing plugin"""
-from xml.etree import ElementTree
+from pyjen.utils import xml_backend
 from pyjen.utils.xml_plugin import XMLPlugin
 
 
@@ -49,9 +49,9 @@ class BuildTriggerPublisher(XMLPlugin):
         <completeBuild>true</completeBuild>
     </threshold>
 </hudson.tasks.BuildTrigger>"""
-        root_node = ElementTree.fromstring(default_xml)
+        root_node = xml_backend.fromstring(default_xml)
 
-        child = ElementTree.SubElement(root_node, "childProjects")
+        child = xml_backend.SubElement(root_node, "childProjects")
         child.text = ",".join(project_names)
 
         return cls(root_node)
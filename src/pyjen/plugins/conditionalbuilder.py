@@ -1,6 +1,7 @@
 """Primitives for operating on Jenkins job builder of type 'Conditional Builder'
 """
-from xml.etree import ElementTree
+from copy import deepcopy
+from pyjen.utils import xml_backend
 from pyjen.utils.plugin_api import find_plugin
 from pyjen.utils.xml_plugin import XMLPlugin
 
@@ -47,9 +48,9 @@ class ConditionalBuilder(XMLPlugin):
 </org.jenkinsci.plugins.conditionalbuildstep.singlestep.SingleConditionalBuilder>
 """  # pylint: disable=line-too-long
 
-        root_node = ElementTree.fromstring(default_xml)
-        root_node.append(condition.node)
-        build_step = ElementTree.SubElement(root_node, "buildStep")
+        root_node = xml_backend.fromstring(default_xml)
+        root_node.append(deepcopy(condition.node))
+        build_step = xml_backend.SubElement(root_node, "buildStep")
 
         # The XML for the build step, unfortunately, doesn't match the original
         # XML when it gets nested inside the conditional build plugin. The
@@ -71,7 +72,7 @@ class ConditionalBuilder(XMLPlugin):
         #
         build_step.attrib["class"] = builder.node.tag
         for cur_child in builder.node:
-            build_step.append(cur_child)
+            build_step.append(deepcopy(cur_child))
 
         return cls(root_node)
 
@@ -102,9 +103,11 @@ class ConditionalBuilder(XMLPlugin):
         # We have to reconstruct the XML for the build step from the
         # encoded version in the buildStep. For further details see
         # the encoding logic found in the create() method of this class.
-        root_node = ElementTree.Element(build_step_node.attrib["class"])
+        # Some XML backends move nodes appended to another parent, so the
+        # children are copied here and in create() to leave the source intact
+        root_node = xml_backend.Element(build_step_node.attrib["class"])
         for cur_child in build_step_node:
-            root_node.append(cur_child)
+            root_node.append(deepcopy(cur_child))
 
         return plugin(root_node)
 
@@ -1,5 +1,6 @@
 """Primitives for operating on job publishers of type 'Flexible Publisher'"""
-from xml.etree import ElementTree
+from copy import deepcopy
+from pyjen.utils import xml_backend
 from pyjen.utils.xml_plugin import XMLPlugin
 from pyjen.utils.plugin_api import instantiate_xml_plugin
 
@@ -49,11 +50,11 @@ class FlexiblePublisher(XMLPlugin):
 <org.jenkins__ci.plugins.flexible__publish.FlexiblePublisher>
     <publishers/>
 </org.jenkins__ci.plugins.flexible__publish.FlexiblePublisher>"""
-        root_node = ElementTree.fromstring(default_xml)
+        root_node = xml_backend.fromstring(default_xml)
         configs_node = root_node.find("publishers")
 
         for cur_action in actions:
-            configs_node.append(cur_action.node)
+            configs_node.append(deepcopy(cur_action.node))
 
         return cls(root_node)
 
@@ -102,12 +103,12 @@ class ConditionalAction(XMLPlugin):
     <executionStrategy class="org.jenkins_ci.plugins.flexible_publish.strategy.FailAtEndExecutionStrategy"/>
 </org.jenkins__ci.plugins.flexible__publish.ConditionalPublisher>
 """  # pylint: disable=line-too-long
-        root_node = ElementTree.fromstring(default_xml)
-        root_node.append(condition.node)
+        root_node = xml_backend.fromstring(default_xml)
+        root_node.append(deepcopy(condition.node))
         configs_node = root_node.find("publisherList")
 
         for cur_action in actions:
-            configs_node.append(cur_action.node)
+            configs_node.append(deepcopy(cur_action.node))
 
         return cls(root_node)
 
@@ -1,5 +1,6 @@
 """Primitives that manage Jenkins job of type 'Freestyle'"""
-from xml.etree import ElementTree
+from copy import deepcopy
+from pyjen.utils import xml_backend
 from pyjen.job import Job
 from pyjen.utils.jobxml import JobXML
 from pyjen.utils.plugin_api import find_plugin
@@ -244,8 +245,7 @@ class FreestyleXML(JobXML):
                 PyJen plugin which supports the Jenkins publisher API
         """
         pubs = self._root.find('publishers')
-        pubs.append(new_publisher.node)
-        new_publisher.parent = self
+        new_publisher.attach(self, pubs)
 
     @property
     def scm(self):
@@ -275,7 +275,7 @@ class FreestyleXML(JobXML):
     def scm(self, node):
         cur_scm = self._root.find('scm')
         self._root.remove(cur_scm)
-        self._root.append(node)
+        self._root.append(deepcopy(node))
 
     @property
     def builders(self):
@@ -304,8 +304,7 @@ class FreestyleXML(JobXML):
                 PyJen plugin implementing the new job builder to be added
         """
         pubs = self._root.find('builders')
-        pubs.append(builder.node)
-        builder.parent = self
+        builder.attach(self, pubs)
 
     @property
     def quiet_period(self):
@@ -325,7 +324,7 @@ class FreestyleXML(JobXML):
     def quiet_period(self, value):
         node = self._root.find("quietPeriod")
         if node is None:
-            node = ElementTree.SubElement(self._root, 'quietPeriod')
+            node = xml_backend.SubElement(self._root, 'quietPeriod')
         node.text = str(value)
 
     def disable_quiet_period(self):
@@ -348,7 +347,7 @@ class FreestyleXML(JobXML):
         node = self._root.find('customWorkspace')
 
         if node is None:
-            node = ElementTree.SubElement(self._root, 'customWorkspace')
+            node = xml_backend.SubElement(self._root, 'customWorkspace')
 
         node.text = path
 
@@ -372,7 +371,7 @@ class FreestyleXML(JobXML):
         node = self._root.find('assignedNode')
 
         if node is None:
-            node = ElementTree.SubElement(self._root, 'assignedNode')
+            node = xml_backend.SubElement(self._root, 'assignedNode')
 
         node.text = node_label
 
@@ -1,5 +1,5 @@
 """SCM properties for jobs which pull sources from a Git repository"""
-from xml.etree import ElementTree
+from pyjen.utils import xml_backend
 from pyjen.utils.xml_plugin import XMLPlugin
 
 
@@ -47,12 +47,12 @@ class GitSCM(XMLPlugin):
     <submoduleCfg class="list"/>
     <extensions/>
 </scm>"""
-        root_node = ElementTree.fromstring(default_xml)
+        root_node = xml_backend.fromstring(default_xml)
 
-        remotes = ElementTree.SubElement(root_node, "userRemoteConfigs")
-        config = ElementTree.SubElement(
+        remotes = xml_backend.SubElement(root_node, "userRemoteConfigs")
+        config = xml_backend.SubElement(
             remotes, "hudson.plugins.git.UserRemoteConfig")
-        url = ElementTree.SubElement(config, "url")
+        url = xml_backend.SubElement(config, "url")
 
         url.text = repository_url
 
@@ -1,5 +1,5 @@
 """SCM properties of Jenkins jobs with no source control configuration"""
-from xml.etree import ElementTree
+from pyjen.utils import xml_backend
 from pyjen.utils.xml_plugin import XMLPlugin
 
 
@@ -24,7 +24,7 @@ class NullSCM(XMLPlugin):
             NullSCM:
                 instance of this class
         """
-        root_node = ElementTree.fromstring('<scm class="hudson.scm.NullSCM"/>')
+        root_node = xml_backend.fromstring('<scm class="hudson.scm.NullSCM"/>')
         return cls(root_node)
 
 
@@ -1,5 +1,5 @@
 """String build parameter - plugin for parameterized build plugin"""
-from xml.etree import ElementTree
+from pyjen.utils import xml_backend
 from pyjen.utils.xml_plugin import XMLPlugin
 
 
@@ -61,18 +61,18 @@ class ParameterizedBuildStringParameter(XMLPlugin):
         """
         default_xml = """<hudson.model.StringParameterDefinition>
 </hudson.model.StringParameterDefinition>"""
-        root_node = ElementTree.fromstring(default_xml)
+        root_node = xml_backend.fromstring(default_xml)
 
-        name_node = ElementTree.SubElement(root_node, "name")
+        name_node = xml_backend.SubElement(root_node, "name")
         name_node.text = name
 
-        desc_node = ElementTree.SubElement(root_node, "description")
+        desc_node = xml_backend.SubElement(root_node, "description")
         desc_node.text = description
 
-        default_val_node = ElementTree.SubElement(root_node, "defaultValue")
+        default_val_node = xml_backend.SubElement(root_node, "defaultValue")
         default_val_node.text = default_value
 
-        trim_node = ElementTree.SubElement(root_node, "trim")
+        trim_node = xml_backend.SubElement(root_node, "trim")
         trim_node.text = str(trim)
 
         return cls(root_node)
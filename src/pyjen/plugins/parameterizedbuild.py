@@ -1,5 +1,6 @@
 """Implementation for the parameterized build plugin"""
-from xml.etree import ElementTree
+from copy import deepcopy
+from pyjen.utils import xml_backend
 from pyjen.utils.xml_plugin import XMLPlugin
 from pyjen.utils.plugin_api import instantiate_xml_plugin
 
@@ -39,10 +40,10 @@ class ParameterizedBuild(XMLPlugin):
         default_xml = """<hudson.model.ParametersDefinitionProperty>
 </hudson.model.ParametersDefinitionProperty>
 """
-        root_node = ElementTree.fromstring(default_xml)
-        params_node = ElementTree.SubElement(root_node, "parameterDefinitions")
+        root_node = xml_backend.fromstring(default_xml)
+        params_node = xml_backend.SubElement(root_node, "parameterDefinitions")
         for cur_child in params:
-            params_node.append(cur_child.node)
+            params_node.append(deepcopy(cur_child.node))
         return cls(root_node)
 
     @staticmethod
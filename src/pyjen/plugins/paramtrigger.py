@@ -1,5 +1,6 @@
 """Jenkins post-build publisher of type Parameterized Build Trigger"""
-from xml.etree import ElementTree
+from copy import deepcopy
+from pyjen.utils import xml_backend
 from pyjen.utils.xml_plugin import XMLPlugin
 from pyjen.utils.plugin_api import instantiate_xml_plugin
 
@@ -51,11 +52,11 @@ class ParameterizedBuildTrigger(XMLPlugin):
 <hudson.plugins.parameterizedtrigger.BuildTrigger>
     <configs/>
 </hudson.plugins.parameterizedtrigger.BuildTrigger>"""
-        root_node = ElementTree.fromstring(default_xml)
+        root_node = xml_backend.fromstring(default_xml)
         configs_node = root_node.find("configs")
 
         for cur_trig in triggers:
-            configs_node.append(cur_trig.node)
+            configs_node.append(deepcopy(cur_trig.node))
 
         return cls(root_node)
 
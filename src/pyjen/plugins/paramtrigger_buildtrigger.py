@@ -1,5 +1,5 @@
 """Trigger configuration for a parameterized build trigger"""
-from xml.etree import ElementTree
+from pyjen.utils import xml_backend
 from pyjen.utils.xml_plugin import XMLPlugin
 from pyjen.utils.plugin_api import instantiate_xml_plugin
 
@@ -52,8 +52,7 @@ class BuildTriggerConfig(XMLPlugin):
                 being triggered
         """
         parent = self.node.find("configs")
-        parent.append(param_config.node)
-        param_config.parent = self
+        param_config.attach(self, parent)
 
     @classmethod
     def instantiate(cls, job_names):
@@ -76,7 +75,7 @@ class BuildTriggerConfig(XMLPlugin):
     <triggerWithNoParameters>true</triggerWithNoParameters>
     <triggerFromChildProjects>false</triggerFromChildProjects>
 </hudson.plugins.parameterizedtrigger.BuildTriggerConfig>"""
-        root_node = ElementTree.fromstring(default_xml)
+        root_node = xml_backend.fromstring(default_xml)
         projects_node = root_node.find("projects")
         projects_node.text = ",".join(job_names)
         return cls(root_node)
@@ -1,5 +1,5 @@
 """Trigger parameter for the Parameterized Trigger plugin"""
-from xml.etree import ElementTree
+from pyjen.utils import xml_backend
 from pyjen.utils.xml_plugin import XMLPlugin
 
 
@@ -28,7 +28,7 @@ class CurrentBuildParams(XMLPlugin):
         """
         default_xml = \
             """<hudson.plugins.parameterizedtrigger.CurrentBuildParameters/>"""
-        root_node = ElementTree.fromstring(default_xml)
+        root_node = xml_backend.fromstring(default_xml)
         return cls(root_node)
 
 
@@ -1,5 +1,6 @@
 """Primitives that manage Jenkins job of type 'pipeline'"""
-from xml.etree import ElementTree
+from copy import deepcopy
+from pyjen.utils import xml_backend
 from pyjen.job import Job
 from pyjen.utils.jobxml import JobXML
 from pyjen.utils.plugin_api import find_plugin
@@ -107,17 +108,17 @@ class PipelineXML(JobXML):
                 build check out the entire repository before running the
                 Jenkinsfile.
         """
-        definition_node = ElementTree.Element("definition")
+        definition_node = xml_backend.Element("definition")
         definition_node.attrib["class"] = \
             "org.jenkinsci.plugins.workflow.cps.CpsScmFlowDefinition"
         definition_node.attrib["plugin"] = "workflow-cps"
-        definition_node.append(scm.node)
+        definition_node.append(deepcopy(scm.node))
 
-        script_node = ElementTree.Element("scriptPath")
+        script_node = xml_backend.Element("scriptPath")
         script_node.text = script_path
         definition_node.append(script_node)
 
-        lightweight_node = ElementTree.Element("lightweight")
+        lightweight_node = xml_backend.Element("lightweight")
         lightweight_node.text = str(lightweight)
         definition_node.append(lightweight_node)
 
@@ -135,16 +136,16 @@ class PipelineXML(JobXML):
                 indicates whether the Groovy script can run in the safer
                 'sandbox' environment.
         """
-        definition_node = ElementTree.Element("definition")
+        definition_node = xml_backend.Element("definition")
         definition_node.attrib["class"] = \
             "org.jenkinsci.plugins.workflow.cps.CpsFlowDefinition"
         definition_node.attrib["plugin"] = "workflow-cps"
 
-        script_node = ElementTree.Element("script")
+        script_node = xml_backend.Element("script")
         script_node.text = script
         definition_node.append(script_node)
 
-        sandbox_node = ElementTree.Element("sandbox")
+        sandbox_node = xml_backend.Element("sandbox")
         sandbox_node.text = str(sandbox)
         definition_node.append(sandbox_node)
 
@@ -1,6 +1,6 @@
 """Condition for the run condition plugin that will always produce a true result
 """
-from xml.etree import ElementTree
+from pyjen.utils import xml_backend
 from pyjen.utils.xml_plugin import XMLPlugin
 
 
@@ -40,7 +40,7 @@ class AlwaysRun(XMLPlugin):
         """
         default_xml = '<condition class="{0}" plugin="run-condition@1.2"/>'
         default_xml = default_xml.format(cls.get_jenkins_plugin_name())
-        root_node = ElementTree.fromstring(default_xml)
+        root_node = xml_backend.fromstring(default_xml)
 
         return cls(root_node)
 
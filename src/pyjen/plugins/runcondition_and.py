@@ -1,7 +1,8 @@
 """Condition for the run condition plugin that performs a logical AND operation
 on other build conditions
 """
-from xml.etree import ElementTree
+from copy import deepcopy
+from pyjen.utils import xml_backend
 from pyjen.utils.xml_plugin import XMLPlugin
 
 
@@ -53,13 +54,13 @@ class AndCondition(XMLPlugin):
 
         default_xml = '<condition class="{0}" plugin="run-condition@1.2"/>'
         default_xml = default_xml.format(cls.get_jenkins_plugin_name())
-        root_node = ElementTree.fromstring(default_xml)
-        conditions_node = ElementTree.SubElement(root_node, "conditions")
+        root_node = xml_backend.fromstring(default_xml)
+        conditions_node = xml_backend.SubElement(root_node, "conditions")
         for cur_term in terms:
-            term_node = ElementTree.Element(
+            term_node = xml_backend.Element(
                 "org.jenkins_ci.plugins.run_condition.logic.ConditionContainer"
             )
-            term_node.append(cur_term.node)
+            term_node.append(deepcopy(cur_term.node))
             conditions_node.append(term_node)
         return cls(root_node)
 
@@ -1,7 +1,8 @@
 """Condition for the run condition plugin that inverts the logical result of
 another build condition.
 """
-from xml.etree import ElementTree
+from copy import deepcopy
+from pyjen.utils import xml_backend
 from pyjen.utils.xml_plugin import XMLPlugin
 
 
@@ -46,8 +47,8 @@ class NotCondition(XMLPlugin):
         """
         default_xml = '<condition class="{0}" plugin="run-condition@1.2"/>'
         default_xml = default_xml.format(cls.get_jenkins_plugin_name())
-        root_node = ElementTree.fromstring(default_xml)
-        root_node.append(condition.node)
+        root_node = xml_backend.fromstring(default_xml)
+        root_node.append(deepcopy(condition.node))
         return cls(root_node)
 
 
@@ -82,9 +82,8 @@ class SectionedViewXML(ViewXML):
                 "Failed loading Sectioned View section: " +
                 section_type)
         new_section = plugin_class.instantiate(name)
-        new_section.parent = self
         sections = self._root.find('sections')
-        sections.append(new_section.node)
+        new_section.attach(self, sections)
 
 
 PluginClass = SectionedView
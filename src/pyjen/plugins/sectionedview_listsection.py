@@ -1,7 +1,7 @@
 """Primitives for controlling list view sub-sections on a sectioned view
 
 This is a plugin supported by the SectionedView plugin"""
-from xml.etree import ElementTree
+from pyjen.utils import xml_backend
 from pyjen.utils.xml_plugin import XMLPlugin
 
 
@@ -29,7 +29,7 @@ class ListViewSection(XMLPlugin):
     def include_regex(self, new_regex):
         regex_node = self._root.find("includeRegex")
         if regex_node is None:
-            regex_node = ElementTree.SubElement(self._root, 'includeRegex')
+            regex_node = xml_backend.SubElement(self._root, 'includeRegex')
         regex_node.text = new_regex
         self.update()
 
@@ -72,9 +72,9 @@ class ListViewSection(XMLPlugin):
         <hudson.views.BuildButtonColumn/>
     </columns>
 </hudson.plugins.sectioned__view.ListViewSection>"""
-        root_node = ElementTree.fromstring(default_xml)
+        root_node = xml_backend.fromstring(default_xml)
 
-        name_node = ElementTree.SubElement(root_node, "name")
+        name_node = xml_backend.SubElement(root_node, "name")
         name_node.text = section_name
 
         return cls(root_node)
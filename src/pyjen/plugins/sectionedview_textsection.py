@@ -1,7 +1,7 @@
 """Primitives for controlling plain text view sub-sections on a sectioned view
 
 This is a plugin supported by the SectionedView plugin"""
-from xml.etree import ElementTree
+from pyjen.utils import xml_backend
 from pyjen.utils.xml_plugin import XMLPlugin
 
 
@@ -49,9 +49,9 @@ class TextSection(XMLPlugin):
     <text/>
     <style>NONE</style>
 </hudson.plugins.sectioned__view.TextSection>"""
-        root_node = ElementTree.fromstring(default_xml)
+        root_node = xml_backend.fromstring(default_xml)
 
-        name_node = ElementTree.SubElement(root_node, "name")
+        name_node = xml_backend.SubElement(root_node, "name")
         name_node.text = section_name
 
         return cls(root_node)
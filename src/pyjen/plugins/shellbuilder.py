@@ -1,5 +1,5 @@
 """Interface to control a basic shell build step job builder plugin"""
-from xml.etree import ElementTree
+from pyjen.utils import xml_backend
 from pyjen.utils.xml_plugin import XMLPlugin
 
 
@@ -27,7 +27,7 @@ class ShellBuilder(XMLPlugin):
     def unstable_return_code(self, value):
         rcode_node = self._root.find('unstableReturn')
         if not rcode_node:
-            rcode_node = ElementTree.SubElement(self._root, "unstableReturn")
+            rcode_node = xml_backend.SubElement(self._root, "unstableReturn")
         rcode_node.text = str(value)
         self.update()
 
@@ -52,9 +52,9 @@ class ShellBuilder(XMLPlugin):
             ShellBuilder: instance of this class
         """
         default_xml = """<hudson.tasks.Shell></hudson.tasks.Shell>"""
-        root_node = ElementTree.fromstring(default_xml)
+        root_node = xml_backend.fromstring(default_xml)
 
-        child = ElementTree.SubElement(root_node, "command")
+        child = xml_backend.SubElement(root_node, "command")
         child.text = script
 
         return cls(root_node)
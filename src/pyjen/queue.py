@@ -1,5 +1,26 @@
 """Abstraction around the Jenkins build queue"""
 from pyjen.queue_item import QueueItem
+from pyjen.utils.queue_watcher import QueueWatcher, DEFAULT_POLL_INTERVAL, \
+    DEFAULT_MAX_POLL_INTERVAL
+
+
+def _notify(callback, item):
+    """Adapts a user provided callback for use as a future's done callback
+
+    Args:
+        callback (callable):
+            function to be called with the queue item and its build
+        item (QueueItem):
+            queue item associated with the future
+
+    Returns:
+        callable:
+            function to be called with the future once it is resolved
+    """
+    def _done(future):
+        if not future.cancelled() and future.exception() is None:
+            callback(item, future.result())
+    return _done
 
 
 class Queue:
@@ -30,6 +51,52 @@ class Queue:
             retval.append(QueueItem(queue_api))
         return retval
 
+    def watch(self, items, callback=None, poll_interval=DEFAULT_POLL_INTERVAL,
+              max_poll_interval=DEFAULT_MAX_POLL_INTERVAL):
+        """Tracks several scheduled builds until they leave the queue
+
+        Intended as a replacement for polling each queue item separately,
+        which is very inefficient when many builds are scheduled at once.
+        The entire queue is polled instead, on a background thread, with a
+        single lightweight query per poll. See
+        :class:`~.utils.queue_watcher.QueueWatcher` for details.
+
+        Example:
+        ::
+
+            items = [job.start_build(TARGET=cur) for cur in targets]
+            for cur_future in as_completed(jenkins.build_queue.watch(items)):
+                bld = cur_future.result()
+
+        Args:
+            items (list):
+                :class:`~.queue_item.QueueItem` objects to be tracked
+            callback (callable):
+                optional function called from the background thread as each
+                item leaves the queue, with the queue item and the build
+                started from it, or None if the item was cancelled
+            poll_interval (float):
+                minimum number of seconds to wait between polls of the queue,
+                used while the content of the queue is changing
+            max_poll_interval (float):
+                maximum number of seconds to wait between polls of the queue,
+                approached gradually while the queue remains idle
+
+        Returns:
+            list (concurrent.futures.Future):
+                one future for each item, in the same order, resolved with the
+                :class:`~.build.Build` started from the item once it leaves the
+                queue, or with None if the item was cancelled
+        """
+        watcher = QueueWatcher(self._api, poll_interval, max_poll_interval)
+        retval = []
+        for cur_item in items:
+            future = watcher.watch(cur_item)
+            if callback is not None:
+                future.add_done_callback(_notify(callback, cur_item))
+            retval.append(future)
+        return retval
+
 
 if __name__ == "__main__":  # pragma: no cover
     pass
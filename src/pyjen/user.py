@@ -1,4 +1,5 @@
 """Primitives for interacting with Jenkins users"""
+from pyjen.utils.projection import json_property, property_data
 
 
 class User:
@@ -18,30 +19,43 @@ class User:
         super().__init__()
         self._api = api
 
-    @property
+    def invalidate(self):
+        """Discards any cached data for this user, so it gets reloaded from
+        the Jenkins server the next time it is accessed
+        """
+        self._api.invalidate()
+
+    def refresh(self):
+        """Discards any cached data for this user and reloads it from the
+        Jenkins server
+        """
+        self.invalidate()
+        self._api.get_api_data()
+
+    @json_property("id")
     def user_id(self):
         """str: the unique identifier for this user"""
-        data = self._api.get_api_data()
+        data = property_data(self, "user_id")
         return data['id']
 
-    @property
+    @json_property("fullName")
     def full_name(self):
         """str: the users first and last names separated by a space"""
-        data = self._api.get_api_data()
+        data = property_data(self, "full_name")
         return data['fullName']
 
-    @property
+    @json_property("description")
     def description(self):
         """str: descriptive text associated with the user. May be an empty
         string."""
-        data = self._api.get_api_data()
+        data = property_data(self, "description")
         return data['description'] if data['description'] is not None else ''
 
-    @property
+    @json_property("property[address]")
     def email(self):
         """str: Gets this users' email address as reported by Jenkins. May be
         None if no email on record for user."""
-        data = self._api.get_api_data()
+        data = property_data(self, "email")
         for prop in data['property']:
             if 'address' in prop:
                 return prop['address']
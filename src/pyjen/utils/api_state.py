@@ -0,0 +1,243 @@
+"""State shared by the synchronous and asynchronous REST API abstractions
+
+The I/O performed by :class:`~.jenkins_api.JenkinsAPI` and
+:class:`~pyjen.aio.jenkins_api.AsyncJenkinsAPI` differs, but the rules for
+reusing data loaded ahead of time, and for handling the CSRF crumbs required
+by POST operations, are the same for both and are implemented here.
+"""
+import threading
+import time
+from pyjen.utils.projection import top_level_field
+
+# JSON fields which can never change for a given REST API endpoint. Changing
+# any of them, for example by renaming a job, moves the object to a new URL.
+IDENTITY_FIELDS = ("name", "url", "_class")
+
+#: float: default number of seconds data seeded into API objects remains valid
+DEFAULT_SEED_TTL = 30
+
+
+class ServerState:
+    """Server-wide state shared by all REST API objects for one server"""
+
+    def __init__(self):
+        #: float: number of seconds data seeded into API objects remains
+        #: valid
+        self.seed_ttl = DEFAULT_SEED_TTL
+        #: CrumbCache: CSRF crumb used to authorize POST operations
+        self.crumbs = CrumbCache()
+        # Incremented every time an object on the server is modified
+        self._generation = 0
+        self._generation_lock = threading.Lock()
+
+    @property
+    def generation(self):
+        """int: counter incremented each time the server is modified"""
+        return self._generation
+
+    def modified(self):
+        """Records that a change has been made to the server
+
+        Used to detect when data loaded ahead of time by API objects may no
+        longer reflect the state of the server.
+        """
+        with self._generation_lock:
+            self._generation += 1
+
+
+class CrumbCache:
+    """Cached copy of the CSRF crumb issued by a Jenkins server
+
+    Loading the crumb is left to the owner of the cache, which must
+    serialize concurrent loads.
+    """
+
+    def __init__(self):
+        self._value = None
+
+    @staticmethod
+    def url(root_url):
+        """Generates the URL the crumb is loaded from
+
+        Args:
+            root_url (str):
+                URL of the main Jenkins dashboard, with a trailing slash
+
+        Returns:
+            str:
+                URL of the crumb issuer
+        """
+        return root_url + "crumbIssuer/api/json"
+
+    @property
+    def value(self):
+        """dict: HTTP header containing the crumb, an empty string if CSRF
+        protection has been disabled on the server, or None if the crumb has
+        not been loaded"""
+        return self._value
+
+    def store(self, status, data):
+        """Caches the response from the crumb issuer
+
+        Args:
+            status (int):
+                HTTP status code of the response
+            data (dict):
+                decoded JSON content of the response. Ignored if the crumb
+                issuer was not found.
+
+        Returns:
+            dict:
+                the new value of the cache. See :py:attr:`value`.
+        """
+        if status == 404:
+            # If we get a 404 error, endpoint not found, assume the Cross
+            # Site Scripting support has been disabled
+            self._value = ''
+        else:
+            self._value = {data['crumbRequestField']: data['crumb']}
+        return self._value
+
+    def invalidate(self, crumb):
+        """Discards the cached crumb so it gets reloaded on next use
+
+        Needed when the crumb expires server-side, for example when the
+        Jenkins web session the crumb was issued for times out.
+
+        Args:
+            crumb (dict):
+                the crumb that was rejected by the server. Ignored if the
+                cached crumb has already been replaced by a concurrent caller.
+        """
+        if self._value == crumb:
+            self._value = None
+
+    @staticmethod
+    def is_rejected(crumb, status):
+        """Checks whether a POST operation failed because of an expired crumb
+
+        Args:
+            crumb (dict):
+                crumb sent with the request, if any
+            status (int):
+                HTTP status code of the response
+
+        Returns:
+            bool:
+                True if the request should be sent again with a new crumb
+        """
+        return bool(crumb) and status == 403
+
+    @staticmethod
+    def replace(headers, old_crumb, new_crumb):
+        """Replaces the crumb in a set of HTTP headers
+
+        Args:
+            headers (dict):
+                HTTP headers to update
+            old_crumb (dict):
+                crumb to remove from the headers, if any
+            new_crumb (dict):
+                crumb to add to the headers, if any
+        """
+        for key in old_crumb or {}:
+            headers.pop(key, None)
+        if new_crumb:
+            headers.update(new_crumb)
+
+
+class SeedData:
+    """JSON data for a REST API endpoint loaded ahead of time
+
+    Seeded data is used to satisfy requests for specific fields without
+    contacting the server. It is ignored once it is older than the seed
+    time-to-live of the server, or once any change has been made to the
+    server, with the exception of the fields listed in
+    :py:data:`IDENTITY_FIELDS`, which remain valid indefinitely.
+    """
+
+    def __init__(self, state):
+        """
+        Args:
+            state (ServerState):
+                state of the server the endpoint belongs to
+        """
+        self._state = state
+        self._data = {}
+        # Tree expressions the data was loaded with
+        self._fields = set()
+        self._time = None
+        self._generation = None
+
+    @property
+    def data(self):
+        """dict: the seeded data"""
+        return self._data
+
+    def _is_current(self):
+        """bool: True if the seeded data may still reflect the server state"""
+        if self._time is None:
+            return False
+        if self._generation != self._state.generation:
+            return False
+        return time.monotonic() - self._time < self._state.seed_ttl
+
+    def update(self, data, fields=None):
+        """Seeds new data
+
+        Args:
+            data (dict):
+                JSON data describing the endpoint. Merged with any data
+                seeded previously that is still current.
+            fields (list):
+                optional list of tree expressions used to load the data. When
+                not provided, only requests for whole top-level fields found in
+                the data can be satisfied by it.
+        """
+        if not self._is_current():
+            self._data = {key: value for key, value in self._data.items()
+                          if key in IDENTITY_FIELDS}
+            self._fields = set()
+        self._data.update(data)
+        if fields:
+            self._fields.update(fields)
+        self._time = time.monotonic()
+        self._generation = self._state.generation
+
+    def clear(self):
+        """Discards all the seeded data"""
+        self._data = {}
+        self._fields = set()
+        self._time = None
+
+    def covers(self, fields):
+        """Checks whether the seeded data contains a given set of fields
+
+        Args:
+            fields (list):
+                JSON field names or tree expressions to check
+
+        Returns:
+            bool:
+                True if all the fields are available in the seeded data
+        """
+        if not self._data:
+            return False
+        current = self._is_current()
+        for cur_field in fields:
+            is_top_level = cur_field == top_level_field(cur_field)
+            if is_top_level and cur_field in IDENTITY_FIELDS and \
+                    cur_field in self._data:
+                continue
+            if not current:
+                return False
+            if cur_field in self._fields:
+                continue
+            if is_top_level and cur_field in self._data:
+                continue
+            return False
+        return True
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
@@ -0,0 +1,229 @@
+"""Primitives for downloading the artifacts published by builds
+
+Artifacts are streamed to disk in fixed size chunks rather than being
+loaded into memory, several artifacts are downloaded at once, and partially
+downloaded files are resumed rather than restarted.
+"""
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from urllib.parse import quote
+from requests.exceptions import HTTPError
+
+#: int: default number of artifacts downloaded concurrently
+DEFAULT_WORKERS = 4
+
+#: int: default number of bytes of each artifact held in memory at once
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+#: int: default minimum number of artifacts to download as a single archive
+DEFAULT_ZIP_THRESHOLD = 50
+
+
+def _md5sum(path, chunk_size):
+    """Calculates the MD5 checksum of a local file
+
+    Args:
+        path (str):
+            path to the file to check
+        chunk_size (int):
+            number of bytes of the file to read at once
+
+    Returns:
+        str:
+            hexadecimal representation of the checksum
+    """
+    digest = hashlib.md5()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ArtifactDownloader:
+    """Downloads the artifacts published by a build to a local folder
+
+    Artifacts are saved in the destination folder using the same relative
+    paths they were archived with. Files that already exist locally are
+    skipped when their fingerprint matches the one recorded by Jenkins, and
+    are resumed where they left off otherwise.
+    """
+
+    def __init__(self, api, dest, workers=DEFAULT_WORKERS,
+                 chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Args:
+            api (JenkinsAPI):
+                REST API for the build publishing the artifacts
+            dest (str):
+                path to the folder to save the artifacts in
+            workers (int):
+                maximum number of artifacts to download at once
+            chunk_size (int):
+                maximum number of bytes of each artifact to hold in memory
+        """
+        self._log = logging.getLogger(__name__)
+        self._api = api
+        self._dest = os.path.abspath(dest)
+        self._workers = workers
+        self._chunk_size = chunk_size
+
+    def download_all(self, artifacts, pattern=None,
+                     zip_threshold=DEFAULT_ZIP_THRESHOLD):
+        """Downloads several artifacts at once
+
+        Builds publishing many artifacts can have all of them downloaded at
+        once as a single zip archive, which is considerably more efficient
+        than requesting each file individually. This is only done when all
+        the artifacts are needed and none of them have been downloaded
+        before.
+
+        Args:
+            artifacts (list):
+                2-tuples describing every artifact published by the build,
+                containing the path of the artifact relative to the build's
+                artifact folder, and the MD5 fingerprint of the artifact or
+                None if it was not fingerprinted
+            pattern (str):
+                optional glob-style pattern selecting the artifacts to
+                download by their relative paths, like "*.jar" or
+                "reports/*". All artifacts are downloaded when not provided.
+            zip_threshold (int):
+                minimum number of artifacts for them to be downloaded as a
+                single archive
+
+        Returns:
+            list (str):
+                paths to the local copies of the selected artifacts
+        """
+        selected = [(path, md5) for path, md5 in artifacts
+                    if pattern is None or fnmatch(path, pattern)]
+        if not selected:
+            return []
+
+        if len(selected) == len(artifacts) and \
+                len(selected) >= zip_threshold and \
+                not any(os.path.exists(self.target(path))
+                        for path, _ in selected):
+            self.download_archive()
+            return [self.target(path) for path, _ in selected]
+
+        with ThreadPoolExecutor(max_workers=self._workers) as pool:
+            return list(pool.map(lambda args: self.download(*args), selected))
+
+    def target(self, relative_path):
+        """Generates the local path for an artifact
+
+        Args:
+            relative_path (str):
+                path of the artifact relative to the artifact folder
+
+        Returns:
+            str:
+                path to the local copy of the artifact
+        """
+        retval = os.path.normpath(
+            os.path.join(self._dest, *relative_path.split("/")))
+        if os.path.commonpath([retval, self._dest]) != self._dest:
+            raise ValueError(f"Artifact {relative_path} would be saved "
+                             f"outside of {self._dest}")
+        return retval
+
+    def download(self, relative_path, md5=None):
+        """Downloads a single artifact, unless it has been downloaded already
+
+        Args:
+            relative_path (str):
+                path of the artifact relative to the artifact folder
+            md5 (str):
+                optional MD5 fingerprint of the artifact, used to check
+                whether any existing local copy is complete and intact
+
+        Returns:
+            str:
+                path to the local copy of the artifact
+        """
+        target = self.target(relative_path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if md5 and os.path.isfile(target) and \
+                _md5sum(target, self._chunk_size) == md5:
+            self._log.debug("Skipping up to date artifact %s", target)
+            return target
+
+        self._fetch(relative_path, target, resume=True)
+        if md5 and _md5sum(target, self._chunk_size) != md5:
+            self._log.warning("Fingerprint mismatch for %s. Downloading it "
+                              "again.", target)
+            self._fetch(relative_path, target, resume=False)
+            if _md5sum(target, self._chunk_size) != md5:
+                raise IOError(f"Fingerprint mismatch for artifact {target}")
+        return target
+
+    def _fetch(self, relative_path, target, resume):
+        """Streams the content of an artifact to disk
+
+        Args:
+            relative_path (str):
+                path of the artifact relative to the artifact folder
+            target (str):
+                path to the local copy of the artifact
+            resume (bool):
+                if True, any existing local data is assumed to be the start
+                of the artifact, and only the remainder of it is downloaded
+        """
+        offset = 0
+        if resume and os.path.isfile(target):
+            offset = os.path.getsize(target)
+
+        headers = None
+        if offset:
+            headers = {"Range": f"bytes={offset}-"}
+        try:
+            response = self._api.get_stream(
+                "artifact/" + quote(relative_path), headers=headers)
+        except HTTPError as err:
+            # "Range not satisfiable" means there is nothing left to download
+            # provided the local file has the same size as the remote one
+            if offset and err.response is not None and \
+                    err.response.status_code == 416:
+                content_range = err.response.headers.get("Content-Range", "")
+                if content_range.endswith(f"/{offset}"):
+                    return
+                self._fetch(relative_path, target, resume=False)
+                return
+            raise
+
+        with response:
+            mode = "ab" if response.status_code == 206 else "wb"
+            with open(target, mode) as handle:
+                for chunk in response.iter_content(self._chunk_size):
+                    handle.write(chunk)
+
+    def download_archive(self):
+        """Downloads all artifacts at once, as a single zip archive"""
+        self._log.debug("Downloading all artifacts from %s as an archive",
+                        self._api.url)
+        with tempfile.TemporaryFile() as buffer:
+            with self._api.get_stream("artifact/*zip*/archive.zip") as resp:
+                for chunk in resp.iter_content(self._chunk_size):
+                    buffer.write(chunk)
+
+            with zipfile.ZipFile(buffer) as archive:
+                for cur_entry in archive.infolist():
+                    if cur_entry.is_dir():
+                        continue
+                    # Entries are stored within an "archive" root folder
+                    target = self.target(cur_entry.filename.split("/", 1)[-1])
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    with archive.open(cur_entry) as src, \
+                            open(target, "wb") as dst:
+                        shutil.copyfileobj(src, dst, self._chunk_size)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
@@ -0,0 +1,156 @@
+"""Persistent, size-bounded cache for the REST API data of finished builds"""
+import json
+import sqlite3
+import threading
+import time
+
+
+class BuildCache:
+    """On-disk cache of the JSON data describing finished builds
+
+    Once a build has finished, the data describing it no longer changes, so
+    it can safely be reused across any number of sessions. Entries are stored
+    in an SQLite database keyed by the URL of the build, and the least
+    recently used entries are evicted whenever the total size of the cached
+    data grows beyond its maximum size.
+
+    The cache may be shared by several threads, and by several processes
+    using the same database file.
+    """
+
+    def __init__(self, path, max_size=100 * 1024 * 1024):
+        """
+        Args:
+            path (str):
+                path to the SQLite database file to store the cache in. The
+                file is created if it doesn't exist.
+            max_size (int):
+                maximum number of bytes of JSON data to retain
+        """
+        if max_size <= 0:
+            raise ValueError("Cache size must be greater than 0")
+
+        self._path = path
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            path, timeout=30, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS builds ("
+                "url TEXT PRIMARY KEY, data TEXT NOT NULL, "
+                "size INTEGER NOT NULL, accessed REAL NOT NULL)")
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS builds_accessed "
+                "ON builds (accessed)")
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM builds").fetchone()[0]
+
+    @property
+    def path(self):
+        """str: path to the SQLite database storing the cache"""
+        return self._path
+
+    @property
+    def max_size(self):
+        """int: maximum number of bytes of JSON data retained by the cache"""
+        return self._max_size
+
+    @property
+    def size(self):
+        """int: number of bytes of JSON data currently stored in the cache"""
+        with self._lock:
+            return self._db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM builds").fetchone()[0]
+
+    def get(self, url):
+        """Looks up the cached data for a build
+
+        Args:
+            url (str):
+                URL of the build
+
+        Returns:
+            dict:
+                the cached build data, or None if the build is not cached
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data FROM builds WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE builds SET accessed = ? WHERE url = ?",
+                (time.time(), url))
+        return json.loads(row[0])
+
+    def put(self, url, data):
+        """Stores the data for a finished build
+
+        Args:
+            url (str):
+                URL of the build
+            data (dict):
+                decoded JSON data describing the build
+        """
+        text = json.dumps(data)
+        if len(text) > self._max_size:
+            return
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO builds VALUES (?, ?, ?, ?)",
+                    (url, text, len(text), time.time()))
+                self._evict()
+                self._db.execute("COMMIT")
+            except sqlite3.Error:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def _evict(self):
+        """Discards the least recently used entries until the cache fits
+        within its maximum size"""
+        total = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM builds").fetchone()[0]
+        if total <= self._max_size:
+            return
+        rows = self._db.execute(
+            "SELECT url, size FROM builds ORDER BY accessed").fetchall()
+        expired = []
+        for url, size in rows:
+            if total <= self._max_size:
+                break
+            expired.append((url,))
+            total -= size
+        self._db.executemany("DELETE FROM builds WHERE url = ?", expired)
+
+    def invalidate(self, prefix=None):
+        """Discards cached build data
+
+        Args:
+            prefix (str):
+                optional URL prefix. When provided only builds with URLs
+                beginning with the prefix are discarded, otherwise the entire
+                cache is cleared.
+        """
+        with self._lock:
+            if prefix is None:
+                self._db.execute("DELETE FROM builds")
+                return
+            escaped = prefix.replace("\\", "\\\\").replace("%", "\\%") \
+                .replace("_", "\\_")
+            self._db.execute(
+                "DELETE FROM builds WHERE url LIKE ? ESCAPE '\\'",
+                (escaped + "%",))
+
+    def close(self):
+        """Closes the underlying database connection"""
+        with self._lock:
+            self._db.close()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
@@ -0,0 +1,262 @@
+"""Primitives for waiting on many running builds to complete
+
+Rather than polling each build separately, a single scheduler thread checks
+the status of every build being waited on. The status of all the builds of a
+job are loaded at once, using a single query like the following:
+
+::
+
+    http://server/job/name/api/json?tree=builds[number,building,result]{0,10}
+
+Each build is first checked once it is expected to have finished, based on
+the estimated duration reported by Jenkins, and then at exponentially
+increasing intervals.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+#: float: default minimum number of seconds between checks of a build
+DEFAULT_POLL_INTERVAL = 1
+
+#: float: default maximum number of seconds between checks of a build
+DEFAULT_MAX_POLL_INTERVAL = 60
+
+#: int: number of recent builds of a job loaded by the first check of the job
+DEFAULT_WINDOW = 10
+
+_BUILD_FIELDS = "number,building,result,timestamp,estimatedDuration"
+
+
+def _build_number(api):
+    """Gets the sequential number of a build
+
+    Args:
+        api (JenkinsAPI):
+            REST API for the build
+
+    Returns:
+        int:
+            number of the build within its job
+    """
+    number = api.url.rstrip("/").rsplit("/", 1)[1]
+    if number.isdigit():
+        return int(number)
+    # Permalinks, like "lastBuild", have to be resolved by the server
+    return api.get_api_data(fields=["number"])["number"]
+
+
+class BuildWaiter:
+    """Tracks running builds until they complete
+
+    Each tracked build is associated with a
+    :class:`concurrent.futures.Future` which is resolved with the result of
+    the build once it completes. Builds are checked on a background thread
+    which exits once every build has completed. Cancelling a future stops
+    the associated build from being tracked.
+    """
+
+    def __init__(self):
+        self._log = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        # Builds being tracked, grouped by the URLs of their jobs
+        self._jobs = {}
+        # Number of recent builds loaded by the last check of each job
+        self._windows = {}
+
+    def wait(self, api, poll_interval=DEFAULT_POLL_INTERVAL,
+             max_poll_interval=DEFAULT_MAX_POLL_INTERVAL):
+        """Starts tracking a build
+
+        Args:
+            api (JenkinsAPI):
+                REST API for the build to be tracked
+            poll_interval (float):
+                minimum number of seconds to wait between checks of the build
+            max_poll_interval (float):
+                maximum number of seconds to wait between checks of the build
+
+        Returns:
+            concurrent.futures.Future:
+                future resolved with the result of the build, like "SUCCESS",
+                once the build completes
+        """
+        pending = _PendingBuild(api, (poll_interval, max_poll_interval))
+        job_url = api.url.rstrip("/").rsplit("/", 1)[0] + "/"
+        with self._lock:
+            self._jobs.setdefault(job_url, []).append(pending)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="pyjen-build-waiter", daemon=True)
+                self._thread.start()
+            else:
+                self._wakeup.set()
+        return pending.future
+
+    def _run(self):
+        """Checks the tracked builds until all of them have completed"""
+        while True:
+            with self._lock:
+                for job_url in list(self._jobs):
+                    pending = [cur_build for cur_build in self._jobs[job_url]
+                               if not cur_build.future.done()]
+                    if pending:
+                        self._jobs[job_url] = pending
+                    else:
+                        del self._jobs[job_url]
+                if not self._jobs:
+                    self._thread = None
+                    return
+                now = time.monotonic()
+                due = {job_url: list(pending) for job_url, pending
+                       in self._jobs.items()
+                       if any(cur.due <= now for cur in pending)}
+                next_due = min(cur.due for pending in self._jobs.values()
+                               for cur in pending)
+
+            if not due:
+                self._wakeup.wait(next_due - now)
+                self._wakeup.clear()
+                continue
+
+            for job_url, pending in due.items():
+                try:
+                    self._check(job_url, pending)
+                except Exception as err:  # pylint: disable=broad-except
+                    self._log.error("Failed to check builds of %s: %s",
+                                    job_url, err)
+                    for cur_build in pending:
+                        cur_build.fail(err)
+
+    def _check(self, job_url, pending):
+        """Checks the status of several builds of the same job at once
+
+        Args:
+            job_url (str):
+                URL of the job the builds belong to
+            pending (list):
+                :class:`_PendingBuild` objects describing the builds
+        """
+        status = self._load_status(job_url, pending)
+        now = time.monotonic()
+        for cur_build in pending:
+            data = status.get(cur_build.number)
+            if data is None:
+                # The build is older than the most recent builds loaded
+                # by the job, so it has to be checked on its own
+                cur_build.api.invalidate()
+                data = cur_build.api.get_api_data(
+                    query_params="tree=" + _BUILD_FIELDS)
+
+            if data["building"] is False:
+                cur_build.complete(data)
+            elif cur_build.due <= now:
+                cur_build.reschedule(data, now)
+
+    def _load_status(self, job_url, pending):
+        """Loads the status of the recent builds of a job
+
+        The number of builds loaded is increased until all the given builds
+        are included, or all the builds of the job have been loaded.
+
+        Args:
+            job_url (str):
+                URL of the job to check
+            pending (list):
+                :class:`_PendingBuild` objects describing the builds of the
+                job being waited on
+
+        Returns:
+            dict:
+                status of each of the recent builds of the job, keyed by
+                build number
+        """
+        oldest = min(cur_build.number for cur_build in pending)
+        window = self._windows.get(job_url, DEFAULT_WINDOW)
+        job_api = pending[0].api.clone(job_url)
+        while True:
+            job_api.invalidate()
+            data = job_api.get_api_data(
+                query_params=f"tree=builds[{_BUILD_FIELDS}]{{0,{window}}}")
+            builds = data.get("builds") or []
+            if len(builds) < window or builds[-1]["number"] <= oldest:
+                break
+            window *= 2
+
+        self._windows[job_url] = window
+        return {cur_build["number"]: cur_build for cur_build in builds}
+
+
+class _PendingBuild:
+    """A build being tracked by a :class:`BuildWaiter`"""
+
+    def __init__(self, api, intervals):
+        """
+        Args:
+            api (JenkinsAPI):
+                REST API for the build
+            intervals (tuple):
+                minimum and maximum number of seconds to wait between checks
+                of the build
+        """
+        self.api = api
+        self.future = Future()
+        #: int: sequential number of the build within its job
+        self.number = _build_number(api)
+        #: float: monotonic time at which the build is next to be checked
+        self.due = time.monotonic()
+        self._intervals = intervals
+        self._backoff = intervals[0]
+
+    def reschedule(self, data, now):
+        """Schedules the next check of a build which is still running
+
+        The build is checked next once it is expected to have completed,
+        or with exponentially increasing delays once that time has passed.
+
+        Args:
+            data (dict):
+                current status of the build
+            now (float):
+                monotonic time of the last check of the build
+        """
+        min_interval, max_interval = self._intervals
+        estimate = data.get("estimatedDuration") or -1
+        remaining = (data.get("timestamp", 0) + estimate) * 0.001 - time.time()
+        if estimate > 0 and remaining > min_interval:
+            delay = remaining
+        else:
+            delay = self._backoff
+            self._backoff *= 2
+        self.due = now + min(delay, max_interval)
+
+    def complete(self, data):
+        """Reports the result of a build which has completed
+
+        Args:
+            data (dict):
+                final status of the build
+        """
+        if not self.future.set_running_or_notify_cancel():
+            return
+        self.api.invalidate()
+        self.api.seed(data, ["number", "building", "result", "timestamp",
+                             "estimatedDuration"])
+        self.future.set_result(data.get("result"))
+
+    def fail(self, error):
+        """Reports an error encountered while checking a build
+
+        Args:
+            error (Exception):
+                the error encountered
+        """
+        if self.future.set_running_or_notify_cancel():
+            self.future.set_exception(error)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
@@ -0,0 +1,461 @@
+"""Primitives for mirroring the config.xml of every job and view to disk
+
+The mirror is laid out like the Jenkins home folder, with one config.xml per
+job or view:
+
+::
+
+    <mirror>/jobs/<job>/config.xml
+    <mirror>/jobs/<folder>/jobs/<job>/config.xml
+    <mirror>/views/<view>/config.xml
+    <mirror>/views/<view>/views/<view>/config.xml
+    <mirror>/manifest.json
+
+The REST API does not report when a configuration was last modified, so
+changes are detected heuristically instead. Every job and view is listed
+with a single projected query, loading the fields which reflect their
+configuration, like their descriptions, their job properties and their
+upstream and downstream jobs:
+
+::
+
+    http://server/api/json?tree=jobs[url,_class,description,...]
+
+A fingerprint of the fields of each job is stored in the manifest, and only
+those configurations whose fingerprints differ from the previous sync are
+downloaded again. Changes to configuration settings that are not reflected
+in any of those fields, like the commands run by a build step, the URL of
+a source repository or the triggers of a job, are not detected. The time
+each configuration was downloaded is stored in the manifest as well, so
+the staleness of the mirror can be bounded by giving a maximum age to
+:py:meth:`ConfigMirror.sync` and :py:meth:`ConfigMirror.get`. Use a full
+sync to download every configuration regardless.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from urllib.parse import urlsplit, unquote, quote
+from pyjen.utils.config_store import fetch_configs, DEFAULT_FETCH_WORKERS
+from pyjen.utils.crawler import load_listings, DEFAULT_DEPTH
+from pyjen.utils.projection import tree_query
+
+#: list (str): JSON fields fingerprinted to detect changes to jobs
+JOB_FIELDS = [
+    "url", "_class", "description", "buildable", "disabled",
+    "concurrentBuild", "keepDependencies", "scm[_class]",
+    "upstreamProjects[url]", "downstreamProjects[url]",
+    "property[_class,parameterDefinitions[name,type,"
+    "defaultParameterValue[value]]]",
+]
+
+#: list (str): JSON fields fingerprinted to detect changes to views
+VIEW_FIELDS = ["name", "_class", "description", "property[_class]",
+               "jobs[url]"]
+
+_MANIFEST = "manifest.json"
+
+
+class SyncResult:
+    """Outcome of synchronizing a :class:`ConfigMirror`
+
+    Each attribute lists paths of mirrored configurations relative to the
+    root of the mirror, like "jobs/MyJob".
+    """
+
+    def __init__(self):
+        #: list (str): configurations downloaded from the server
+        self.fetched = []
+        #: list (str): configurations which were already up to date
+        self.unchanged = []
+        #: list (str): configurations removed, since the job or view no
+        #: longer exists
+        self.removed = []
+
+
+def _fingerprint(data, nested):
+    """Calculates a fingerprint of the listing for a job or view
+
+    Args:
+        data (dict):
+            JSON data describing the job or view
+        nested (str):
+            name of the field listing the nested jobs or views, which are
+            mirrored separately
+
+    Returns:
+        str:
+            hash of the data, excluding any nested jobs or views
+    """
+    content = {key: value for key, value in data.items() if key != nested}
+    text = json.dumps(content, sort_keys=True)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _view_tree(depth):
+    """Generates a tree expression listing views nested within a view
+
+    Args:
+        depth (int):
+            number of levels of nesting to expand. Views at the deepest level
+            only report the names of their children, so the caller can tell
+            whether they need to be expanded further.
+
+    Returns:
+        str:
+            tree expression describing nested views
+    """
+    if depth <= 0:
+        return "views[name]"
+    return f"views[{','.join(VIEW_FIELDS)},{_view_tree(depth - 1)}]"
+
+
+def _collect_views(parent_url, data, depth, entries):
+    """Collects the views listed in data loaded with :py:func:`_view_tree`
+
+    Args:
+        parent_url (str):
+            URL of the dashboard or view the data was loaded from
+        data (dict):
+            JSON data for the dashboard or view
+        depth (int):
+            depth of the tree expression used to load the data
+        entries (dict):
+            2-tuples containing the URL and fingerprint of each view, keyed
+            by their URLs, updated with all views found in the data
+
+    Returns:
+        list (str):
+            URLs of views whose children were not loaded because they are
+            nested deeper than the given depth
+    """
+    retval = []
+    for cur_view in data.get("views", []):
+        # The URL reported for the primary view is the URL of its parent,
+        # which can not be used to load its configuration
+        url = parent_url + "view/" + quote(cur_view["name"]) + "/"
+        entries[url] = (url, _fingerprint(cur_view, "views"))
+        if "views" not in cur_view:
+            continue
+        if depth > 1:
+            retval.extend(_collect_views(url, cur_view, depth - 1, entries))
+        elif cur_view["views"]:
+            retval.append(url)
+    return retval
+
+
+def relative_path(root_url, url):
+    """Converts the URL of a job or view to its path within the mirror
+
+    Args:
+        root_url (str):
+            URL of the main Jenkins dashboard
+        url (str):
+            URL of the job or view. Only the path of the URL is used, so
+            URLs using other host names for the same server are supported.
+
+    Returns:
+        str:
+            path relative to the root of the mirror, like
+            "jobs/MyFolder/jobs/MyJob", or None if the URL does not refer to a
+            job or view
+    """
+    root = urlsplit(root_url).path.rstrip("/")
+    path = urlsplit(url).path
+    if not path.startswith(root + "/"):
+        return None
+    parts = [unquote(cur) for cur in path[len(root):].split("/") if cur]
+    if len(parts) < 2 or len(parts) % 2:
+        return None
+    pairs = list(zip(parts[::2], parts[1::2]))
+    if any(cur_type == "job" for cur_type, _ in pairs):
+        # jobs may be addressed through the views containing them
+        pairs = [cur for cur in pairs if cur[0] != "view"]
+    if any(cur_type not in ("job", "view") for cur_type, _ in pairs):
+        return None
+    return "/".join(f"{cur_type}s/{name}" for cur_type, name in pairs)
+
+
+class ConfigMirror:
+    """Local copy of the config.xml of every job and view on a server
+
+    See :py:meth:`~.jenkins.Jenkins.sync_config_mirror` for details.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str):
+                folder to store the mirror in. Created if it doesn't exist.
+        """
+        self._log = logging.getLogger(__name__)
+        self._path = os.path.abspath(path)
+        self._lock = threading.Lock()
+        # Fingerprint of every mirrored configuration, and the time it was
+        # downloaded, keyed by its path relative to the root of the mirror
+        self._manifest = {}
+        manifest_file = os.path.join(self._path, _MANIFEST)
+        if os.path.exists(manifest_file):
+            with open(manifest_file, encoding="utf-8") as handle:
+                self._manifest = json.load(handle)
+
+    @property
+    def path(self):
+        """str: absolute path of the folder containing the mirror"""
+        return self._path
+
+    def _file(self, key):
+        """Generates the path of the file a configuration is stored in
+
+        Args:
+            key (str):
+                path of the configuration relative to the root of the mirror
+
+        Returns:
+            str:
+                absolute path of the config.xml file
+        """
+        return os.path.join(self._path, *key.split("/"), "config.xml")
+
+    def _save_manifest(self):
+        """Writes the manifest to disk. Must be called with the lock held."""
+        os.makedirs(self._path, exist_ok=True)
+        manifest_file = os.path.join(self._path, _MANIFEST)
+        temp_file = manifest_file + ".tmp"
+        with open(temp_file, "w", encoding="utf-8") as handle:
+            json.dump(self._manifest, handle, indent=1, sort_keys=True)
+        os.replace(temp_file, manifest_file)
+
+    def get(self, root_url, url, max_age=None):
+        """Gets the mirrored configuration for a job or view
+
+        Args:
+            root_url (str):
+                URL of the main Jenkins dashboard
+            url (str):
+                URL of the job or view
+            max_age (float):
+                optional maximum number of seconds since the configuration
+                was downloaded. Older configurations are not returned.
+
+        Returns:
+            str:
+                the mirrored config.xml, or None if the job or view has not
+                been mirrored, or its mirrored copy is too old
+        """
+        key = relative_path(root_url, url)
+        with self._lock:
+            if key is None or key not in self._manifest:
+                return None
+            if max_age is not None and \
+                    time.time() - self._manifest[key]["time"] > max_age:
+                return None
+        try:
+            with open(self._file(key), encoding="utf-8") as handle:
+                return handle.read()
+        except FileNotFoundError:
+            return None
+
+    def refresh(self, root_url, url, text):
+        """Replaces the mirrored configuration for a job or view
+
+        Used to store a configuration which was just loaded from the server,
+        resetting its age. Ignored if the job or view has not been mirrored.
+
+        Args:
+            root_url (str):
+                URL of the main Jenkins dashboard
+            url (str):
+                URL of the job or view
+            text (str):
+                content of the config.xml
+        """
+        key = relative_path(root_url, url)
+        with self._lock:
+            if key not in self._manifest:
+                return
+            self._write(key, text)
+            self._manifest[key]["time"] = time.time()
+            self._save_manifest()
+
+    def discard(self, root_url, url):
+        """Marks the mirrored configuration for a job or view as out of date
+
+        It will no longer be served from the mirror, and will be downloaded
+        again by the next sync.
+
+        Args:
+            root_url (str):
+                URL of the main Jenkins dashboard
+            url (str):
+                URL of the job or view
+        """
+        key = relative_path(root_url, url)
+        with self._lock:
+            if self._manifest.pop(key, None) is not None:
+                self._save_manifest()
+
+    def _is_current(self, key, fingerprint, max_age):
+        """Checks whether a mirrored configuration appears to be up to date.
+        Must be called with the lock held.
+
+        Args:
+            key (str):
+                path of the configuration relative to the root of the mirror
+            fingerprint (str):
+                fingerprint of the current listing for the job or view
+            max_age (float):
+                optional maximum number of seconds since the configuration
+                was downloaded
+
+        Returns:
+            bool:
+                True if the configuration does not need to be downloaded again
+        """
+        entry = self._manifest.get(key)
+        if entry is None or entry["fingerprint"] != fingerprint:
+            return False
+        if max_age is not None and time.time() - entry["time"] > max_age:
+            return False
+        return os.path.exists(self._file(key))
+
+    def _list(self, api, workers, depth):
+        """Lists every job and view on the server
+
+        Args:
+            api (JenkinsAPI):
+                REST API for the main Jenkins dashboard
+            workers (int):
+                maximum number of concurrent queries
+            depth (int):
+                number of levels of nested jobs and views to load with each
+                query
+
+        Returns:
+            dict:
+                2-tuples containing the URL and fingerprint of every job and
+                view, keyed by their paths relative to the root of the mirror
+        """
+        retval = {}
+        listings = load_listings(api, depth, workers, JOB_FIELDS)
+        for cur_listing in listings.values():
+            for cur_job in cur_listing:
+                key = relative_path(api.root_url, cur_job["url"])
+                if key is not None:
+                    retval[key] = \
+                        (cur_job["url"], _fingerprint(cur_job, "jobs"))
+
+        # Views nested within other views, like those provided by the nested
+        # view plugin, are loaded the same way as jobs nested within folders
+        views = {}
+        query = tree_query([_view_tree(depth)])
+        pending = [api.root_url]
+        while pending:
+            url = pending.pop()
+            data = api.get_api_data(target_url=url, query_params=query)
+            pending.extend(_collect_views(url, data, depth, views))
+        for url, entry in views.items():
+            retval[relative_path(api.root_url, url)] = entry
+        return retval
+
+    def sync(self, api, full=False, workers=DEFAULT_FETCH_WORKERS,
+             depth=DEFAULT_DEPTH, max_age=None):
+        """Updates the mirror to match the configurations on the server
+
+        Args:
+            api (JenkinsAPI):
+                REST API for the main Jenkins dashboard
+            full (bool):
+                True to download every configuration, False to only download
+                those which appear to have changed since the last sync
+            workers (int):
+                maximum number of concurrent downloads
+            depth (int):
+                number of levels of nested jobs and views to load with each
+                query
+            max_age (float):
+                optional maximum number of seconds since a configuration was
+                downloaded. Older configurations are downloaded again, even
+                if they appear to be unchanged.
+
+        Returns:
+            SyncResult:
+                summary of the changes made to the mirror
+        """
+        retval = SyncResult()
+        entries = self._list(api, workers, depth)
+
+        with self._lock:
+            for key, (_, fingerprint) in sorted(entries.items()):
+                if not full and self._is_current(key, fingerprint, max_age):
+                    retval.unchanged.append(key)
+                else:
+                    retval.fetched.append(key)
+            removed = [key for key in self._manifest if key not in entries]
+
+        self._log.debug("Downloading %s of %s configurations",
+                        len(retval.fetched), len(entries))
+        now = time.time()
+        # The manifest is only updated once every download has succeeded, so
+        # a failed sync leaves the mirror as it was
+        documents = fetch_configs(
+            [api.clone(entries[key][0]) for key in retval.fetched], workers,
+            missing_ok=True)
+
+        with self._lock:
+            fetched = []
+            for key, cur_doc in zip(retval.fetched, documents):
+                if cur_doc is None:
+                    # Deleted after the listing was loaded
+                    if key in self._manifest:
+                        removed.append(key)
+                    continue
+                self._write(key, cur_doc.text)
+                self._manifest[key] = {"fingerprint": entries[key][1],
+                                       "time": now}
+                fetched.append(key)
+            retval.fetched = fetched
+            retval.removed = sorted(removed)
+            for key in retval.removed:
+                self._remove(key)
+                self._manifest.pop(key, None)
+            self._save_manifest()
+        return retval
+
+    def _write(self, key, text):
+        """Stores a configuration in the mirror
+
+        Args:
+            key (str):
+                path of the configuration relative to the root of the mirror
+            text (str):
+                content of the config.xml
+        """
+        file_name = self._file(key)
+        os.makedirs(os.path.dirname(file_name), exist_ok=True)
+        temp_file = file_name + ".tmp"
+        with open(temp_file, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        os.replace(temp_file, file_name)
+
+    def _remove(self, key):
+        """Removes a configuration from the mirror, along with any folders
+        left empty
+
+        Args:
+            key (str):
+                path of the configuration relative to the root of the mirror
+        """
+        file_name = self._file(key)
+        try:
+            os.remove(file_name)
+            os.removedirs(os.path.dirname(file_name))
+        except OSError:
+            # The folder still contains the configurations of nested jobs
+            pass
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
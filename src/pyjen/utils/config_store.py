@@ -0,0 +1,134 @@
+"""Primitives for loading the config.xml of many jobs at once
+
+The configurations are downloaded concurrently, and each distinct document
+is stored only once, keyed by a hash of its content. Jobs cloned from the
+same template often have identical configurations, in which case they all
+share a single copy of the text, which is parsed at most once. Documents are
+only parsed when their content is first accessed, and each job takes a
+private copy of the parsed XML tree before using it.
+"""
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.exceptions import HTTPError
+from pyjen.utils import xml_backend
+
+#: int: default maximum number of configurations downloaded concurrently
+DEFAULT_FETCH_WORKERS = 8
+
+
+class ConfigDocument:
+    """A distinct config.xml document, shared by every job using it"""
+
+    def __init__(self, text, digest):
+        """
+        Args:
+            text (str):
+                raw XML content of the document
+            digest (str):
+                hash of the content of the document
+        """
+        self._text = text
+        self._digest = digest
+        self._root = None
+        self._lock = threading.Lock()
+
+    @property
+    def text(self):
+        """str: raw XML content of the document"""
+        return self._text
+
+    @property
+    def digest(self):
+        """str: SHA-256 hash of the content of the document"""
+        return self._digest
+
+    @property
+    def root(self):
+        """xml.etree.ElementTree.Element: the parsed document, shared by every
+        job using it
+
+        Parsed when first accessed. Must not be modified.
+        """
+        with self._lock:
+            if self._root is None:
+                self._root = xml_backend.fromstring(self._text)
+            return self._root
+
+
+class ConfigStore:
+    """Collection of config.xml documents, de-duplicated by content"""
+
+    def __init__(self):
+        self._documents = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._documents)
+
+    def add(self, text):
+        """Adds a document to the store
+
+        Args:
+            text (str):
+                raw XML content of the document
+
+        Returns:
+            ConfigDocument:
+                the stored document with the given content, which is shared
+                with any document with identical content added previously
+        """
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        with self._lock:
+            retval = self._documents.get(digest)
+            if retval is None:
+                retval = ConfigDocument(text, digest)
+                self._documents[digest] = retval
+            return retval
+
+
+def fetch_configs(apis, workers=DEFAULT_FETCH_WORKERS, store=None,
+                  missing_ok=False):
+    """Downloads the config.xml for several Jenkins objects concurrently
+
+    Args:
+        apis (list):
+            :class:`~.jenkins_api.JenkinsAPI` objects for the REST API of each
+            Jenkins object, typically a job
+        workers (int):
+            maximum number of documents downloaded concurrently
+        store (ConfigStore):
+            optional store to add the documents to, allowing documents to be
+            shared across several calls
+        missing_ok (bool):
+            True to report objects which no longer exist, for example
+            because they were deleted after being listed, as None rather
+            than raising an error
+
+    Returns:
+        list (ConfigDocument):
+            the configuration of each object, in the same order as the
+            given APIs
+    """
+    if store is None:
+        store = ConfigStore()
+    apis = list(apis)
+    if not apis:
+        return []
+
+    def _fetch(api):
+        try:
+            return store.add(api.get_text("/config.xml"))
+        except HTTPError as err:
+            if missing_ok and \
+                    err.response.status_code == requests.codes.NOT_FOUND:
+                return None
+            raise
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(apis))) as pool:
+        return list(pool.map(_fetch, apis))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
@@ -0,0 +1,177 @@
+"""Primitives for locating jobs nested within other jobs, like folders
+
+Rather than loading the contents of each folder with a separate request,
+the crawler loads several levels of nested jobs at once using nested "tree"
+queries like the following:
+
+::
+
+    http://server/api/json?tree=jobs[name,url,color,_class,jobs[...]]
+
+Folders nested deeper than the query depth are loaded with additional
+queries, run concurrently.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pyjen.job import Job
+from pyjen.utils.projection import tree_query
+
+#: int: default number of levels of nested jobs loaded by each query
+DEFAULT_DEPTH = 5
+
+#: int: default maximum number of queries run concurrently
+DEFAULT_WORKERS = 4
+
+#: list (str): JSON fields loaded for every job found by the crawler
+LISTING_FIELDS = ["name", "url", "color", "_class"]
+
+
+def crawl_jobs(api, depth=DEFAULT_DEPTH, max_workers=DEFAULT_WORKERS):
+    """Locates all jobs contained within a Jenkins object, recursively
+
+    Args:
+        api (JenkinsAPI):
+            REST API for the Jenkins object to search, like the main dashboard
+            or a folder
+        depth (int):
+            number of levels of nested jobs to load with each query
+        max_workers (int):
+            maximum number of concurrent queries used to load jobs nested
+            deeper than the given depth
+
+    Returns:
+        tuple:
+            2-tuple containing the list of all jobs found, with each container
+            followed by its children, and a dictionary mapping the URL of
+            every container to the list of jobs it directly contains. The
+            URL of the object being searched maps to its top level jobs.
+    """
+    listings = load_listings(api, max(depth, 1), max_workers)
+
+    jobs = []
+    children = {api.url: []}
+    stack = [(api.url, iter(listings.get(api.url, [])))]
+    while stack:
+        parent_url, remaining = stack[-1]
+        cur_listing = next(remaining, None)
+        if cur_listing is None:
+            stack.pop()
+            continue
+        seed = {key: value for key, value in cur_listing.items()
+                if key != "jobs"}
+        cur_job = Job.instantiate(seed, api)
+        jobs.append(cur_job)
+        children[parent_url].append(cur_job)
+        if cur_listing["url"] in listings:
+            children[cur_listing["url"]] = []
+            stack.append(
+                (cur_listing["url"], iter(listings[cur_listing["url"]])))
+
+    return jobs, children
+
+
+def load_listings(api, depth=DEFAULT_DEPTH, max_workers=DEFAULT_WORKERS,
+                  fields=None):
+    """Loads the listings of all jobs contained within a Jenkins object
+
+    Args:
+        api (JenkinsAPI):
+            REST API for the Jenkins object to search
+        depth (int):
+            number of levels of nested jobs to load with each query
+        max_workers (int):
+            maximum number of concurrent queries used to load jobs nested
+            deeper than the given depth
+        fields (list):
+            optional JSON fields or tree expressions to load for every job.
+            Defaults to :py:data:`LISTING_FIELDS`. The URL of each job is
+            always loaded.
+
+    Returns:
+        dict:
+            mapping of the URL of every container found to the listings of
+            the jobs it directly contains
+    """
+    log = logging.getLogger(__name__)
+    fields = list(fields or LISTING_FIELDS)
+    if "url" not in fields:
+        fields.insert(0, "url")
+    query = tree_query([_job_tree(depth, fields)])
+    retval = {}
+
+    def load(url):
+        data = api.get_api_data(target_url=url, query_params=query)
+        return _collect(url, data, depth, retval)
+
+    pending = load(api.url)
+    if pending:
+        log.debug("Loading %s deeply nested containers", len(pending))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(load, cur_url) for cur_url in pending}
+            while futures:
+                done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                for cur_future in done:
+                    for cur_url in cur_future.result():
+                        futures.add(pool.submit(load, cur_url))
+    return retval
+
+
+def _job_tree(depth, fields=None):
+    """Generates a tree expression listing jobs nested within a container
+
+    Args:
+        depth (int):
+            number of levels of nesting to expand. Jobs at the deepest level
+            only report the URLs of their children, so the caller can tell
+            whether they need to be expanded further.
+        fields (list):
+            JSON fields to load for every job. Defaults to
+            :py:data:`LISTING_FIELDS`.
+
+    Returns:
+        str:
+            tree expression describing nested jobs
+    """
+    if depth <= 0:
+        return "jobs[url]"
+    fields = fields or LISTING_FIELDS
+    return f"jobs[{','.join(fields)},{_job_tree(depth - 1, fields)}]"
+
+
+def _collect(url, data, depth, listings):
+    """Collects the job listings from data loaded with :py:func:`_job_tree`
+
+    Args:
+        url (str):
+            URL of the container the data was loaded from
+        data (dict):
+            JSON data for the container, loaded with a tree expression of the
+            given depth
+        depth (int):
+            depth of the tree expression used to load the data
+        listings (dict):
+            mapping of container URLs to the listings of the jobs they
+            contain, updated with all containers found in the data
+
+    Returns:
+        list (str):
+            URLs of containers whose children were not loaded because they
+            are nested deeper than the given depth
+    """
+    retval = []
+    listings[url] = data.get("jobs", [])
+    for cur_job in listings[url]:
+        if "jobs" not in cur_job:
+            continue
+        if depth > 1:
+            retval.extend(
+                _collect(cur_job["url"], cur_job, depth - 1, listings))
+        elif cur_job["jobs"]:
+            retval.append(cur_job["url"])
+        else:
+            listings[cur_job["url"]] = []
+    return retval
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
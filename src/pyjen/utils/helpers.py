@@ -1,5 +1,6 @@
 """Misc helper methods shared across the library"""
 import json
+from urllib.parse import quote
 
 
 def create_view(api, view_name, view_class):
@@ -59,3 +60,43 @@ def create_job(api, job_name, job_class):
     }
 
     api.post(api.url + 'createItem', args)
+
+
+def node_url(root_url, name):
+    """Generates the URL for a build agent
+
+    Args:
+        root_url (str):
+            URL of the main Jenkins dashboard, with a trailing slash
+        name (str):
+            display name of the build agent
+
+    Returns:
+        str:
+            URL of the build agent, with a trailing slash
+    """
+    if name == 'master':
+        return root_url + 'computer/(master)/'
+    if name == 'Built-In Node':
+        return root_url + 'computer/(built-in)/'
+    return root_url + 'computer/' + quote(name, safe='') + '/'
+
+
+def view_url(json_data):
+    """Determines the URL of a view from the data describing it
+
+    Args:
+        json_data (dict):
+            data describing the view in a list of views, containing at least
+            its name and URL
+
+    Returns:
+        str:
+            URL of the view. The URL reported for the primary view of a
+            dashboard is the URL of the dashboard itself, so a URL referring
+            to the view is generated instead.
+    """
+    retval = json_data["url"]
+    if '/view/' not in retval:
+        retval = retval + "view/" + quote(json_data["name"], safe='')
+    return retval
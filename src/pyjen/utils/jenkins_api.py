@@ -2,31 +2,150 @@
 from urllib.parse import urljoin
 import logging
 import json
-from xml.etree import ElementTree
+import threading
+from copy import deepcopy
+import requests
 from requests.exceptions import InvalidHeader
+from pyjen.utils import xml_backend
+from pyjen.utils.api_state import ServerState, SeedData
+from pyjen.utils.response_cache import ResponseCache
+from pyjen.utils.build_cache import BuildCache
+from pyjen.utils.config_mirror import ConfigMirror
+from pyjen.utils.projection import top_level_field, tree_query
 
 
-class JenkinsAPI:
+class ServerContext(ServerState):
+    """Connection state shared by all REST API objects for one Jenkins server
+
+    Every :class:`JenkinsAPI` object cloned from another one shares the same
+    context, so server-wide metadata like the CSRF crumb and the Jenkins
+    version only need to be loaded once per server rather than once per
+    object. All members are safe to use from multiple threads.
+    """
+
+    def __init__(self, session):
+        """
+        Args:
+            session (requests.Session):
+                HTTP session to use for interacting with the Jenkins REST API
+        """
+        super().__init__()
+        self._session = session
+        self._lock = threading.RLock()
+        self._jenkins_headers_cache = None
+        self.response_cache = None
+        self.build_cache = None
+        self.config_mirror = None
+        self.projections = False
+
+    @property
+    def session(self):
+        """requests.Session: HTTP session shared by all API objects"""
+        return self._session
+
+    @property
+    def lock(self):
+        """threading.RLock: lock guarding the shared state of this context"""
+        return self._lock
+
+    def modified(self):
+        """Records that a change has been made to the server
+
+        Used to detect when data loaded ahead of time by API objects may no
+        longer reflect the state of the server. Any cached responses are
+        discarded, since a change to one object may be reflected in the data
+        of others, like the job listings of its parent folder or views.
+        """
+        super().modified()
+        cache = self.response_cache
+        if cache is not None:
+            cache.invalidate()
+
+    def get_headers(self, root_url):
+        """Loads the HTTP headers from the main Jenkins dashboard
+
+        Args:
+            root_url (str):
+                URL of the main Jenkins dashboard
+
+        Returns:
+            dict:
+                HTTP headers returned by the dashboard
+        """
+        with self._lock:
+            if self._jenkins_headers_cache is None:
+                req = self._session.get(urljoin(root_url, "api/python"))
+                req.raise_for_status()
+                self._jenkins_headers_cache = req.headers
+            return self._jenkins_headers_cache
+
+    def get_crumb(self, root_url):
+        """Loads the CSRF crumb used to authorize POST operations
+
+        Args:
+            root_url (str):
+                URL of the main Jenkins dashboard
+
+        Returns:
+            dict:
+                HTTP header containing the crumb, or an empty string if CSRF
+                protection has been disabled on the server
+        """
+        with self._lock:
+            if self.crumbs.value is None:
+                # Seeing as how the crumb for a given Jenkins session is
+                # static, we cache the results to prevent having to hit the
+                # API unnecessarily
+                req = self._session.get(self.crumbs.url(root_url))
+                data = None
+                if req.status_code != 404:
+                    req.raise_for_status()
+                    data = req.json()
+                self.crumbs.store(req.status_code, data)
+            return self.crumbs.value
+
+    def invalidate_crumb(self, crumb):
+        """Discards the cached crumb so it gets reloaded on next use
+
+        Args:
+            crumb (dict):
+                the crumb that was rejected by the server. See
+                :py:meth:`~.api_state.CrumbCache.invalidate`.
+        """
+        with self._lock:
+            self.crumbs.invalidate(crumb)
+
+
+class JenkinsAPI:  # pylint: disable=too-many-instance-attributes
     """Abstraction around the raw Jenkins REST API"""
 
-    def __init__(self, url, session):
+    def __init__(self, url, session, context=None):
         """
         Args:
             url (str):
                 URL of the Jenkins API endpoint to manage
             session (requests.Session):
                 HTTP session to use for interacting with the Jenkins REST API
+            context (ServerContext):
+                optional connection state shared with other API objects
+                connected to the same server. A new context is created when
+                not provided.
         """
         self._log = logging.getLogger(__name__)
-        self._session = session
+        self._context = context or ServerContext(session)
+        self._session = self._context.session
 
         self._url = url.rstrip("/\\") + "/"
         self._jenkins_root_url = self._url
 
-        # Internal data members used for caching certain API response data
-        # to improve performance
-        self._crumb_cache = None
-        self._jenkins_headers_cache = None
+        # JSON data for this endpoint that was loaded ahead of time. See the
+        # seed() method.
+        self._seed = SeedData(self._context)
+
+        # Top level JSON fields which may still change once this endpoint
+        # reports it has finished building, or None if the data for this
+        # endpoint is never persisted. See the persist_finished() method.
+        self._volatile_fields = None
 
     def __str__(self):
         return self.url
@@ -45,10 +164,192 @@ class JenkinsAPI:
             JenkinsAPI:
                 reference to the newly created API interface
         """
-        retval = JenkinsAPI(api_url, self._session)
+        retval = JenkinsAPI(api_url, self._session, self._context)
         retval._jenkins_root_url = self._jenkins_root_url  # pylint: disable=protected-access
         return retval
 
+    def enable_cache(self, ttl=30, max_size=1000):
+        """Enables caching of REST API responses for this server
+
+        Once enabled, JSON data loaded by :py:meth:`get_api_data` is reused by
+        all API objects connected to the same server until it expires, is
+        evicted, or is invalidated. Cached data for an object is invalidated
+        automatically after any POST operation made through that object.
+
+        Args:
+            ttl (float):
+                number of seconds a cached response remains valid
+            max_size (int):
+                maximum number of responses to retain
+        """
+        self._context.response_cache = ResponseCache(ttl, max_size)
+
+    def disable_cache(self):
+        """Disables caching of REST API responses for this server"""
+        self._context.response_cache = None
+
+    def enable_build_cache(self, path, max_size=100 * 1024 * 1024):
+        """Enables persistent caching of the data for finished builds
+
+        Once enabled, the data for endpoints marked with
+        :py:meth:`persist_finished` is stored in an SQLite database once it
+        reports that it is no longer building, and is reused from there by
+        all API objects connected to the same server, across sessions.
+
+        Args:
+            path (str):
+                path to the SQLite database file to store the cache in
+            max_size (int):
+                maximum number of bytes of JSON data to retain
+        """
+        self._context.build_cache = BuildCache(path, max_size)
+
+    def disable_build_cache(self):
+        """Disables persistent caching of the data for finished builds"""
+        cache = self._context.build_cache
+        self._context.build_cache = None
+        if cache is not None:
+            cache.close()
+
+    def enable_config_mirror(self, path):
+        """Serves the configurations of jobs and views from a local mirror
+
+        Once enabled, the config.xml of any job or view found in the mirror
+        may be read from it using :py:meth:`get_mirrored_config`. The
+        mirrored configuration of an object is discarded after any change
+        made through it.
+
+        Args:
+            path (str):
+                folder containing the mirror
+
+        Returns:
+            ConfigMirror:
+                the mirror, which may be used to synchronize it with the
+                server
+        """
+        self._context.config_mirror = ConfigMirror(path)
+        return self._context.config_mirror
+
+    def disable_config_mirror(self):
+        """Stops serving configurations from a local mirror"""
+        self._context.config_mirror = None
+
+    def persist_finished(self, volatile_fields=()):
+        """Allows the data for this endpoint to be persisted once finished
+
+        Intended for endpoints describing builds, which never change once
+        they report that they are no longer building. See
+        :py:meth:`enable_build_cache` for details.
+
+        Args:
+            volatile_fields (list):
+                names of top level JSON fields which may still change after
+                the endpoint has finished building. Requests for any of these
+                fields, and requests which do not list the fields they need,
+                always bypass the persistent cache.
+        """
+        self._volatile_fields = frozenset(volatile_fields)
+
+    def _get_build_cache(self, fields):
+        """Gets the persistent cache to use when loading data for this endpoint
+
+        Args:
+            fields (list):
+                JSON field names or tree expressions being requested, if any
+
+        Returns:
+            BuildCache:
+                the persistent cache for this server, or None if data for
+                the given fields should not be persisted
+        """
+        cache = self._context.build_cache
+        if cache is None or self._volatile_fields is None:
+            return None
+        for cur_field in fields or ():
+            if top_level_field(cur_field) in self._volatile_fields:
+                return None
+        return cache
+
+    @property
+    def projections(self):
+        """bool: whether JSON data is loaded using minimal tree queries
+
+        When enabled, data requested with an explicit list of fields (see
+        :py:meth:`get_api_data`) is loaded using a "tree" query parameter
+        which only returns those fields. Disabled by default. Affects all API
+        objects connected to the same server.
+        """
+        return self._context.projections
+
+    @projections.setter
+    def projections(self, value):
+        self._context.projections = value
+
+    def seed(self, data, fields=None):
+        """Provides JSON data for this endpoint loaded ahead of time
+
+        Seeded data is used to satisfy requests for specific fields without
+        contacting the server. Seeded data is discarded when it is invalidated
+        (see :py:meth:`invalidate`), and is ignored after a fixed period of
+        time or once any change has been made to the server through PyJen.
+        The only exceptions are the fields listed in
+        :py:data:`~.api_state.IDENTITY_FIELDS` which remain valid for the
+        lifetime of this object.
+
+        Args:
+            data (dict):
+                JSON data describing this endpoint. Merged with any data
+                seeded previously.
+            fields (list):
+                optional list of tree expressions used to load the data. When
+                not provided, only requests for whole top-level fields found in
+                the data can be satisfied by it.
+        """
+        self._seed.update(data, fields)
+
+    def fetch(self, fields):
+        """Loads specific fields for this endpoint with a single request
+
+        The loaded data is seeded into this object so later requests for any
+        of the given fields are served without contacting the server.
+
+        Args:
+            fields (list):
+                JSON field names or tree expressions to load
+
+        Returns:
+            dict:
+                the JSON data loaded from the server
+        """
+        retval = self.get_api_data(query_params=tree_query(fields))
+        self.seed(retval, fields)
+        return retval
+
+    def invalidate(self):
+        """Discards all cached response data for this REST API endpoint
+
+        Data cached for child objects, like the builds of a job, are
+        discarded as well, as is any data seeded into this object.
+        """
+        self._seed.clear()
+        cache = self._context.response_cache
+        if cache is not None:
+            cache.invalidate(self.url)
+        build_cache = self._context.build_cache
+        if build_cache is not None and self._volatile_fields is not None:
+            build_cache.invalidate(self.url)
+
+    def refresh(self):
+        """Discards all cached data for this endpoint and reloads it
+
+        Returns:
+            dict:
+                The freshly loaded Jenkins attributes for this endpoint
+        """
+        self.invalidate()
+        return self.get_api_data()
+
     @property
     def url(self):
         """str: the URL for the REST API endpoint managed by this object
@@ -76,14 +377,7 @@ class JenkinsAPI:
         hosting the REST API, including details such as version number, current
         UI theme, and others.
         """
-        if self._jenkins_headers_cache is None:
-            temp_path = urljoin(self.root_url, "api/python")
-            req = self._session.get(temp_path)
-            req.raise_for_status()
-
-            self._jenkins_headers_cache = req.headers
-
-        return self._jenkins_headers_cache
+        return self._context.get_headers(self.root_url)
 
     @property
     def jenkins_version(self):
@@ -100,7 +394,7 @@ class JenkinsAPI:
             int(i) for i in self.jenkins_headers['x-jenkins'].split(".")
         )
 
-    def get_api_data(self, target_url=None, query_params=None):
+    def get_api_data(self, target_url=None, query_params=None, fields=None):
         """retrieves the Jenkins API specific data from the specified URL
 
         Args:
@@ -110,12 +404,35 @@ class JenkinsAPI:
                 object
             query_params (str):
                 optional set of query parameters to customize the returned data
+            fields (list):
+                optional list of JSON field names or tree expressions the
+                caller needs. Requests for the default 'url' of this object may
+                then be satisfied by seeded data (see :py:meth:`seed`), or
+                may be loaded using a minimal tree query when
+                :py:attr:`projections` are enabled. Ignored when query
+                parameters are provided.
 
         Returns:
             dict:
                 The set of Jenkins attributes, converted to Python objects,
                 associated with the given URL.
         """
+        build_cache = None
+        if target_url is None and query_params is None:
+            if fields and self._seed.covers(fields):
+                return deepcopy(self._seed.data)
+            build_cache = self._get_build_cache(fields)
+            # The cached data is stale for any volatile fields, so it is only
+            # used for requests which don't need them
+            if build_cache is not None and \
+                    (fields or not self._volatile_fields):
+                retval = build_cache.get(self.url)
+                if retval is not None:
+                    return retval
+
+        if fields and query_params is None and self._context.projections:
+            query_params = tree_query(fields)
+
         if target_url is None:
             target_url = self.url
 
@@ -125,10 +442,50 @@ class JenkinsAPI:
             # TODO: Update this to pass 'params' key to get method
             temp_url += "?" + query_params
 
+        cache = self._context.response_cache
+        if cache is not None:
+            retval = cache.get(temp_url)
+            if retval is not None:
+                return retval
+
         req = self._session.get(temp_url)
         req.raise_for_status()
         retval = req.json()
         self._log.debug(json.dumps(retval, indent=4))
+
+        if cache is not None:
+            cache.put(temp_url, retval)
+        if build_cache is not None and query_params is None and \
+                retval.get("building") is False:
+            build_cache.put(self.url, retval)
+        return retval
+
+    def get_mirrored_config(self, max_age=None):
+        """Gets the config.xml for this endpoint, from the local mirror if
+        possible
+
+        Mirrored configurations may be out of date, so they must only be used
+        for read-only purposes. Objects which modify configurations always
+        load them from the server. See :py:meth:`enable_config_mirror`.
+
+        Args:
+            max_age (float):
+                optional maximum number of seconds since the mirrored
+                configuration was downloaded. Older configurations are loaded
+                from the server again, and the mirror is updated.
+
+        Returns:
+            str:
+                the mirrored configuration, or the configuration loaded from
+                the server if there is no sufficiently recent mirrored copy
+        """
+        mirror = self._context.config_mirror
+        if mirror is None:
+            return self.get_text("/config.xml")
+        retval = mirror.get(self.root_url, self.url, max_age)
+        if retval is None:
+            retval = self.get_text("/config.xml")
+            mirror.refresh(self.root_url, self.url, retval)
         return retval
 
     def get_text(self, path=None, params=None):
@@ -154,6 +511,41 @@ class JenkinsAPI:
 
         return req.text
 
+    def get_stream(self, path=None, params=None, headers=None):
+        """Starts loading raw data from a Jenkins URL without reading it
+
+        Useful for loading large amounts of data, like console logs, in
+        manageable chunks. The caller is responsible for closing the returned
+        response.
+
+        Args:
+            path (str):
+                optional extension path to append to the root URL managed by
+                this object when performing the get operation
+            params (dict):
+                optional query parameters to be passed to the request
+            headers (dict):
+                optional HTTP headers to be passed to the request, like a
+                "Range" header requesting part of the data
+
+        Returns:
+            requests.Response:
+                HTTP response whose headers have been received, but whose
+                content has yet to be read
+        """
+        temp_url = self.url
+        if path is not None:
+            temp_url = urljoin(temp_url, path.lstrip("/\\"))
+
+        req = self._session.get(
+            temp_url, params=params, headers=headers, stream=True)
+        try:
+            req.raise_for_status()
+        except requests.HTTPError:
+            req.close()
+            raise
+        return req
+
     def get_api_xml(self, path=None, params=None):
         """Gets api XML data from a given REST API endpoint
 
@@ -173,7 +565,7 @@ class JenkinsAPI:
             temp_url = urljoin(temp_url, path.lstrip("/\\"))
         temp_url += "/api/xml"
         text = self.get_text(temp_url, params)
-        return ElementTree.fromstring(text)
+        return xml_backend.fromstring(text)
 
     def post(self, target_url, args=None):
         """sends data to or triggers an operation via a Jenkins URL
@@ -188,6 +580,10 @@ class JenkinsAPI:
         Returns:
             requests.Response:
                 reference to the response data returned by the post request
+
+        NOTE: Cached response data for the endpoint managed by this object,
+        and any other responses cached for the server, are discarded by this
+        operation. See :py:meth:`invalidate`.
         """
         if args and "headers" in args:
             temp_headers = args["headers"]
@@ -195,14 +591,36 @@ class JenkinsAPI:
         else:
             temp_headers = {}
 
-        if self.jenkins_version >= (2, 0, 0) and self.crumb:
-            temp_headers.update(self.crumb)
+        crumb = self.crumb if self.jenkins_version >= (2, 0, 0) else None
+        if crumb:
+            temp_headers.update(crumb)
 
         req = self._session.post(
             target_url,
             headers=temp_headers,
             **args if args else {})
 
+        # Crumbs are bound to the web session they were issued for, so they
+        # may expire while we still hold a cached copy. When that happens we
+        # request a new crumb and try again, once.
+        if self._context.crumbs.is_rejected(crumb, req.status_code):
+            self._log.debug("POST to %s rejected. Refreshing crumb.",
+                            target_url)
+            self._context.invalidate_crumb(crumb)
+            self._context.crumbs.replace(temp_headers, crumb, self.crumb)
+            req = self._session.post(
+                target_url,
+                headers=temp_headers,
+                **args if args else {})
+
+        # Any operation on this object may change its state so we can no
+        # longer trust any data we have cached for it
+        self.invalidate()
+        self._context.modified()
+        mirror = self._context.config_mirror
+        if mirror is not None:
+            mirror.discard(self.root_url, self.url)
+
         req.raise_for_status()
         return req
 
@@ -222,26 +640,7 @@ class JenkinsAPI:
         reference: https://wiki.jenkins-ci.org/display/JENKINS/Remote+access+API
         (see CSRF protection section)
         """
-        if self._crumb_cache is None:
-            # Query the REST API for the crumb token
-            req = self._session.get(self.root_url + 'crumbIssuer/api/json')
-
-            if req.status_code == 404:
-                # If we get a 404 error, endpoint not found, assume the Cross
-                # Site Scripting support has been disabled
-                self._crumb_cache = ''
-            else:
-                req.raise_for_status()
-                data = req.json()
-
-                # Seeing as how the crumb for a given Jenkins instance is
-                # static, we cache the results locally to prevent having to hit
-                # the API unnecessarily
-                self._crumb_cache = {
-                    data['crumbRequestField']: data['crumb']
-                }
-
-        return self._crumb_cache
+        return self._context.get_crumb(self.root_url)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -1,6 +1,8 @@
 """Abstractions for managing the raw config.xml for a Jenkins job"""
 import logging
-from xml.etree import ElementTree
+from contextlib import contextmanager
+from copy import deepcopy
+from pyjen.utils import xml_backend
 from pyjen.utils.plugin_api import find_plugin
 
 
@@ -10,17 +12,28 @@ class JobXML:
     The source xml can be loaded from nearly any URL by
     appending "/config.xml" to it, as in "http://server/jobs/job1/config.xml"
     """
-    def __init__(self, api):
+    def __init__(self, api, document=None):
         """
         Args:
             api (JenkinsAPI):
                 Rest API for the Jenkins XML configuration managed by this
                 object
+            document (ConfigDocument):
+                optional pre-loaded configuration, which may be shared with
+                other objects with identical configurations. See
+                :py:func:`~.config_store.fetch_configs`. A private copy of
+                the shared XML tree is taken when it is first accessed, so
+                changes never affect the other objects sharing it.
         """
         super().__init__()
         self._api = api
         self._log = logging.getLogger(__name__)
         self._cache = None
+        self._document = document
+        # Number of nested edit() contexts currently open, and the XML the
+        # outermost one started from. See the edit() method.
+        self._edit_depth = 0
+        self._edit_original = None
 
     def __str__(self):
         return self.xml
@@ -31,24 +44,70 @@ class JobXML:
         config xml"""
         if self._cache is not None:
             return self._cache
+        if self._document is not None:
+            # Plugins modify the nodes they wrap in place, so take a private
+            # copy of the shared tree before handing out any of its nodes
+            self._cache = deepcopy(self._document.root)
+            self._document = None
+            return self._cache
         text = self._api.get_text("/config.xml")
-        self._cache = ElementTree.fromstring(text)
+        self._cache = xml_backend.fromstring(text)
         return self._cache
 
     def update(self):
-        """Posts all changes made to the object back to Jenkins"""
+        """Posts all changes made to the object back to Jenkins
+
+        Deferred until the end of the current edit, if any. See
+        :py:meth:`edit`.
+        """
+        if self._edit_depth:
+            return
         args = {'data': self.xml, 'headers': {'Content-Type': 'text/xml'}}
         self._api.post(self._api.url + "config.xml", args)
 
+    @contextmanager
+    def edit(self):
+        """Context manager which batches changes into a single update
+
+        Updates requested within the context, directly or by any of the
+        plugins nested within this configuration, are deferred until the
+        context exits. At that point the configuration is posted back to
+        Jenkins once, and only if the XML has actually changed. If the context
+        exits with an exception, nothing is posted and the pending changes
+        are discarded.
+
+        Contexts may be nested, in which case the changes are posted when the
+        outermost context exits.
+
+        Yields:
+            JobXML:
+                this object
+        """
+        if not self._edit_depth:
+            self._edit_original = self.xml
+        self._edit_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._edit_depth -= 1
+            if not self._edit_depth:
+                # Reload the unmodified configuration on next use
+                self._cache = None
+            raise
+        self._edit_depth -= 1
+        if not self._edit_depth and self.xml != self._edit_original:
+            self.update()
+
     @property
     def xml(self):
         """str: Raw XML representation describing the configuration of this
         plugin, in plain-text format"""
-        return ElementTree.tostring(self._root).decode("utf-8")
+        return xml_backend.tostring(self._root)
 
     @xml.setter
     def xml(self, value):
-        self._cache = ElementTree.fromstring(value)
+        self._cache = xml_backend.fromstring(value)
+        self._document = None
         self.update()
 
     @property
@@ -87,8 +146,7 @@ class JobXML:
                 PyJen plugin associated with the job property to add
         """
         props_node = self._root.find('properties')
-        props_node.append(prop.node)
-        prop.parent = self
+        prop.attach(self, props_node)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,258 @@
+"""Primitives for searching the console logs of many builds at once
+
+Logs are streamed from the server in chunks rather than being loaded into
+memory all at once, and several logs are searched concurrently using a small,
+fixed number of worker threads so as not to overload the Jenkins server.
+
+Example:
+::
+
+    from pyjen.utils.log_search import search_console_logs
+
+    patterns = ["OutOfMemoryError", r"Connection (refused|reset)"]
+    for bld, line_no, pattern, line in search_console_logs(
+            job.recent_builds, patterns, first_hit_only=True):
+        print(f"{bld.url}:{line_no}: {line}")
+"""
+import logging
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+#: int: default number of console logs searched concurrently
+DEFAULT_WORKERS = 4
+
+#: int: default maximum number of hits buffered ahead of the caller
+MAX_PENDING_HITS = 1000
+
+# Marker placed in the results queue each time a worker finishes searching
+# one console log
+_DONE = object()
+
+# Matches references to capture groups by number, like "\1" or "(?(1)...)"
+_NUMBERED_REFERENCE = re.compile(r"\\[1-9]|\(\?\(\d")
+
+
+def search_console_logs(builds, patterns, max_workers=DEFAULT_WORKERS,
+                        first_hit_only=False, chunk_size=64 * 1024):
+    """Searches the console logs of several builds for a set of patterns
+
+    Logs are searched one line at a time, so lines split across the chunks
+    in which the log is downloaded are reassembled before being searched.
+    Every line is checked against all the patterns at once, and a separate
+    hit is reported for each pattern that matches a line. Hits for a given
+    build are reported in order, but hits for different builds may be
+    interleaved.
+
+    Searching stops as soon as the caller stops iterating over the hits.
+
+    Args:
+        builds (list):
+            :class:`~.build.Build` objects whose console logs are to be
+            searched
+        patterns (list):
+            regular expressions to search for, given as strings or as
+            pre-compiled regular expression objects
+        max_workers (int):
+            maximum number of console logs to download and search at once
+        first_hit_only (bool):
+            if True, stop searching the log for a build as soon as any
+            pattern matches a line in it
+        chunk_size (int):
+            maximum number of bytes of each log to load into memory at once
+
+    Returns:
+        generator:
+            yields a 4-tuple for each hit as it is found, containing the
+            build, the line number of the matching line starting at 1, the
+            pattern that matched as it was provided by the caller, and the
+            text of the matching line
+    """
+    search = _LogSearch(_PatternMatcher(patterns), first_hit_only, chunk_size)
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    futures = [pool.submit(search.run, cur_build) for cur_build in builds]
+    try:
+        remaining = len(futures)
+        while remaining:
+            item = search.results.get()
+            if item[0] is _DONE:
+                remaining -= 1
+                if item[1] is not None:
+                    raise item[1]
+                continue
+            yield item
+    finally:
+        search.stop.set()
+        for cur_future in futures:
+            cur_future.cancel()
+        pool.shutdown(wait=False)
+
+
+class _LogSearch:
+    """State shared by the worker threads searching console logs"""
+
+    def __init__(self, matcher, first_hit_only, chunk_size):
+        """
+        Args:
+            matcher (_PatternMatcher):
+                patterns to search for
+            first_hit_only (bool):
+                if True, stop searching each log after the first line that
+                matches
+            chunk_size (int):
+                maximum number of bytes of each log to load into memory at
+                once
+        """
+        self._log = logging.getLogger(__name__)
+        self._matcher = matcher
+        self._first_hit_only = first_hit_only
+        self._chunk_size = chunk_size
+        #: queue.Queue: hits found by the workers, waiting to be reported
+        self.results = queue.Queue(maxsize=MAX_PENDING_HITS)
+        #: threading.Event: set once the search has been cancelled
+        self.stop = threading.Event()
+
+    def run(self, bld):
+        """Searches the console log for a single build
+
+        Any error encountered is reported to the caller through the results
+        queue, along with the marker signalling the end of the search.
+
+        Args:
+            bld (Build):
+                build whose console log is to be searched
+        """
+        error = None
+        try:
+            self._search(bld)
+        except Exception as err:  # pylint: disable=broad-except
+            error = err
+        self._emit((_DONE, error))
+
+    def _emit(self, item):
+        """Adds an item to the results queue
+
+        Args:
+            item (tuple):
+                item to be reported to the caller
+
+        Returns:
+            bool:
+                False if the item could not be added because the search has
+                been cancelled, otherwise True
+        """
+        while not self.stop.is_set():
+            try:
+                self.results.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _search(self, bld):
+        """Reports the hits found in the console log for a single build
+
+        Args:
+            bld (Build):
+                build whose console log is to be searched
+        """
+        self._log.debug("Searching console output for %s", bld.url)
+        line_no = 0
+        partial = ""
+        stream = bld.iter_console(chunk_size=self._chunk_size, follow=False)
+        try:
+            for text in stream:
+                if self.stop.is_set():
+                    return
+                lines = (partial + text).split("\n")
+                partial = lines.pop()
+                for cur_line in lines:
+                    line_no += 1
+                    if self._report(bld, line_no, cur_line) and \
+                            self._first_hit_only:
+                        return
+            if partial:
+                self._report(bld, line_no + 1, partial)
+        finally:
+            stream.close()
+
+    def _report(self, bld, line_no, line):
+        """Reports the hits for every pattern matching one line of a log
+
+        Args:
+            bld (Build):
+                build the line was produced by
+            line_no (int):
+                line number of the line within the log
+            line (str):
+                text of the line
+
+        Returns:
+            bool:
+                True if any of the patterns matched the line
+        """
+        line = line.rstrip("\r")
+        hits = self._matcher.match(line)
+        for cur_pattern in hits:
+            if not self._emit((bld, line_no, cur_pattern, line)):
+                break
+        return bool(hits)
+
+
+class _PatternMatcher:
+    """Checks lines of text against several regular expressions at once
+
+    All patterns are combined into a single regular expression used to
+    quickly discard lines that match none of them. The patterns are only
+    checked individually for the rare lines that do match.
+
+    Combining the patterns renumbers their capture groups, so the combined
+    expression is not used when any pattern refers to a group by number.
+    """
+
+    def __init__(self, patterns):
+        """
+        Args:
+            patterns (list):
+                regular expressions to search for, given as strings or as
+                pre-compiled regular expression objects
+        """
+        self._patterns = [
+            (cur_pattern, re.compile(cur_pattern)) for cur_pattern in patterns
+        ]
+        self._combined = None
+        flags = {cur_regex.flags for _, cur_regex in self._patterns}
+        numbered_refs = any(
+            cur_regex.groups and isinstance(cur_regex.pattern, str) and
+            _NUMBERED_REFERENCE.search(cur_regex.pattern)
+            for _, cur_regex in self._patterns)
+        if len(flags) == 1 and not numbered_refs:
+            try:
+                self._combined = re.compile(
+                    "|".join(f"(?:{cur_regex.pattern})"
+                             for _, cur_regex in self._patterns),
+                    flags.pop())
+            except (re.error, TypeError):
+                self._combined = None
+
+    def match(self, line):
+        """Finds the patterns matching a line of text
+
+        Args:
+            line (str):
+                text to check
+
+        Returns:
+            list:
+                the patterns matching the line, as provided to the
+                constructor
+        """
+        if self._combined is not None and not self._combined.search(line):
+            return []
+        return [cur_pattern for cur_pattern, cur_regex in self._patterns
+                if cur_regex.search(line)]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
@@ -1,9 +1,11 @@
 """Primitives for interacting with the PyJen plugin subsystem"""
 import logging
-from pkg_resources import iter_entry_points
+import threading
 
 # Every PyJen plugin must have a class registered with the following Python
-# setup tools entrypoint
+# setup tools entrypoint. The name of each entry point is expected to be the
+# name of the Jenkins plugin the registered class supports, which allows
+# plugins to be located from package metadata without importing them.
 PLUGIN_ENTRYPOINT_NAME = "pyjen.plugins.v1.0"
 
 # PyJen plugins are expected to be implemented as Python classes, with
@@ -12,6 +14,194 @@ PLUGIN_ENTRYPOINT_NAME = "pyjen.plugins.v1.0"
 PLUGIN_METHOD_NAME = "get_jenkins_plugin_name"
 
 
+def iter_entry_points(group):
+    """Enumerates the entry points registered for a given group
+
+    Only package metadata is read by this helper. None of the objects
+    referenced by the entry points are imported.
+
+    Args:
+        group (str):
+            name of the entry point group to enumerate
+
+    Returns:
+        list:
+            0 or more :class:`importlib.metadata.EntryPoint` objects
+    """
+    # Deferred import to keep the cost of "import pyjen" to a minimum
+    from importlib import metadata  # pylint: disable=import-outside-toplevel
+    all_entry_points = metadata.entry_points()
+    if hasattr(all_entry_points, "select"):
+        return list(all_entry_points.select(group=group))
+    # Python 3.9 and older return a dictionary keyed by group name
+    return list(all_entry_points.get(group, []))  # pylint: disable=no-member  # pragma: no cover
+
+
+class _PluginRegistry:
+    """Process-wide index mapping Jenkins plugin names to PyJen classes
+
+    The index is first populated from entry point metadata alone. Plugin
+    classes are then imported on demand, the first time a lookup for the
+    Jenkins plugin they declare is made.
+    """
+
+    def __init__(self):
+        self._log = logging.getLogger(__name__)
+        self._lock = threading.RLock()
+        # Jenkins plugin name -> entry points declaring support for it
+        self._declared = {}
+        # Jenkins plugin name -> PyJen plugin class (or None if unsupported)
+        self._resolved = {}
+        # entry points whose names do not follow the Jenkins class name
+        # convention and therefore must be imported to be identified
+        self._legacy = []
+        # entry point -> loaded plugin class, so nothing is imported twice
+        self._loaded = {}
+        self._all_plugins = None
+
+        for entry_point in iter_entry_points(group=PLUGIN_ENTRYPOINT_NAME):
+            if "." not in entry_point.name:
+                self._legacy.append(entry_point)
+            self._declared.setdefault(entry_point.name, []).append(entry_point)
+
+        for name, entry_points in self._declared.items():
+            if len(entry_points) > 1:
+                self._log.warning("multiple plugins detected for specified "
+                                  "Jenkins object: %s. Using first match.",
+                                  name)
+
+    def _load(self, entry_point):
+        """Imports the plugin class referenced by an entry point
+
+        Args:
+            entry_point (importlib.metadata.EntryPoint):
+                entry point to import
+
+        Returns:
+            reference to the loaded plugin class, or None if the class doesn't
+            support the current version of the PyJen plugin API
+        """
+        if entry_point in self._loaded:
+            return self._loaded[entry_point]
+
+        plugin = entry_point.load()
+        if not hasattr(plugin, PLUGIN_METHOD_NAME):
+            self._log.debug(
+                "Plugin %s does not expose the required %s static method.",
+                plugin.__module__,
+                PLUGIN_METHOD_NAME)
+            plugin = None
+        self._loaded[entry_point] = plugin
+        return plugin
+
+    def _register(self, plugin):
+        """Indexes a loaded plugin by the Jenkins plugin name it reports
+
+        Args:
+            plugin:
+                PyJen plugin class to add to the index
+        """
+        jenkins_name = getattr(plugin, PLUGIN_METHOD_NAME)()
+        if self._resolved.get(jenkins_name) is None:
+            self._resolved[jenkins_name] = plugin
+
+    def find(self, plugin_name):
+        """Locates the PyJen class associated with a given Jenkins plugin
+
+        Args:
+            plugin_name (str):
+                Name of the Jenkins plugin to locate
+
+        Returns:
+            reference to the PyJen plugin class associated with the given
+            Jenkins plugin, or None if there isn't one
+        """
+        if plugin_name in self._resolved:
+            return self._resolved[plugin_name]
+
+        with self._lock:
+            if plugin_name in self._resolved:
+                return self._resolved[plugin_name]
+
+            for entry_point in self._declared.get(plugin_name, []):
+                plugin = self._load(entry_point)
+                if plugin is not None:
+                    self._register(plugin)
+                if self._resolved.get(plugin_name) is not None:
+                    break
+
+            # Plugins registered under arbitrary entry point names can only
+            # be identified by importing them. We do so at most once.
+            if self._resolved.get(plugin_name) is None and self._legacy:
+                for entry_point in self._legacy:
+                    plugin = self._load(entry_point)
+                    if plugin is not None:
+                        self._register(plugin)
+                self._legacy = []
+
+            self._resolved.setdefault(plugin_name, None)
+            return self._resolved[plugin_name]
+
+    def all_plugins(self):
+        """Loads every PyJen plugin installed on the system
+
+        Returns:
+            list:
+                0 or more PyJen plugins installed on this system
+        """
+        with self._lock:
+            if self._all_plugins is None:
+                self._all_plugins = []
+                for entry_points in self._declared.values():
+                    for entry_point in entry_points:
+                        plugin = self._load(entry_point)
+                        if plugin is not None:
+                            self._all_plugins.append(plugin)
+            return list(self._all_plugins)
+
+
+# Built lazily on first use by :py:func:`refresh_plugins` and reused by every
+# subsequent lookup
+_REGISTRY = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _get_registry():
+    """Gets the process-wide plugin registry, building it if necessary
+
+    Returns:
+        _PluginRegistry:
+            the current plugin registry
+    """
+    registry = _REGISTRY
+    if registry is None:
+        registry = refresh_plugins()
+    return registry
+
+
+def refresh_plugins():
+    """Rebuilds the plugin registry from the currently installed plugins
+
+    Typically only needed when plugins are installed or removed from the
+    running Python environment after PyJen has already performed a lookup.
+
+    Returns:
+        _PluginRegistry:
+            the newly created plugin registry
+    """
+    global _REGISTRY  # pylint: disable=global-statement
+    with _REGISTRY_LOCK:
+        _REGISTRY = _PluginRegistry()
+        return _REGISTRY
+
+
+def invalidate_plugins():
+    """Discards the plugin registry so it gets rebuilt on the next lookup"""
+    global _REGISTRY  # pylint: disable=global-statement
+    with _REGISTRY_LOCK:
+        _REGISTRY = None
+
+
 def find_plugin(plugin_name):
     """Locates the PyJen class associated with a given Jenkins plugin
 
@@ -24,22 +214,7 @@ def find_plugin(plugin_name):
         plugin, if one exists. If one doesn't exist, returns None.
     """
     formatted_plugin_name = plugin_name.replace("__", "_")
-
-    log = logging.getLogger(__name__)
-
-    supported_plugins = []
-    for cur_plugin in get_all_plugins():
-        if getattr(cur_plugin, PLUGIN_METHOD_NAME)() == formatted_plugin_name:
-            supported_plugins.append(cur_plugin)
-
-    if not supported_plugins:
-        return None
-
-    if len(supported_plugins) > 1:
-        log.warning("multiple plugins detected for specified Jenkins"
-                    " object: %s. Using first match.", formatted_plugin_name)
-
-    return supported_plugins[0]
+    return _get_registry().find(formatted_plugin_name)
 
 
 def get_all_plugins():
@@ -49,25 +224,7 @@ def get_all_plugins():
         list:
             0 or more PyJen plugins installed on this system
     """
-    log = logging.getLogger(__name__)
-    # First load all libraries that are registered with the PyJen plugin API
-    all_plugins = []
-    for entry_point in iter_entry_points(group=PLUGIN_ENTRYPOINT_NAME):
-        all_plugins.append(entry_point.load())
-
-    # Next, filter out those that don't support the current version of our API
-    retval = []
-    for cur_plugin in all_plugins:
-        if not hasattr(cur_plugin, PLUGIN_METHOD_NAME):
-            log.debug(
-                "Plugin %s does not expose the required %s static method.",
-                cur_plugin.__module__,
-                PLUGIN_METHOD_NAME)
-            continue
-
-        retval.append(cur_plugin)
-
-    return retval
+    return _get_registry().all_plugins()
 
 
 def instantiate_xml_plugin(node, parent):
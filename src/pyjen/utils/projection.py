@@ -0,0 +1,170 @@
+"""Primitives for declaring which REST API fields each property depends on
+
+The Jenkins REST API supports a "tree" query parameter which restricts the
+JSON data returned by an endpoint to a specific subset of fields. For example,
+the following query only returns the name and color of a job, rather than
+the full job description including the entire build history:
+
+::
+
+    http://server/job/MyJob/api/json?tree=name,color
+
+Properties declared with :py:func:`json_property` list the fields they
+depend on, which allows :class:`~.jenkins_api.JenkinsAPI` to build minimal
+tree expressions when loading data for them, and allows callers to load the
+data for several properties with a single request. See
+:py:meth:`~.job.Job.fetch` for an example.
+"""
+
+
+class JSONProperty(property):
+    """Property computed from a subset of an objects' REST API data
+
+    Behaves like a built-in Python property, except that the names of the
+    JSON fields the getter depends on are exposed by the property. See
+    :py:func:`json_property` for details.
+    """
+    #: tuple (str): JSON fields / tree expressions this property reads
+    fields = ()
+
+
+def json_property(*fields):
+    """Decorator declaring a property derived from an objects' REST API data
+
+    The decorated getter method loads the data it needs using
+    :py:func:`property_data`, which is guaranteed to contain the declared
+    fields, but may contain others as well. Setters may be declared the same
+    way as for built-in properties.
+
+    Example:
+    ::
+
+        @json_property("name")
+        def name(self):
+            data = property_data(self, "name")
+            return data["name"]
+
+    Args:
+        fields (str):
+            1 or more JSON field names or tree expressions the property
+            depends on, like "name" or "lastBuild[url]"
+
+    Returns:
+        type:
+            :class:`JSONProperty` class to be used as a decorator
+    """
+    class _JSONProperty(JSONProperty):
+        """JSONProperty bound to a specific set of fields"""
+    _JSONProperty.fields = fields
+    return _JSONProperty
+
+
+def property_fields(cls, name):
+    """Gets the JSON fields a property declared with :py:func:`json_property`
+    depends on
+
+    Args:
+        cls (type):
+            class declaring the property
+        name (str):
+            name of the property
+
+    Returns:
+        tuple (str):
+            JSON fields / tree expressions the property reads
+
+    Raises:
+        AttributeError:
+            if the class has no property with the given name declared with
+            :py:func:`json_property`
+    """
+    attr = getattr(cls, name, None)
+    if not isinstance(attr, JSONProperty):
+        raise AttributeError(
+            f"{cls.__name__}.{name} is not declared with json_property")
+    return attr.fields
+
+
+def property_data(obj, name):
+    """Loads the REST API data a property of an object depends on
+
+    Used by the getters of properties declared with
+    :py:func:`json_property`. The object must store its
+    :class:`~.jenkins_api.JenkinsAPI` in a member named '_api'.
+
+    Args:
+        obj:
+            object declaring the property
+        name (str):
+            name of the property
+
+    Returns:
+        dict:
+            JSON data for the object, containing at least the fields the
+            property depends on
+    """
+    fields = property_fields(type(obj), name)
+    return obj._api.get_api_data(fields=fields)  # pylint: disable=protected-access
+
+
+def resolve_fields(cls, names):
+    """Converts a list of property names to the JSON fields they depend on
+
+    Args:
+        cls (type):
+            class declaring the properties
+        names (list):
+            names of properties declared with :py:func:`json_property`. Any
+            name that does not refer to such a property is assumed to be a raw
+            JSON field name or tree expression and is used as-is.
+
+    Returns:
+        list (str):
+            de-duplicated list of JSON fields / tree expressions
+    """
+    retval = []
+    for cur_name in names:
+        attr = getattr(cls, cur_name, None)
+        if isinstance(attr, JSONProperty):
+            new_fields = attr.fields
+        else:
+            new_fields = (cur_name,)
+        for cur_field in new_fields:
+            if cur_field not in retval:
+                retval.append(cur_field)
+    return retval
+
+
+def top_level_field(field):
+    """Extracts the name of the top level JSON field from a tree expression
+
+    Args:
+        field (str):
+            JSON field name or tree expression, like "lastBuild[url]"
+
+    Returns:
+        str:
+            name of the top level field, like "lastBuild"
+    """
+    for delimiter in "[{":
+        field = field.split(delimiter, 1)[0]
+    return field.strip()
+
+
+def tree_query(fields):
+    """Generates the tree query parameter for a set of JSON fields
+
+    Args:
+        fields (list):
+            0 or more JSON field names or tree expressions
+
+    Returns:
+        str:
+            query string requesting only the given fields, like
+            "tree=name,color"
+    """
+    return "tree=" + ",".join(fields)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
@@ -0,0 +1,247 @@
+"""Primitives for tracking many scheduled builds through the build queue
+
+Rather than polling each queued build separately, the watcher loads the
+identifiers of every item in the build queue with a single query, like the
+following, and only looks further for the tracked items that have left it:
+
+::
+
+    http://server/queue/api/json?tree=items[id]
+
+Builds started from the tracked items are located using a single query for
+the builds running on every executor of the build farm. Only items that have
+neither been found in the queue nor on an executor, like those whose builds
+have already finished or which have been cancelled, are checked individually.
+"""
+import logging
+import threading
+from concurrent.futures import Future
+import requests
+from requests.exceptions import HTTPError
+from pyjen.build import Build
+from pyjen.utils.projection import tree_query
+
+#: float: default minimum number of seconds between polls of the build queue
+DEFAULT_POLL_INTERVAL = 1
+
+#: float: default maximum number of seconds between polls of the build queue
+DEFAULT_MAX_POLL_INTERVAL = 30
+
+# Tree expression for the builds currently running on every executor
+_EXECUTABLES = "currentExecutable[url,queueId]"
+_RUNNING_BUILDS = tree_query([
+    f"computer[executors[{_EXECUTABLES}],oneOffExecutors[{_EXECUTABLES}]]"
+])
+
+
+class QueueWatcher:
+    """Tracks many scheduled builds until they leave the build queue
+
+    Each tracked queue item is associated with a
+    :class:`concurrent.futures.Future` which is resolved with the
+    :class:`~.build.Build` started from that item once it leaves the queue,
+    or with None if the item was cancelled or expired before its build could
+    be located. Tracked items are polled on a background thread which exits
+    once every item has been resolved. Cancelling a future stops the
+    associated item from being tracked.
+
+    The build queue is polled more frequently while it is changing, and less
+    frequently while it remains idle.
+    """
+
+    def __init__(self, api, poll_interval=DEFAULT_POLL_INTERVAL,
+                 max_poll_interval=DEFAULT_MAX_POLL_INTERVAL):
+        """
+        Args:
+            api (JenkinsAPI):
+                Pre-initialized connection to the Jenkins REST API
+            poll_interval (float):
+                minimum number of seconds to wait between polls
+            max_poll_interval (float):
+                maximum number of seconds to wait between polls
+        """
+        self._log = logging.getLogger(__name__)
+        self._api = api.clone(api.root_url + "queue")
+        self._intervals = (poll_interval, max_poll_interval)
+        # Queue IDs of the items being tracked, mapped to their futures
+        self._tracked = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        # Queue IDs of every item in the build queue, as of the last poll
+        self._last_queue = set()
+
+    def watch(self, item):
+        """Starts tracking a queue item
+
+        Args:
+            item (QueueItem):
+                scheduled build to be tracked
+
+        Returns:
+            concurrent.futures.Future:
+                future resolved with the build started from the item once it
+                leaves the queue, or with None if the item was cancelled
+        """
+        with self._lock:
+            retval = self._tracked.get(item.uid)
+            if retval is None:
+                retval = Future()
+                self._tracked[item.uid] = retval
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="pyjen-queue-watcher", daemon=True)
+                self._thread.start()
+            else:
+                self._wakeup.set()
+        return retval
+
+    def poll(self):
+        """Checks the state of every tracked item once
+
+        Called periodically by the background thread. Resolves the futures
+        for all tracked items that have left the build queue.
+
+        Returns:
+            bool:
+                True if the content of the build queue changed since the last
+                poll, otherwise False
+        """
+        with self._lock:
+            self._tracked = {uid: future for uid, future
+                             in self._tracked.items() if not future.done()}
+            tracked = dict(self._tracked)
+        if not tracked:
+            return False
+
+        self._api.invalidate()
+        data = self._api.get_api_data(query_params=tree_query(["items[id]"]))
+        queued = {cur_item["id"] for cur_item in data["items"]}
+        changed = queued != self._last_queue
+        self._last_queue = queued
+
+        departed = [uid for uid in tracked if uid not in queued]
+        if not departed:
+            return changed
+
+        running = self._running_builds()
+        for uid in departed:
+            if uid in running:
+                self._resolve(uid, running[uid])
+                continue
+            state = self._item_state(uid)
+            if state is not False:
+                self._resolve(uid, state)
+        return True
+
+    def _resolve(self, uid, build_url):
+        """Resolves the future for a tracked item
+
+        Args:
+            uid (int):
+                queue ID of the item
+            build_url (str):
+                URL of the build started from the item, or None if no build
+                was started
+        """
+        with self._lock:
+            future = self._tracked.pop(uid, None)
+        if future is None or not future.set_running_or_notify_cancel():
+            return
+        self._log.debug("Queue item %s resolved to %s", uid, build_url)
+        if build_url is None:
+            future.set_result(None)
+        else:
+            future.set_result(Build(self._api.clone(build_url)))
+
+    def _running_builds(self):
+        """Locates the builds currently running on the build farm
+
+        Returns:
+            dict:
+                URLs of the running builds, keyed by the queue IDs of the
+                items they were started from
+        """
+        computer_api = self._api.clone(self._api.root_url + "computer")
+        computer_api.invalidate()
+        data = computer_api.get_api_data(query_params=_RUNNING_BUILDS)
+
+        retval = {}
+        for cur_computer in data["computer"]:
+            executors = (cur_computer.get("executors") or []) + \
+                (cur_computer.get("oneOffExecutors") or [])
+            for cur_executor in executors:
+                executable = cur_executor.get("currentExecutable")
+                if executable and executable.get("queueId") is not None:
+                    retval[executable["queueId"]] = executable["url"]
+        return retval
+
+    def _item_state(self, uid):
+        """Checks the state of a single item which has left the queue
+
+        Args:
+            uid (int):
+                queue ID of the item
+
+        Returns:
+            str:
+                URL of the build started from the item, None if the item was
+                cancelled or has expired, or False if the item has left the
+                queue but its build has not started yet
+        """
+        item_api = self._api.clone(f"{self._api.root_url}queue/item/{uid}")
+        try:
+            data = item_api.get_api_data(
+                query_params=tree_query(["executable[url]", "cancelled"]))
+        except HTTPError as err:
+            if err.response.status_code == requests.codes.NOT_FOUND:
+                return None
+            raise
+
+        if data.get("executable"):
+            return data["executable"]["url"]
+        if data.get("cancelled"):
+            return None
+        return False
+
+    def _run(self):
+        """Polls the tracked items until all of them are resolved"""
+        min_interval, max_interval = self._intervals
+        delay = min_interval
+        while True:
+            try:
+                changed = self.poll()
+            except Exception as err:  # pylint: disable=broad-except
+                self._fail(err)
+                return
+
+            with self._lock:
+                if not self._tracked:
+                    self._thread = None
+                    return
+            if changed or self._wakeup.is_set():
+                delay = min_interval
+            else:
+                delay = min(delay * 2, max_interval)
+            self._wakeup.wait(delay)
+            self._wakeup.clear()
+
+    def _fail(self, error):
+        """Reports an error to every tracked item, and stops tracking them
+
+        Args:
+            error (Exception):
+                error encountered while polling the build queue
+        """
+        self._log.error("Failed to poll the build queue: %s", error)
+        with self._lock:
+            tracked = self._tracked
+            self._tracked = {}
+            self._thread = None
+        for cur_future in tracked.values():
+            if cur_future.set_running_or_notify_cancel():
+                cur_future.set_exception(error)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
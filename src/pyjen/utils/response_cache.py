@@ -0,0 +1,110 @@
+"""Time-bounded, size-bounded cache for Jenkins REST API responses"""
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
+
+
+class ResponseCache:
+    """Least-recently-used cache of REST API responses with expiry times
+
+    Entries are keyed by the full URL of the request, including any query
+    parameters, so different projections of the same endpoint are cached
+    independently. Entries older than the configured time-to-live are
+    discarded on access, and the least recently used entries are evicted
+    whenever the cache grows beyond its maximum size. Responses are copied
+    on the way in and out, so callers are free to modify the data they are
+    given without affecting other readers.
+    """
+
+    def __init__(self, ttl=30, max_size=1000):
+        """
+        Args:
+            ttl (float):
+                number of seconds a cached response remains valid
+            max_size (int):
+                maximum number of responses to retain
+        """
+        if ttl <= 0:
+            raise ValueError("Cache time-to-live must be greater than 0")
+        if max_size <= 0:
+            raise ValueError("Cache size must be greater than 0")
+
+        self._ttl = ttl
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        # URL -> (expiry time, response data)
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def ttl(self):
+        """float: number of seconds a cached response remains valid"""
+        return self._ttl
+
+    @property
+    def max_size(self):
+        """int: maximum number of responses retained by the cache"""
+        return self._max_size
+
+    def get(self, url):
+        """Looks up the cached response for a given request
+
+        Args:
+            url (str):
+                full URL of the request, including query parameters
+
+        Returns:
+            dict:
+                a copy of the cached response data, or None if there is no
+                valid response cached for the given URL
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            expiry, data = entry
+            if expiry <= time.monotonic():
+                del self._entries[url]
+                return None
+            self._entries.move_to_end(url)
+        return deepcopy(data)
+
+    def put(self, url, data):
+        """Stores the response for a given request
+
+        Args:
+            url (str):
+                full URL of the request, including query parameters
+            data (dict):
+                decoded response data to cache
+        """
+        data = deepcopy(data)
+        with self._lock:
+            self._entries[url] = (time.monotonic() + self._ttl, data)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, prefix=None):
+        """Discards cached responses
+
+        Args:
+            prefix (str):
+                optional URL prefix. When provided only responses for URLs
+                beginning with the prefix are discarded, otherwise the entire
+                cache is cleared.
+        """
+        with self._lock:
+            if prefix is None:
+                self._entries.clear()
+                return
+            for url in [i for i in self._entries if i.startswith(prefix)]:
+                del self._entries[url]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
@@ -0,0 +1,348 @@
+"""Primitives for sampling the utilization of build agent executors over time
+
+The state of every executor on the build farm is loaded with a single query
+per sample, requesting only the name and online state of each node and
+whether each of its executors is idle:
+
+::
+
+    computer/api/json?tree=computer[displayName,offline,executors[idle]]
+
+Samples are held in memory in fixed size ring buffers, one per node, backed
+by compact arrays of numbers rather than Python objects, so sampling may run
+for many hours using a small, bounded amount of memory. Statistics like the
+mean and percentile utilization are then calculated on demand from the
+samples, without contacting the server.
+"""
+import logging
+import math
+import threading
+import time
+from array import array
+from datetime import datetime
+from pyjen.utils.projection import tree_query
+
+#: float: default number of seconds between samples
+DEFAULT_INTERVAL = 10
+
+#: int: default number of samples retained for each node, enough for 24 hours
+#: of samples at the default interval
+DEFAULT_CAPACITY = 8640
+
+_EXECUTORS_QUERY = tree_query(
+    ["computer[displayName,offline,executors[idle]]"])
+
+
+class UtilizationSeries:
+    """Fixed size time series of executor utilization samples for one node
+
+    Once full, each new sample replaces the oldest one.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        """
+        Args:
+            capacity (int):
+                maximum number of samples to retain
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be greater than 0")
+        self._times = array("d", [0.0]) * capacity
+        self._busy = array("I", [0]) * capacity
+        self._total = array("I", [0]) * capacity
+        self._start = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, timestamp, busy, total):
+        """Adds a sample to the series
+
+        Args:
+            timestamp (float):
+                time the sample was taken, in seconds since the epoch
+            busy (int):
+                number of executors that were busy
+            total (int):
+                number of executors available, excluding those on nodes which
+                were offline
+        """
+        capacity = len(self._times)
+        index = (self._start + self._count) % capacity
+        if self._count < capacity:
+            self._count += 1
+        else:
+            self._start = (self._start + 1) % capacity
+        self._times[index] = timestamp
+        self._busy[index] = busy
+        self._total[index] = total
+
+    def _indices(self, since):
+        """Generates the positions of the samples taken since a given time
+
+        Args:
+            since (datetime.datetime):
+                earliest time of the samples to include, or None to include
+                all samples
+
+        Returns:
+            generator:
+                yields the positions of the samples in the underlying arrays,
+                from oldest to newest
+        """
+        capacity = len(self._times)
+        cutoff = since.timestamp() if since is not None else None
+        for offset in range(self._count):
+            index = (self._start + offset) % capacity
+            if cutoff is None or self._times[index] >= cutoff:
+                yield index
+
+    def samples(self, since=None):
+        """Gets the samples in the series
+
+        Args:
+            since (datetime.datetime):
+                optional earliest time of the samples to return
+
+        Returns:
+            list (tuple):
+                3-tuples describing each sample, from oldest to newest,
+                containing the time the sample was taken, the number of busy
+                executors, and the number of available executors
+        """
+        return [(datetime.fromtimestamp(self._times[index]),
+                 self._busy[index], self._total[index])
+                for index in self._indices(since)]
+
+    def mean(self, since=None):
+        """Calculates the mean utilization of the executors
+
+        The mean is weighted by the number of executors available in each
+        sample, so it represents the fraction of the available executor time
+        that was spent running builds.
+
+        Args:
+            since (datetime.datetime):
+                optional earliest time of the samples to include
+
+        Returns:
+            float:
+                utilization between 0 and 1, or None if no executors were
+                available in any of the samples
+        """
+        busy = 0
+        total = 0
+        for index in self._indices(since):
+            busy += self._busy[index]
+            total += self._total[index]
+        if not total:
+            return None
+        return busy / total
+
+    def percentile(self, percent, since=None):
+        """Calculates a percentile of the utilization of the executors
+
+        Percentiles are calculated from the utilization of the executors in
+        each sample, interpolating linearly between samples.
+
+        Args:
+            percent (float):
+                the percentile to calculate, between 0 and 100
+            since (datetime.datetime):
+                optional earliest time of the samples to include
+
+        Returns:
+            float:
+                utilization between 0 and 1, or None if no executors were
+                available in any of the samples
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError("Percentile must be between 0 and 100")
+        values = sorted(self._busy[index] / self._total[index]
+                        for index in self._indices(since)
+                        if self._total[index])
+        if not values:
+            return None
+        position = (len(values) - 1) * percent / 100
+        lower = math.floor(position)
+        upper = math.ceil(position)
+        return values[lower] + \
+            (values[upper] - values[lower]) * (position - lower)
+
+
+class UtilizationSampler:
+    """Samples the utilization of every executor on the build farm
+
+    Samples are taken at a fixed rate by a background thread, and are
+    recorded separately for each node as well as for the build farm as a
+    whole. Executors on nodes which are offline are excluded from the
+    samples.
+
+    Example:
+    ::
+
+        sampler = jenkins.start_utilization_sampler(interval=30)
+        ...
+        sampler.stop()
+        print(sampler.percentile_utilization(95))
+    """
+
+    def __init__(self, api, interval=DEFAULT_INTERVAL,
+                 capacity=DEFAULT_CAPACITY):
+        """
+        Args:
+            api (JenkinsAPI):
+                Pre-initialized connection to the Jenkins REST API
+            interval (float):
+                number of seconds between samples
+            capacity (int):
+                maximum number of samples retained for each node
+        """
+        self._log = logging.getLogger(__name__)
+        self._api = api.clone(api.root_url + "computer")
+        self._interval = interval
+        self._capacity = capacity
+        # Samples for each node, keyed by node name, and for the entire build
+        # farm, keyed by None
+        self._series = {None: UtilizationSeries(capacity)}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @property
+    def node_names(self):
+        """list (str): names of all the nodes sampled so far"""
+        with self._lock:
+            return [cur_name for cur_name in self._series if cur_name]
+
+    def start(self):
+        """Starts sampling on a background thread"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="pyjen-utilization-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops sampling, waiting for any sample in progress to complete"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def sample(self):
+        """Records the current utilization of every executor
+
+        Called periodically by the background thread.
+        """
+        self._api.invalidate()
+        data = self._api.get_api_data(query_params=_EXECUTORS_QUERY)
+        timestamp = time.time()
+
+        farm_busy = 0
+        farm_total = 0
+        with self._lock:
+            for cur_node in data["computer"]:
+                busy = 0
+                total = 0
+                if not cur_node.get("offline"):
+                    executors = cur_node.get("executors") or []
+                    total = len(executors)
+                    busy = sum(1 for cur_executor in executors
+                               if cur_executor.get("idle") is False)
+                name = cur_node["displayName"]
+                if name not in self._series:
+                    self._series[name] = UtilizationSeries(self._capacity)
+                self._series[name].append(timestamp, busy, total)
+                farm_busy += busy
+                farm_total += total
+            self._series[None].append(timestamp, farm_busy, farm_total)
+
+    def series(self, node_name=None):
+        """Gets the samples recorded for a node
+
+        Args:
+            node_name (str):
+                display name of the node, or None for the samples of the
+                entire build farm
+
+        Returns:
+            UtilizationSeries:
+                the samples recorded for the node, or None if the node has not
+                been sampled
+        """
+        return self._series.get(node_name)
+
+    def mean_utilization(self, node_name=None, since=None):
+        """Calculates the mean utilization of the executors on a node
+
+        See :py:meth:`UtilizationSeries.mean` for details.
+
+        Args:
+            node_name (str):
+                display name of the node, or None for the entire build farm
+            since (datetime.datetime):
+                optional earliest time of the samples to include
+
+        Returns:
+            float:
+                utilization between 0 and 1, or None if no samples with
+                available executors have been recorded for the node
+        """
+        with self._lock:
+            series = self._series.get(node_name)
+            return series.mean(since) if series is not None else None
+
+    def percentile_utilization(self, percent, node_name=None, since=None):
+        """Calculates a percentile of the utilization of the executors on a
+        node
+
+        See :py:meth:`UtilizationSeries.percentile` for details.
+
+        Args:
+            percent (float):
+                the percentile to calculate, between 0 and 100
+            node_name (str):
+                display name of the node, or None for the entire build farm
+            since (datetime.datetime):
+                optional earliest time of the samples to include
+
+        Returns:
+            float:
+                utilization between 0 and 1, or None if no samples with
+                available executors have been recorded for the node
+        """
+        with self._lock:
+            series = self._series.get(node_name)
+            if series is None:
+                return None
+            return series.percentile(percent, since)
+
+    def _run(self):
+        """Takes samples at a fixed rate until stopped"""
+        next_sample = time.monotonic()
+        while True:
+            try:
+                self.sample()
+            except Exception as err:  # pylint: disable=broad-except
+                self._log.warning("Failed to sample executors: %s", err)
+            next_sample += self._interval
+            # Skip samples missed while the server was slow to respond
+            while next_sample < time.monotonic():
+                next_sample += self._interval
+            if self._stop.wait(next_sample - time.monotonic()):
+                return
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
@@ -1,6 +1,6 @@
 """Abstractions for managing the raw config.xml for a Jenkins view"""
 import logging
-from xml.etree import ElementTree
+from pyjen.utils import xml_backend
 
 
 class ViewXML:
@@ -32,7 +32,7 @@ class ViewXML:
         if self._cache is not None:
             return self._cache
         text = self._api.get_text("/config.xml")
-        self._cache = ElementTree.fromstring(text)
+        self._cache = xml_backend.fromstring(text)
         return self._cache
 
     def update(self):
@@ -44,13 +44,13 @@ class ViewXML:
     def xml(self):
         """str: Raw XML representation describing the configuration of this
         plugin, in plain-text format"""
-        return ElementTree.tostring(self._root).decode("utf-8")
+        return xml_backend.tostring(self._root)
 
     @xml.setter
     def xml(self, new_xml):
         args = {'data': new_xml, 'headers': {'Content-Type': 'text/xml'}}
         self._api.post(self._api.url + "config.xml", args)
-        self._cache = ElementTree.fromstring(new_xml)
+        self._cache = xml_backend.fromstring(new_xml)
 
     @property
     def plugin_name(self):
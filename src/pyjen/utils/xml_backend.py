@@ -0,0 +1,164 @@
+"""Pluggable XML implementation shared by all the PyJen XML abstractions
+
+The configurations of jobs and views, and the plugins embedded within them,
+are manipulated using the ElementTree API. The implementation of that API is
+provided by the `lxml <https://lxml.de>`_ package when it is installed,
+since it parses and serializes large documents, like pipelines with long
+embedded scripts or deeply nested conditional publishers, considerably faster
+than the implementation in the Python standard library. Otherwise the
+standard library's :mod:`xml.etree.ElementTree` module is used.
+
+Elements created by one implementation can not be combined with elements
+created by the other, so all elements must be created through this module
+rather than through either implementation directly:
+
+::
+
+    from pyjen.utils import xml_backend
+
+    root = xml_backend.fromstring("<project/>")
+    xml_backend.SubElement(root, "quietPeriod").text = "5"
+    print(xml_backend.tostring(root))
+
+Searches use the ElementPath syntax supported by the ``find()`` and
+``findall()`` methods of both implementations.
+"""
+from xml.etree import ElementTree as _ETREE
+
+try:
+    from lxml import etree as _LXML
+except ImportError:  # pragma: no cover
+    _LXML = None
+
+#: str: name of the implementation based on the lxml package
+LXML = "lxml"
+
+#: str: name of the implementation from the Python standard library
+ETREE = "etree"
+
+# The implementation currently in use
+_impl = _LXML if _LXML is not None else _ETREE
+
+if _LXML is not None:
+    # Jenkins configurations may contain very large text nodes, like
+    # embedded scripts, which libxml2 rejects by default. Entities are never
+    # resolved, to guard against malicious documents. Comments and processing
+    # instructions are dropped, like the standard library parser does, since
+    # the plugins expect every child node to be an element.
+    _LXML_PARSER = _LXML.XMLParser(
+        huge_tree=True, resolve_entities=False, no_network=True,
+        remove_comments=True, remove_pis=True)
+else:  # pragma: no cover
+    _LXML_PARSER = None
+
+
+def backend():
+    """Gets the name of the XML implementation in use
+
+    Returns:
+        str:
+            either :py:data:`LXML` or :py:data:`ETREE`
+    """
+    return LXML if _impl is _LXML else ETREE
+
+
+def use_backend(name):
+    """Selects the XML implementation to use
+
+    The implementation is selected automatically when PyJen is imported, so
+    this function is only needed to compare the implementations, as in a
+    benchmark. It must be called before any XML is loaded, since elements
+    created by the previous implementation can not be combined with those
+    created by the new one.
+
+    Args:
+        name (str):
+            either :py:data:`LXML` or :py:data:`ETREE`
+    """
+    global _impl  # pylint: disable=global-statement
+    if name == ETREE:
+        _impl = _ETREE
+    elif name == LXML:
+        if _LXML is None:
+            raise ImportError(
+                "The lxml XML backend requires the lxml package. Install it "
+                "using 'pip install pyjen[lxml]'.")
+        _impl = _LXML
+    else:
+        raise ValueError(f"Unsupported XML backend: {name}")
+
+
+def Element(tag, attrib=None, **extra):  # pylint: disable=invalid-name
+    """Creates a new XML element
+
+    Args:
+        tag (str):
+            name of the element
+        attrib (dict):
+            optional attributes of the element
+        extra (dict):
+            additional attributes of the element
+
+    Returns:
+        Element:
+            the new element
+    """
+    return _impl.Element(tag, attrib or {}, **extra)
+
+
+def SubElement(parent, tag, attrib=None, **extra):  # pylint: disable=invalid-name
+    """Creates a new XML element and appends it to an existing one
+
+    Args:
+        parent (Element):
+            element to add the new element to
+        tag (str):
+            name of the element
+        attrib (dict):
+            optional attributes of the element
+        extra (dict):
+            additional attributes of the element
+
+    Returns:
+        Element:
+            the new element
+    """
+    return _impl.SubElement(parent, tag, attrib or {}, **extra)
+
+
+def fromstring(text):
+    """Parses an XML document
+
+    Args:
+        text (str):
+            the XML document. May start with an XML declaration, like those
+            in the config.xml files served by Jenkins.
+
+    Returns:
+        Element:
+            the root element of the document
+    """
+    if _impl is _LXML:
+        # lxml refuses to parse strings containing an encoding declaration
+        if isinstance(text, str):
+            text = text.encode("utf-8")
+        return _LXML.fromstring(text, _LXML_PARSER)
+    return _ETREE.fromstring(text)
+
+
+def tostring(node):
+    """Serializes an XML element and its children
+
+    Args:
+        node (Element):
+            the element to serialize
+
+    Returns:
+        str:
+            the serialized XML, without an XML declaration
+    """
+    return _impl.tostring(node, encoding="unicode")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pass
@@ -1,6 +1,7 @@
 """Primitives common to all PyJen plugins that extend Jenkins config.xml"""
 import logging
-from xml.etree import ElementTree
+from copy import deepcopy
+from pyjen.utils import xml_backend
 
 
 class XMLPlugin:
@@ -58,10 +59,28 @@ class XMLPlugin:
         self._parent.update()
 
     def __str__(self):
-        return ElementTree.tostring(self._root, encoding="utf-8")
+        return xml_backend.tostring(self._root)
 
     def __repr__(self):
-        return ElementTree.tostring(self._root, encoding="utf-8")
+        return xml_backend.tostring(self._root)
+
+    def attach(self, parent, parent_node):
+        """Adds the XML managed by this plugin to the XML of another object
+
+        A copy of the XML is added so the tree this plugin was loaded from is
+        left intact, even with XML backends where a node can only belong to
+        one tree. The plugin then manages the copy, so later changes made
+        through it are saved by its new parent.
+
+        Args:
+            parent:
+                PyJen object managing the XML tree the plugin is added to
+            parent_node (xml.etree.ElementTree.Element):
+                node within the parent's XML tree to append the plugin to
+        """
+        self._root = deepcopy(self._root)
+        parent_node.append(self._root)
+        self._parent = parent
 
     @property
     def node(self):
@@ -1,10 +1,13 @@
 """Primitives for interacting with Jenkins views"""
 import logging
 from urllib.parse import urljoin, urlsplit
+from pyjen import bulk
+from pyjen.bulk import DEFAULT_WORKERS
 from pyjen.job import Job
 from pyjen.utils.viewxml import ViewXML
 from pyjen.utils.plugin_api import find_plugin, get_all_plugins
-from pyjen.utils.helpers import create_view
+from pyjen.utils.helpers import create_view, view_url
+from pyjen.utils.projection import json_property, property_data, tree_query
 
 
 class View:
@@ -36,11 +39,25 @@ class View:
     def __hash__(self):
         return hash(self._api.url)
 
-    @property
+    def invalidate(self):
+        """Discards any cached data for this view, so it gets reloaded from
+        the Jenkins server the next time it is accessed
+        """
+        self._api.invalidate()
+        self._xml_cache = None
+
+    def refresh(self):
+        """Discards any cached data for this view and reloads it from the
+        Jenkins server
+        """
+        self.invalidate()
+        self._api.get_api_data()
+
+    @json_property("name")
     def name(self):
         """str: the name as it appears in the tabbed view of the main Jenkins
         dashboard"""
-        data = self._api.get_api_data()
+        data = property_data(self, "name")
         return data['name']
 
     @property
@@ -66,54 +83,169 @@ class View:
         """Deletes this view from the dashboard"""
         self._api.post(self._api.url + "doDelete")
 
-    def delete_all_jobs(self):
-        """Batch operation that deletes all jobs found in this view"""
-        for j in self.jobs:
-            j.delete()
+    def _bulk(self, operation, workers, rate, progress):
+        """Runs an operation on every job found in this view
+
+        Jobs are processed concurrently. A failure to process one job does not
+        prevent the others from being processed. See :py:func:`~.bulk.apply`
+        for details.
+
+        Args:
+            operation (str):
+                name of the :class:`~.job.Job` method to call on each job
+            workers (int):
+                maximum number of jobs processed concurrently
+            rate (float):
+                optional maximum number of jobs processed per second
+            progress (callable):
+                optional function called after each job has been processed,
+                with the number of jobs processed so far and the total number
+                of jobs
+
+        Returns:
+            BulkResult:
+                the outcome of the operation for every job
+
+        Raises:
+            BulkOperationError:
+                if the operation failed for any job, once all the jobs have
+                been processed. Derived from :class:`requests.HTTPError`,
+                which was raised on the first failure before jobs were
+                processed concurrently.
+        """
+        result = bulk.apply(self.jobs, operation, workers, rate, progress)
+        result.raise_for_errors()
+        return result
+
+    def delete_all_jobs(self, workers=DEFAULT_WORKERS, rate=None,
+                        progress=None):
+        """Batch operation that deletes all jobs found in this view
+
+        Jobs are processed concurrently. Raises
+        :class:`~.bulk.BulkOperationError`, a :class:`requests.HTTPError`, if
+        any job could not be deleted. See :py:func:`~.bulk.apply` for details.
+
+        Returns:
+            BulkResult: the outcome of the operation for every job
+        """
+        return self._bulk("delete", workers, rate, progress)
+
+    def disable_all_jobs(self, workers=DEFAULT_WORKERS, rate=None,
+                         progress=None):
+        """Batch operation that disables all jobs found in this view
+
+        Jobs are processed concurrently. Raises
+        :class:`~.bulk.BulkOperationError`, a :class:`requests.HTTPError`, if
+        any job could not be disabled. See :py:func:`~.bulk.apply` for details.
+
+        Returns:
+            BulkResult: the outcome of the operation for every job
+        """
+        return self._bulk("disable", workers, rate, progress)
 
-    def disable_all_jobs(self):
-        """Batch operation that disables all jobs found in this view"""
-        for j in self.jobs:
-            j.disable()
+    def enable_all_jobs(self, workers=DEFAULT_WORKERS, rate=None,
+                        progress=None):
+        """Batch operation that enables all jobs found in this view
 
-    def enable_all_jobs(self):
-        """Batch operation that enables all jobs found in this view"""
-        for j in self.jobs:
-            j.enable()
+        Jobs are processed concurrently. Raises
+        :class:`~.bulk.BulkOperationError`, a :class:`requests.HTTPError`, if
+        any job could not be enabled. See :py:func:`~.bulk.apply` for details.
+
+        Returns:
+            BulkResult: the outcome of the operation for every job
+        """
+        return self._bulk("enable", workers, rate, progress)
 
     @property
     def view_metrics(self):
-        """dict: Composes a report on the jobs contained within the view"""
-        data = self._api.get_api_data()
+        """dict: Composes a report on the jobs contained within the view
+
+        See :py:meth:`get_view_metrics` for details.
+        """
+        return self.get_view_metrics()
+
+    def get_view_metrics(self, recursive=False, depth=5):
+        """Composes a report on the jobs contained within the view
+
+        The status of every job is derived from the 'color' field reported
+        in the view's job listing, so the report is composed from a single
+        REST API query regardless of the number of jobs in the view.
+
+        Args:
+            recursive (bool):
+                if True, jobs nested within sub-views (ie: nested views) and
+                within jobs that manage other jobs (ie: folders) are included
+                in the report, otherwise only jobs directly listed by this
+                view are included
+            depth (int):
+                number of levels of nesting to load with each query when
+                running recursively. Containers nested deeper than this are
+                loaded with one additional query each.
+
+        Returns:
+            dict:
+                report on the broken, disabled and unstable jobs in the view,
+                with the following keys:
+
+                * broken_jobs_count
+                * disabled_jobs_count
+                * unstable_jobs_count
+                * broken_jobs
+                * disabled_jobs
+                * unstable_jobs
+        """
+        if recursive:
+            job_data = self._find_nested_job_data(max(depth, 1))
+        else:
+            data = self._api.get_api_data(
+                query_params=tree_query(["jobs[name,url,color,_class]"]))
+            job_data = data["jobs"]
 
         broken_jobs = []
         disabled_jobs = []
         unstable_jobs = []
-        broken_job_count = 0
-        disabled_jobs_count = 0
-        unstable_job_count = 0
-
-        for job in data["jobs"]:
-
-            temp_job = Job.instantiate(job, self._api)
-
-            if temp_job.is_failing:
-                broken_job_count += 1
-                broken_jobs.append(temp_job)
-            elif temp_job.is_disabled:
-                disabled_jobs_count += 1
-                disabled_jobs.append(temp_job)
-            elif temp_job.is_unstable:
-                unstable_job_count += 1
-                unstable_jobs.append(temp_job)
-
-        return {"broken_jobs_count": broken_job_count,
-                "disabled_jobs_count": disabled_jobs_count,
-                "unstable_jobs_count": unstable_job_count,
+        for job in job_data:
+            color = job.get("color")
+            if color == "red":
+                broken_jobs.append(Job.instantiate(job, self._api))
+            elif color == "disabled":
+                disabled_jobs.append(Job.instantiate(job, self._api))
+            elif color == "yellow":
+                unstable_jobs.append(Job.instantiate(job, self._api))
+
+        return {"broken_jobs_count": len(broken_jobs),
+                "disabled_jobs_count": len(disabled_jobs),
+                "unstable_jobs_count": len(unstable_jobs),
                 "broken_jobs": broken_jobs,
                 "unstable_jobs": unstable_jobs,
                 "disabled_jobs": disabled_jobs}
 
+    def _find_nested_job_data(self, depth):
+        """Loads the listing data for all jobs nested within this view
+
+        Args:
+            depth (int):
+                number of levels of nesting to load with each query
+
+        Returns:
+            list (dict):
+                listing data for each unique job found within the view, its
+                sub-views and any jobs that contain other jobs
+        """
+        query = tree_query([_nested_tree(depth)])
+        retval = {}
+        visited = set()
+        pending = [self._api.url]
+        while pending:
+            cur_url = pending.pop(0)
+            if cur_url in visited:
+                continue
+            visited.add(cur_url)
+            data = self._api.get_api_data(
+                target_url=cur_url, query_params=query)
+            pending.extend(_walk_nested_tree(data, depth, retval))
+        return list(retval.values())
+
     def _clone_view_helper(self, new_view_name):
         """Internal helper method used by the :py:meth:`.clone` method.
         Generates the XML definition for the view being created as part
@@ -250,18 +382,7 @@ class View:
             View:
                 PyJen view object wrapping the REST API for the given view
         """
-        # TODO: Find some way to cache the json data given inside the view so
-        #       we can lazy-load API data. For example, the name of the view
-        #       is always included in the json data and therefore queries for
-        #       the View name after creation should not require another hit
-        #       to the REST API
         log = logging.getLogger(__name__)
-        # The default view will not have a valid view URL
-        # so we need to look for this and generate a corrected one
-        view_url = json_data["url"]
-        if '/view/' not in view_url:
-            view_url = view_url + "view/" + json_data["name"]
-
         # Extract the name of the Jenkins plugin associated with this view
         # Sanity Check: make sure the metadata for the view has a "_class"
         #               attribute. I'm pretty sure older version of the Jenkins
@@ -285,7 +406,12 @@ class View:
             log.debug("Unable to find plugin for class %s", json_data["_class"])
             plugin_class = View
 
-        return plugin_class(rest_api.clone(view_url))
+        # The summary data we were given typically includes the name, URL and
+        # status of the view, so we seed our new object with it to avoid
+        # having to hit the REST API again just to read those values
+        new_api = rest_api.clone(view_url(json_data))
+        new_api.seed(json_data)
+        return plugin_class(new_api)
 
     @classmethod
     def get_supported_plugins(cls):
@@ -304,5 +430,58 @@ class View:
         return ViewXML
 
 
+def _nested_tree(depth):
+    """Generates a tree expression listing jobs nested within a container
+
+    Args:
+        depth (int):
+            number of levels of nesting to expand. Containers at the deepest
+            level only report the URLs of their children, so the caller can
+            tell whether they need to be expanded further.
+
+    Returns:
+        str:
+            tree expression describing jobs and views nested within a view
+            or job
+    """
+    if depth <= 0:
+        return "jobs[url],views[url]"
+    nested = _nested_tree(depth - 1)
+    return f"jobs[name,url,color,_class,{nested}],views[url,_class,{nested}]"
+
+
+def _walk_nested_tree(data, depth, jobs):
+    """Collects the job listings from data loaded with :py:func:`_nested_tree`
+
+    Args:
+        data (dict):
+            JSON data for a view or job, loaded with a tree expression of the
+            given depth
+        depth (int):
+            depth of the tree expression used to load the data
+        jobs (dict):
+            mapping of job URLs to job listings, updated with all jobs found
+            in the data
+
+    Returns:
+        list (str):
+            URLs of containers whose children were not loaded because they
+            are nested deeper than the given depth
+    """
+    if depth <= 0:
+        if data.get("jobs") or data.get("views"):
+            return [data["url"]]
+        return []
+
+    retval = []
+    for cur_job in data.get("jobs", []):
+        if "color" in cur_job:
+            jobs.setdefault(cur_job["url"], cur_job)
+        retval.extend(_walk_nested_tree(cur_job, depth - 1, jobs))
+    for cur_view in data.get("views", []):
+        retval.extend(_walk_nested_tree(cur_view, depth - 1, jobs))
+    return retval
+
+
 if __name__ == "__main__":  # pragma: no cover
     pass
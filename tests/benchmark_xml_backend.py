@@ -0,0 +1,120 @@
+"""Compares the performance of the XML backends on recorded job configurations
+
+Run it directly, with lxml installed:
+
+::
+
+    python tests/benchmark_xml_backend.py
+
+The configurations measured are the config.xml files returned by the Jenkins
+server recorded in the test cassettes, grouped by the type of their root
+node. For each group and XML backend the script reports the best time taken to
+parse every configuration in the group, to serialize them again, and to walk
+all of their nodes the way the PyJen plugins read them.
+"""
+import argparse
+import glob
+import os
+import timeit
+import yaml
+from pyjen.utils import xml_backend
+
+_CASSETTE_DIR = os.path.join(os.path.dirname(__file__), "cassettes")
+
+
+def recorded_configs(cassette_dir):
+    """Loads the config.xml files recorded in a folder of test cassettes
+
+    Args:
+        cassette_dir (str):
+            folder containing the cassettes, searched recursively
+
+    Returns:
+        dict:
+            lists of unique configurations, keyed by the tag of their root
+            node
+    """
+    retval = {}
+    pattern = os.path.join(cassette_dir, "**", "*.yaml")
+    for cur_file in sorted(glob.glob(pattern, recursive=True)):
+        with open(cur_file, encoding="utf-8") as handle:
+            cassette = yaml.safe_load(handle)
+        for cur_interaction in cassette["interactions"]:
+            request = cur_interaction["request"]
+            response = cur_interaction["response"]
+            if request["method"] != "GET" or \
+                    not request["uri"].endswith("config.xml") or \
+                    response["status"]["code"] != 200:
+                continue
+            text = response["body"]["string"]
+            if isinstance(text, bytes):
+                text = text.decode("utf-8")
+            tag = xml_backend.fromstring(text).tag
+            configs = retval.setdefault(tag, [])
+            if text not in configs:
+                configs.append(text)
+    return retval
+
+
+def read_config(root):
+    """Reads the tag, attributes and text of every node in a configuration"""
+    retval = 0
+    for cur_node in root.iter():
+        retval += len(cur_node.tag) + len(cur_node.attrib)
+        retval += len(cur_node.text or "")
+    return retval
+
+
+def measure(texts, repeat):
+    """Times the XML operations on configurations using the current backend
+
+    Args:
+        texts (list):
+            the configurations
+        repeat (int):
+            number of times to repeat each measurement
+
+    Returns:
+        tuple (float):
+            best times, in milliseconds, taken to parse, serialize and read
+            all of the configurations
+    """
+    roots = [xml_backend.fromstring(cur) for cur in texts]
+    retval = []
+    for operation in (lambda: [xml_backend.fromstring(cur) for cur in texts],
+                      lambda: [xml_backend.tostring(cur) for cur in roots],
+                      lambda: [read_config(cur) for cur in roots]):
+        timer = timeit.Timer(operation)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=repeat, number=number))
+        retval.append(best / number * 1000)
+    return tuple(retval)
+
+
+def main():
+    """Entry point function"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cassettes", default=_CASSETTE_DIR,
+                        help="folder containing the recorded test cassettes")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="number of times to repeat each measurement")
+    args = parser.parse_args()
+
+    xml_backend.use_backend(xml_backend.ETREE)
+    configs = recorded_configs(args.cassettes)
+    if not configs:
+        parser.error(f"no recorded configurations found in {args.cassettes}")
+
+    print(f"{'root node':<45}{'count':>6}{'size (KB)':>10}{'backend':>9}"
+          f"{'parse (ms)':>12}{'serialize (ms)':>16}{'read (ms)':>11}")
+    for tag, texts in sorted(configs.items()):
+        size = sum(len(cur) for cur in texts) / 1024
+        for backend in (xml_backend.ETREE, xml_backend.LXML):
+            xml_backend.use_backend(backend)
+            parse, serialize, read = measure(texts, args.repeat)
+            print(f"{tag:<45}{len(texts):>6}{size:>10.1f}{backend:>9}"
+                  f"{parse:>12.3f}{serialize:>16.3f}{read:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+import asyncio
+import pytest
+from requests.exceptions import InvalidHeader
+
+aiohttp = pytest.importorskip("aiohttp")
+
+# pylint: disable=wrong-import-position
+from pyjen.aio import Jenkins
+from pyjen.aio.build import Build
+from pyjen.aio.job import Job
+from pyjen.aio.jenkins_api import AsyncServerContext
+from .utils import FakeAsyncSession
+
+
+def _jenkins(responses):
+    context = AsyncServerContext()
+    context._session = FakeAsyncSession(responses)
+    return Jenkins("http://server", context), context._session
+
+
+_VERSION = ("GET", "http://server/api/python")
+_CRUMB = ("GET", "http://server/crumbIssuer/api/json")
+
+
+def test_jobs_loaded_with_one_request():
+    jenkins, session = _jenkins({
+        ("GET", "http://server/api/json?tree=jobs[name,url,color]"): [
+            (200, {"jobs": [
+                {"name": "a", "url": "http://server/job/a/", "color": "blue"},
+                {"name": "b", "url": "http://server/job/b/",
+                 "color": "disabled"},
+            ]}),
+        ],
+    })
+
+    async def _run():
+        async with jenkins:
+            jobs = await jenkins.jobs
+            names = await asyncio.gather(*(cur.name for cur in jobs))
+            disabled = [await cur.is_disabled for cur in jobs]
+        return names, disabled
+
+    assert asyncio.run(_run()) == (["a", "b"], [False, True])
+    assert len(session.requests) == 1
+
+
+def test_find_job_not_found():
+    jenkins, _ = _jenkins({
+        ("GET", "http://server/api/json?tree=jobs[name,url,color]"): [
+            (200, {"jobs": []}),
+        ],
+    })
+
+    assert asyncio.run(jenkins.find_job("missing")) is None
+
+
+def test_concurrent_posts_share_crumb():
+    jenkins, session = _jenkins({
+        _VERSION: [(200, None, {"x-jenkins": "2.200"})],
+        _CRUMB: [(200, {"crumbRequestField": "Jenkins-Crumb",
+                        "crumb": "abc"})],
+        ("GET", "http://server/api/json?tree=jobs[name,url,color]"): [
+            (200, {"jobs": [
+                {"name": str(i), "url": f"http://server/job/{i}/",
+                 "color": "blue"}
+                for i in range(20)
+            ]}),
+        ],
+        **{("POST", f"http://server/job/{i}/disable"): [(200,)]
+           for i in range(20)},
+    })
+
+    async def _run():
+        jobs = await jenkins.jobs
+        await asyncio.gather(*(cur.disable() for cur in jobs))
+
+    asyncio.run(_run())
+
+    urls = [cur[1] for cur in session.requests]
+    assert urls.count(_VERSION[1]) == 1
+    assert urls.count(_CRUMB[1]) == 1
+    posts = [cur for cur in session.requests if cur[0] == "POST"]
+    assert len(posts) == 20
+    assert all(cur[2]["headers"] == {"Jenkins-Crumb": "abc"}
+               for cur in posts)
+
+
+def test_expired_crumb_refreshed():
+    jenkins, session = _jenkins({
+        _VERSION: [(200, None, {"x-jenkins": "2.200"})],
+        _CRUMB: [
+            (200, {"crumbRequestField": "Jenkins-Crumb", "crumb": "old"}),
+            (200, {"crumbRequestField": "Jenkins-Crumb", "crumb": "new"}),
+        ],
+        ("POST", "http://server/job/a/build"): [
+            (403,),
+            (201, None, {"Location": "http://server/queue/item/7/"}),
+        ],
+    })
+
+    job = Job(jenkins._api.clone("http://server/job/a"))
+
+    item = asyncio.run(job.start_build())
+
+    assert repr(item) == "http://server/queue/item/7/"
+    posts = [cur for cur in session.requests if cur[0] == "POST"]
+    assert [cur[2]["headers"] for cur in posts] == [
+        {"Jenkins-Crumb": "old"}, {"Jenkins-Crumb": "new"}]
+
+
+def test_wait_until_complete():
+    jenkins, session = _jenkins({
+        ("GET", "http://server/job/a/3/api/json?tree=building"): [
+            (200, {"building": True}),
+            (200, {"building": True}),
+            (200, {"building": False}),
+        ],
+    })
+    bld = Build(jenkins._api.clone("http://server/job/a/3"))
+
+    assert asyncio.run(bld.wait_until_complete(poll_interval=0.01)) is True
+    assert len(session.requests) == 3
+
+
+def test_wait_until_complete_timeout():
+    jenkins, _ = _jenkins({
+        ("GET", "http://server/job/a/3/api/json?tree=building"): [
+            (200, {"building": True}),
+        ],
+    })
+    bld = Build(jenkins._api.clone("http://server/job/a/3"))
+
+    assert asyncio.run(bld.wait_until_complete(
+        timeout=0.05, poll_interval=0.01)) is False
+
+
+def test_queue_item_removed():
+    jenkins, _ = _jenkins({
+        ("GET", "http://server/queue/api/json?tree=items[url]"): [
+            (200, {"items": [{"url": "queue/item/4/"}]}),
+        ],
+        ("GET", "http://server/queue/item/4/api/json?tree=id"): [(404,)],
+        ("GET", "http://server/queue/item/4/api/json?tree=executable[url]"):
+            [(404,)],
+    })
+
+    async def _run():
+        items = await jenkins.build_queue.items
+        return items, await items[0].uid, await items[0].build
+
+    items, uid, bld = asyncio.run(_run())
+    assert [repr(cur) for cur in items] == ["http://server/queue/item/4/"]
+    assert uid is None
+    assert bld is None
+
+
+def test_nodes_seeded():
+    jenkins, session = _jenkins({
+        ("GET", "http://server/computer/api/json"
+                "?tree=computer[displayName,idle,offline,numExecutors]"): [
+            (200, {"computer": [
+                {"displayName": "Built-In Node", "idle": True,
+                 "offline": False, "numExecutors": 2},
+                {"displayName": "agent1", "idle": False,
+                 "offline": False, "numExecutors": 4},
+            ]}),
+        ],
+    })
+
+    async def _run():
+        node = await jenkins.find_node("agent1")
+        return node.url, await node.is_idle, await node.number_of_executors
+
+    assert asyncio.run(_run()) == ("http://server/computer/agent1/", False, 4)
+    assert len(session.requests) == 1
+
+
+def test_node_urls_quoted():
+    jenkins, _ = _jenkins({
+        ("GET", "http://server/computer/api/json"
+                "?tree=computer[displayName,idle,offline,numExecutors]"): [
+            (200, {"computer": [
+                {"displayName": "Built-In Node", "idle": True,
+                 "offline": False, "numExecutors": 2},
+                {"displayName": "my agent/1", "idle": False,
+                 "offline": False, "numExecutors": 4},
+            ]}),
+        ],
+    })
+
+    nodes = asyncio.run(jenkins.nodes)
+
+    assert [cur.url for cur in nodes] == [
+        "http://server/computer/(built-in)/",
+        "http://server/computer/my%20agent%2F1/"]
+
+
+def test_primary_view_url():
+    jenkins, _ = _jenkins({
+        ("GET", "http://server/api/json?tree=views[name,url]"): [
+            (200, {"views": [
+                {"name": "all", "url": "http://server/"},
+                {"name": "my view", "url": "http://server/view/my%20view/"},
+            ]}),
+        ],
+        ("GET", "http://server/api/json?tree=primaryView[name,url]"): [
+            (200, {"primaryView": {"name": "all", "url": "http://server/"}}),
+        ],
+    })
+
+    views = asyncio.run(jenkins.views)
+    default_view = asyncio.run(jenkins.default_view)
+
+    assert [repr(cur) for cur in views] == [
+        "http://server/view/all/", "http://server/view/my%20view/"]
+    assert repr(default_view) == "http://server/view/all/"
+
+
+def test_missing_version_header():
+    jenkins, _ = _jenkins({_VERSION: [(200, None, {})]})
+
+    with pytest.raises(InvalidHeader):
+        asyncio.run(jenkins._api.jenkins_version())
+
+
+def test_connection_limit():
+    jenkins = Jenkins.basic_auth("http://server", ("user", "token"),
+                                 max_connections=5)
+
+    async def _run():
+        async with jenkins:
+            session = jenkins._context.session
+            return session.connector.limit, session.headers["Authorization"]
+
+    assert asyncio.run(_run()) == (5, "Basic dXNlcjp0b2tlbg==")
+
+
+def test_post_invalidates_seeded_data():
+    jenkins, session = _jenkins({
+        _VERSION: [(200, None, {"x-jenkins": "1.651"})],
+        ("GET", "http://server/api/json?tree=jobs[name,url,color]"): [
+            (200, {"jobs": [
+                {"name": "a", "url": "http://server/job/a/", "color": "blue"},
+                {"name": "b", "url": "http://server/job/b/", "color": "blue"},
+            ]}),
+        ],
+        ("POST", "http://server/job/a/disable"): [(200,)],
+        ("GET", "http://server/job/b/api/json?tree=color"): [
+            (200, {"color": "disabled"}),
+        ],
+    })
+    assert jenkins._api._context._lock is None
+
+    async def _run():
+        job_a, job_b = await jenkins.jobs
+        before = await job_b.is_disabled
+        await job_a.disable()
+        return before, await job_b.is_disabled
+
+    # other objects reload their data once any change is made to the server
+    assert asyncio.run(_run()) == (False, True)
+    assert session.requests[-1][1] == \
+        "http://server/job/b/api/json?tree=color"
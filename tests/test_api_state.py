@@ -0,0 +1,44 @@
+from pyjen.utils.api_state import CrumbCache, SeedData, ServerState
+
+
+def test_crumb_cache():
+    crumbs = CrumbCache()
+    assert crumbs.value is None
+    assert crumbs.url("http://server/") == \
+        "http://server/crumbIssuer/api/json"
+
+    old = crumbs.store(200, {"crumbRequestField": "Crumb", "crumb": "a"})
+    assert old == {"Crumb": "a"}
+    assert CrumbCache.is_rejected(old, 403)
+    assert not CrumbCache.is_rejected(old, 200)
+    assert not CrumbCache.is_rejected('', 403)
+
+    # a concurrent caller already replaced the rejected crumb
+    crumbs.store(200, {"crumbRequestField": "Crumb", "crumb": "b"})
+    crumbs.invalidate(old)
+    assert crumbs.value == {"Crumb": "b"}
+    crumbs.invalidate({"Crumb": "b"})
+    assert crumbs.value is None
+
+    headers = {"Accept": "*/*", "Crumb": "a"}
+    CrumbCache.replace(headers, old, {"Other": "c"})
+    assert headers == {"Accept": "*/*", "Other": "c"}
+
+    assert crumbs.store(404, None) == ''
+
+
+def test_seed_data_generation():
+    state = ServerState()
+    seed = SeedData(state)
+    assert not seed.covers(["name"])
+
+    seed.update({"name": "a", "color": "blue"}, ["lastBuild[url]"])
+    assert seed.covers(["name", "color", "lastBuild[url]"])
+    assert not seed.covers(["lastBuild[number]"])
+
+    state.modified()
+    assert seed.covers(["name"])
+    assert not seed.covers(["color"])
+
+    seed.clear()
+    assert not seed.covers(["name"])
@@ -0,0 +1,201 @@
+import hashlib
+import io
+import zipfile
+import pytest
+from mock import MagicMock
+from requests.exceptions import HTTPError
+from pyjen.build import Build
+from pyjen.utils.artifacts import ArtifactDownloader
+from pyjen.utils.jenkins_api import JenkinsAPI
+
+
+def _response(content=b"", status_code=200, headers=None):
+    """Generates a mock streamed response"""
+    retval = MagicMock()
+    retval.status_code = status_code
+    retval.headers = headers or {}
+    retval.iter_content.side_effect = \
+        lambda size: [content[i:i + size] for i in range(0, len(content), size)]
+    retval.__enter__.return_value = retval
+    return retval
+
+
+def _http_error(status_code, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return HTTPError(response=response)
+
+
+def _md5(content):
+    return hashlib.md5(content).hexdigest()
+
+
+def test_download_streams_to_disk(tmp_path):
+    api = MagicMock()
+    api.get_stream.return_value = _response(b"0123456789")
+    downloader = ArtifactDownloader(api, str(tmp_path), chunk_size=3)
+
+    path = downloader.download("out/my file.txt", _md5(b"0123456789"))
+
+    assert path == str(tmp_path / "out" / "my file.txt")
+    assert (tmp_path / "out" / "my file.txt").read_bytes() == b"0123456789"
+    api.get_stream.assert_called_once_with("artifact/out/my%20file.txt",
+                                           headers=None)
+
+
+def test_resume_partial_download(tmp_path):
+    (tmp_path / "data.bin").write_bytes(b"01234")
+    api = MagicMock()
+    api.get_stream.return_value = _response(b"56789", status_code=206)
+    downloader = ArtifactDownloader(api, str(tmp_path))
+
+    downloader.download("data.bin", _md5(b"0123456789"))
+
+    assert (tmp_path / "data.bin").read_bytes() == b"0123456789"
+    api.get_stream.assert_called_once_with(
+        "artifact/data.bin", headers={"Range": "bytes=5-"})
+
+
+def test_range_ignored_by_server(tmp_path):
+    (tmp_path / "data.bin").write_bytes(b"stale")
+    api = MagicMock()
+    api.get_stream.return_value = _response(b"0123456789")
+    downloader = ArtifactDownloader(api, str(tmp_path))
+
+    downloader.download("data.bin")
+
+    assert (tmp_path / "data.bin").read_bytes() == b"0123456789"
+
+
+def test_skip_matching_fingerprint(tmp_path):
+    (tmp_path / "data.bin").write_bytes(b"0123456789")
+    api = MagicMock()
+    downloader = ArtifactDownloader(api, str(tmp_path))
+
+    downloader.download("data.bin", _md5(b"0123456789"))
+
+    api.get_stream.assert_not_called()
+
+
+def test_already_complete_without_fingerprint(tmp_path):
+    (tmp_path / "data.bin").write_bytes(b"0123456789")
+    api = MagicMock()
+    api.get_stream.side_effect = _http_error(
+        416, {"Content-Range": "bytes */10"})
+    downloader = ArtifactDownloader(api, str(tmp_path))
+
+    downloader.download("data.bin")
+
+    assert (tmp_path / "data.bin").read_bytes() == b"0123456789"
+    assert api.get_stream.call_count == 1
+
+
+def test_local_copy_larger_than_artifact(tmp_path):
+    (tmp_path / "data.bin").write_bytes(b"0123456789abc")
+    api = MagicMock()
+    api.get_stream.side_effect = [
+        _http_error(416, {"Content-Range": "bytes */10"}),
+        _response(b"0123456789"),
+    ]
+    downloader = ArtifactDownloader(api, str(tmp_path))
+
+    downloader.download("data.bin")
+
+    assert (tmp_path / "data.bin").read_bytes() == b"0123456789"
+    api.get_stream.assert_called_with("artifact/data.bin", headers=None)
+
+
+def test_corrupt_download(tmp_path):
+    api = MagicMock()
+    api.get_stream.side_effect = lambda *args, **kwargs: _response(b"bad")
+    downloader = ArtifactDownloader(api, str(tmp_path))
+
+    with pytest.raises(IOError):
+        downloader.download("data.bin", _md5(b"good"))
+    assert api.get_stream.call_count == 2
+
+
+def test_path_outside_destination(tmp_path):
+    downloader = ArtifactDownloader(MagicMock(), str(tmp_path / "dest"))
+
+    with pytest.raises(ValueError):
+        downloader.target("../escaped.txt")
+
+
+def test_download_all_as_archive(tmp_path):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("archive/a.txt", b"first")
+        archive.writestr("archive/sub/b.txt", b"second")
+    api = MagicMock()
+    api.get_stream.return_value = _response(buffer.getvalue())
+    downloader = ArtifactDownloader(api, str(tmp_path))
+
+    paths = downloader.download_all([("a.txt", None), ("sub/b.txt", None)],
+                                    zip_threshold=2)
+
+    assert paths == [str(tmp_path / "a.txt"), str(tmp_path / "sub" / "b.txt")]
+    assert (tmp_path / "a.txt").read_bytes() == b"first"
+    assert (tmp_path / "sub" / "b.txt").read_bytes() == b"second"
+    api.get_stream.assert_called_once_with("artifact/*zip*/archive.zip")
+
+
+def test_build_download_artifacts_by_pattern(tmp_path):
+    data = {
+        "artifacts": [
+            {"relativePath": "lib/core.jar"},
+            {"relativePath": "lib/extra.jar"},
+            {"relativePath": "logs/build.log"},
+        ],
+        "fingerprint": [
+            {"fileName": "core.jar", "hash": _md5(b"core")},
+            {"fileName": "extra.jar", "hash": _md5(b"extra")},
+        ],
+    }
+    api_response = MagicMock()
+    api_response.json.return_value = data
+    session = MagicMock()
+    session.get.side_effect = lambda url, **kwargs: \
+        _response(b"extra") if kwargs.get("stream") else api_response
+    (tmp_path / "lib").mkdir()
+    (tmp_path / "lib" / "core.jar").write_bytes(b"core")
+    api = JenkinsAPI("http://server/job/a/1", session)
+
+    paths = Build(api).download_artifacts(str(tmp_path), pattern="lib/*",
+                                          zip_threshold=1)
+
+    assert sorted(paths) == [str(tmp_path / "lib" / "core.jar"),
+                             str(tmp_path / "lib" / "extra.jar")]
+    streamed = [cur_call for cur_call in session.get.call_args_list
+                if cur_call[1].get("stream")]
+    assert len(streamed) == 1
+    assert streamed[0][0][0] == "http://server/job/a/1/artifact/lib/extra.jar"
+
+
+def test_build_download_artifacts_ambiguous_fingerprints(tmp_path):
+    contents = {"a/report.xml": b"first", "b/report.xml": b"second"}
+    data = {
+        "artifacts": [{"relativePath": cur} for cur in contents],
+        "fingerprint": [
+            {"fileName": "report.xml", "hash": _md5(cur)}
+            for cur in contents.values()
+        ],
+    }
+    api_response = MagicMock()
+    api_response.json.return_value = data
+
+    def mock_get(url, **kwargs):
+        if not kwargs.get("stream"):
+            return api_response
+        return _response(contents[url.split("/artifact/")[1]])
+    session = MagicMock()
+    session.get.side_effect = mock_get
+    api = JenkinsAPI("http://server/job/a/1", session)
+
+    paths = Build(api).download_artifacts(str(tmp_path), zip_threshold=10)
+
+    assert sorted(paths) == [str(tmp_path / "a" / "report.xml"),
+                             str(tmp_path / "b" / "report.xml")]
+    assert (tmp_path / "a" / "report.xml").read_bytes() == b"first"
+    assert (tmp_path / "b" / "report.xml").read_bytes() == b"second"
@@ -1,8 +1,11 @@
 from datetime import datetime
 import pytest
-from .utils import clean_job, async_assert
+from mock import MagicMock, patch
+from .utils import clean_job, async_assert, mock_response
 from pyjen.plugins.shellbuilder import ShellBuilder
 from pyjen.plugins.freestylejob import FreestyleJob
+from pyjen.build import Build
+from pyjen.utils.jenkins_api import JenkinsAPI
 
 
 @pytest.mark.vcr()
@@ -110,3 +113,58 @@ def test_abort(jenkins_api):
 
         assert jb.last_build.is_building is False
         assert jb.last_build.result == "ABORTED"
+
+
+def _progressive_session(pages):
+    """Generates a mock HTTP session serving a growing console log
+
+    Args:
+        pages (list):
+            sequence of 2-tuples containing the new bytes of output returned
+            by each request, and whether the build is still running
+    """
+    log = b""
+    responses = []
+    for content, running in pages:
+        log += content
+        response = mock_response(headers={"X-Text-Size": str(len(log))})
+        response.__enter__.return_value = response
+        response.iter_content.side_effect = \
+            lambda size, data=content: [data[i:i + size]
+                                        for i in range(0, len(data), size)]
+        if running:
+            response.headers["X-More-Data"] = "true"
+        responses.append(response)
+    session = MagicMock()
+    session.get.side_effect = responses
+    return session
+
+
+def test_iter_console():
+    session = _progressive_session([
+        (b"Started\n", True),
+        (b"", True),
+        (b"", True),
+        ("Café\n".encode("utf-8"), False),
+    ])
+    bld = Build(JenkinsAPI("http://server/job/job1/1", session))
+
+    with patch("pyjen.build.time.sleep") as mock_sleep:
+        output = "".join(bld.iter_console(chunk_size=4))
+
+    assert output == "Started\nCafé\n"
+    offsets = [cur_call[1]["params"]["start"]
+               for cur_call in session.get.call_args_list]
+    assert offsets == [0, 8, 8, 8]
+    delays = [cur_call[0][0] for cur_call in mock_sleep.call_args_list]
+    assert delays == [1, 2, 4]
+
+
+def test_iter_console_no_follow():
+    session = _progressive_session([(b"Started\n", True)])
+    bld = Build(JenkinsAPI("http://server/job/job1/1", session))
+
+    output = "".join(bld.iter_console(follow=False, start=3))
+
+    assert output == "Started\n"
+    assert session.get.call_args[1]["params"] == {"start": 3}
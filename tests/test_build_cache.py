@@ -0,0 +1,118 @@
+import pytest
+from pyjen.build import Build
+from pyjen.utils.build_cache import BuildCache
+from pyjen.utils.jenkins_api import JenkinsAPI
+from .utils import mock_session
+
+
+def _build_session(building=False):
+    return mock_session({
+        "number": 1,
+        "building": building,
+        "result": None if building else "SUCCESS",
+        "description": "first build",
+    })
+
+
+def test_get_put(tmp_path):
+    cache = BuildCache(str(tmp_path / "builds.db"))
+    assert cache.get("http://server/job/a/1/") is None
+
+    cache.put("http://server/job/a/1/", {"number": 1})
+
+    assert cache.get("http://server/job/a/1/") == {"number": 1}
+    assert len(cache) == 1
+
+
+def test_persistent(tmp_path):
+    path = str(tmp_path / "builds.db")
+    BuildCache(path).put("http://server/job/a/1/", {"number": 1})
+
+    assert BuildCache(path).get("http://server/job/a/1/") == {"number": 1}
+
+
+def test_size_bounded_eviction(tmp_path):
+    cache = BuildCache(str(tmp_path / "builds.db"), max_size=100)
+    data = {"value": "x" * 30}
+    cache.put("http://server/job/a/1/", data)
+    cache.put("http://server/job/a/2/", data)
+    cache.get("http://server/job/a/1/")
+    cache.put("http://server/job/a/3/", data)
+
+    assert cache.size <= 100
+    assert cache.get("http://server/job/a/1/") == data
+    assert cache.get("http://server/job/a/2/") is None
+    assert cache.get("http://server/job/a/3/") == data
+
+
+def test_invalidate_prefix(tmp_path):
+    cache = BuildCache(str(tmp_path / "builds.db"))
+    cache.put("http://server/job/a/1/", {"number": 1})
+    cache.put("http://server/job/a/10/", {"number": 10})
+
+    cache.invalidate("http://server/job/a/1/")
+
+    assert cache.get("http://server/job/a/1/") is None
+    assert cache.get("http://server/job/a/10/") == {"number": 10}
+
+
+def test_invalid_size(tmp_path):
+    with pytest.raises(ValueError):
+        BuildCache(str(tmp_path / "builds.db"), max_size=0)
+
+
+def test_finished_build_reused_across_sessions(tmp_path):
+    path = str(tmp_path / "builds.db")
+    session1 = _build_session()
+    api1 = JenkinsAPI("http://server/job/a/1", session1)
+    api1.enable_build_cache(path)
+    assert Build(api1).result == "SUCCESS"
+    assert session1.get.call_count == 1
+
+    session2 = _build_session()
+    api2 = JenkinsAPI("http://server/job/a/1", session2)
+    api2.enable_build_cache(path)
+    bld = Build(api2)
+    assert bld.result == "SUCCESS"
+    assert bld.number == 1
+    session2.get.assert_not_called()
+
+    # descriptions may change at any time, so they bypass the cache
+    assert bld.description == "first build"
+    assert session2.get.call_count == 1
+
+
+def test_full_reads_bypass_cache(tmp_path):
+    path = str(tmp_path / "builds.db")
+    api1 = JenkinsAPI("http://server/job/a/1", _build_session())
+    api1.enable_build_cache(path)
+    Build(api1).refresh()
+
+    session2 = _build_session()
+    session2.get.return_value.json.return_value["description"] = "changed"
+    api2 = JenkinsAPI("http://server/job/a/1", session2)
+    api2.enable_build_cache(path)
+    bld = Build(api2)
+
+    # reads which may include volatile fields are loaded from the server
+    bld.refresh()
+    assert session2.get.call_count == 1
+    assert api2.get_api_data()["description"] == "changed"
+    assert session2.get.call_count == 2
+
+    # reads of specific fields still use the cache
+    assert bld.result == "SUCCESS"
+    assert session2.get.call_count == 2
+
+
+def test_running_build_not_cached(tmp_path):
+    path = str(tmp_path / "builds.db")
+    session = _build_session(building=True)
+    api = JenkinsAPI("http://server/job/a/1", session)
+    api.enable_build_cache(path)
+    bld = Build(api)
+
+    assert bld.is_building
+    assert bld.is_building
+    assert session.get.call_count == 2
+    assert len(BuildCache(path)) == 0
@@ -0,0 +1,98 @@
+import time
+from mock import MagicMock
+from pyjen.build import Build, wait_all
+from pyjen.utils.build_waiter import _PendingBuild
+from pyjen.utils.jenkins_api import JenkinsAPI
+from .utils import FakeServer, mock_response
+
+
+class _BuildServer(FakeServer):
+    """Mock HTTP session serving the status of the builds of several jobs"""
+
+    def __init__(self, jobs):
+        super().__init__()
+        # the status of every build of each job, as lists of "building" flags
+        # per build number, where each flag is consumed by one request
+        self.jobs = jobs
+
+    def respond(self, url):
+        job_url, query = url.split("api/json?")
+        name = job_url.rstrip("/").rsplit("/", 1)[-1]
+        window = int(query.rsplit(",", 1)[1].rstrip("}"))
+        builds = []
+        for number in sorted(self.jobs[name], reverse=True)[:window]:
+            states = self.jobs[name][number]
+            building = states.pop(0) if len(states) > 1 else states[0]
+            builds.append({
+                "number": number,
+                "building": building,
+                "result": None if building else "SUCCESS",
+                "timestamp": 0,
+                "estimatedDuration": -1,
+            })
+        return mock_response({"builds": builds})
+
+
+def _builds(server, *urls):
+    api = JenkinsAPI("http://server", server.session)
+    return [Build(api.clone(cur_url)) for cur_url in urls]
+
+
+def test_wait_all_batches_per_job():
+    server = _BuildServer({
+        "a": {1: [False], 2: [True, True, False], 3: [True, False]},
+        "b": {7: [True, False]},
+    })
+    builds = _builds(server, "http://server/job/a/1", "http://server/job/a/2",
+                     "http://server/job/a/3", "http://server/job/b/7")
+
+    assert wait_all(builds, timeout=10, poll_interval=0.01) is True
+
+    assert all(cur_url.startswith(("http://server/job/a/api/json",
+                                   "http://server/job/b/api/json"))
+               for cur_url in server.urls)
+    assert len(server.urls) <= 5
+    count = len(server.urls)
+    assert [cur_build.result for cur_build in builds] == ["SUCCESS"] * 4
+    assert len(server.urls) == count
+
+
+def test_window_widened_for_older_builds():
+    states = {number: [False] for number in range(1, 31)}
+    states[3] = [True, False]
+    server = _BuildServer({"a": states})
+    bld = _builds(server, "http://server/job/a/3")[0]
+
+    assert bld.wait_until_complete(timeout=10, poll_interval=0.01) is True
+
+    assert server.urls[:3] == [
+        "http://server/job/a/api/json?tree=builds[number,building,result,"
+        f"timestamp,estimatedDuration]{{0,{window}}}"
+        for window in (10, 20, 40)
+    ]
+
+
+def test_wait_timeout():
+    server = _BuildServer({"a": {1: [True]}})
+    bld = _builds(server, "http://server/job/a/1")[0]
+
+    start = time.monotonic()
+    assert bld.wait_until_complete(timeout=0.2, poll_interval=0.05) is False
+    assert time.monotonic() - start < 5
+
+
+def test_backoff_seeded_from_estimate():
+    pending = _PendingBuild(MagicMock(url="http://server/job/a/1/"), (1, 60))
+    started = time.time() * 1000 - 10000
+
+    # first checked once the build is expected to have completed...
+    pending.reschedule({"timestamp": started, "estimatedDuration": 40000}, 0)
+    assert 29 < pending.due <= 30
+
+    # ...and with exponentially increasing delays after that
+    overdue = {"timestamp": started, "estimatedDuration": 5000}
+    delays = []
+    for _ in range(8):
+        pending.reschedule(overdue, 0)
+        delays.append(pending.due)
+    assert delays == [1, 2, 4, 8, 16, 32, 60, 60]
@@ -0,0 +1,123 @@
+import threading
+import time
+import pytest
+from mock import MagicMock, PropertyMock, patch
+from requests.exceptions import HTTPError
+from pyjen import bulk
+from pyjen.bulk import BulkOperationError, RateLimiter
+from pyjen.view import View
+
+
+class _FakeJob:
+    """Stand in for a job which records how many operations ran at once"""
+
+    def __init__(self, name, tracker, fail=False):
+        self.name = name
+        self.tracker = tracker
+        self.fail = fail
+        self._api = MagicMock(root_url="http://server/")
+
+    def __repr__(self):
+        return self.name
+
+    def disable(self):
+        with self.tracker["lock"]:
+            self.tracker["active"] += 1
+            self.tracker["peak"] = max(self.tracker["peak"],
+                                       self.tracker["active"])
+        time.sleep(0.01)
+        with self.tracker["lock"]:
+            self.tracker["active"] -= 1
+        if self.fail:
+            raise RuntimeError(f"failed to disable {self.name}")
+        return self.name
+
+
+def _jobs(count, failing=()):
+    tracker = {"lock": threading.Lock(), "active": 0, "peak": 0}
+    jobs = [_FakeJob(str(i), tracker, i in failing) for i in range(count)]
+    return jobs, tracker
+
+
+def test_apply_bounded_concurrency():
+    jobs, tracker = _jobs(20)
+
+    result = bulk.apply(jobs, "disable", workers=4)
+
+    assert [value for _, value in result.succeeded] == \
+        [str(i) for i in range(20)]
+    assert not result.failed
+    assert 1 < tracker["peak"] <= 4
+
+
+def test_apply_collects_failures():
+    jobs, _ = _jobs(10, failing=(2, 7))
+    progress = []
+
+    result = bulk.apply(jobs, lambda job: job.disable(),
+                        progress=lambda done, total: progress.append(
+                            (done, total)))
+
+    assert len(result) == 10
+    assert [job.name for job, _ in result.failed] == ["2", "7"]
+    assert all(isinstance(err, RuntimeError) for _, err in result.failed)
+    assert len(result.succeeded) == 8
+    assert sorted(progress) == [(i, 10) for i in range(1, 11)]
+    with pytest.raises(BulkOperationError) as err:
+        result.raise_for_errors()
+    assert err.value.result is result
+    assert "2 of 10" in str(err.value)
+
+
+def test_apply_empty():
+    result = bulk.apply([], "disable")
+
+    assert len(result) == 0
+    result.raise_for_errors()
+
+
+def test_rate_limit():
+    jobs, _ = _jobs(6)
+
+    start = time.monotonic()
+    bulk.apply(jobs, "disable", workers=6, rate=50)
+
+    # the first operation starts right away, the rest 1/50th of a second apart
+    assert time.monotonic() - start >= 5 / 50
+
+
+def test_rate_limiter_spacing():
+    limiter = RateLimiter(100)
+
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.wait()
+
+    assert time.monotonic() - start >= 4 / 100
+
+
+def test_view_disable_all_jobs_reports_failures():
+    jobs, _ = _jobs(5, failing=(3,))
+    view = View(MagicMock())
+
+    with patch.object(View, "jobs", new_callable=PropertyMock,
+                      return_value=jobs):
+        with pytest.raises(BulkOperationError) as err:
+            view.disable_all_jobs(workers=2)
+    assert [job.name for job, _ in err.value.result.failed] == ["3"]
+    assert len(err.value.result.succeeded) == 4
+
+
+def test_view_bulk_errors_are_http_errors():
+    response = MagicMock(status_code=500)
+    jobs = [MagicMock(), MagicMock()]
+    jobs[1].delete.side_effect = HTTPError("server error", response=response)
+    view = View(MagicMock())
+
+    with patch.object(View, "jobs", new_callable=PropertyMock,
+                      return_value=jobs):
+        with pytest.raises(HTTPError) as err:
+            view.delete_all_jobs()
+    assert isinstance(err.value, BulkOperationError)
+    assert err.value.response is response
+    jobs[0].delete.assert_called_once_with()
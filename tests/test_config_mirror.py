@@ -0,0 +1,235 @@
+import os
+import pytest
+from mock import patch
+from urllib.parse import unquote
+from requests.exceptions import HTTPError
+from pyjen.jenkins import Jenkins
+from pyjen.job import Job
+from pyjen.utils import xml_backend
+from pyjen.utils.config_mirror import ConfigMirror, relative_path
+from .utils import FakeServer, mock_response
+
+
+class _MirrorServer(FakeServer):
+    """Mock HTTP session serving job and view listings and configurations"""
+
+    def __init__(self):
+        super().__init__()
+        self.jobs = {
+            "a": {"description": "first"},
+            "f": {"jobs": {"b": {"description": "nested"}}},
+        }
+        # views nested within other views are listed under "views"
+        self.views = {"all": {}, "my view": {}}
+        self.config_requests = []
+        self.view_requests = []
+        # URLs of configurations which fail to load
+        self.errors = {}
+
+    def _listing(self, prefix, jobs):
+        retval = []
+        for name, data in jobs.items():
+            entry = {"url": f"{prefix}job/{name}/", "_class": "Project",
+                     "description": data.get("description")}
+            if "jobs" in data:
+                entry["jobs"] = self._listing(entry["url"], data["jobs"])
+            retval.append(entry)
+        return retval
+
+    def _views(self, views):
+        retval = []
+        for name, data in views.items():
+            entry = {"name": name, "_class": "ListView",
+                     "url": "http://server/"}
+            if "views" in data:
+                entry["_class"] = "NestedView"
+                entry["views"] = self._views(data["views"])
+            retval.append(entry)
+        return retval
+
+    def respond(self, url):
+        if url.endswith("config.xml"):
+            self.config_requests.append(url)
+            return mock_response(text=f"<config url='{url}'/>",
+                                 status_code=self.errors.get(url, 200))
+        if "tree=views" in url:
+            self.view_requests.append(url)
+            views = self.views
+            for name in url.split("/api/")[0].split("/view/")[1:]:
+                views = views[unquote(name)]["views"]
+            return mock_response({"views": self._views(views)})
+        prefix = url.split("api/json")[0]
+        jobs = self.jobs
+        for name in prefix.split("/job/")[1:]:
+            jobs = jobs[name.strip("/")]["jobs"]
+        return mock_response({"jobs": self._listing(prefix, jobs)})
+
+
+def _jenkins(server):
+    return Jenkins("http://server", server.session), server.session
+
+
+def test_relative_path():
+    root = "http://server/jenkins/"
+    assert relative_path(root, root + "job/a/job/b%20c/") == "jobs/a/jobs/b c"
+    assert relative_path(root, root + "view/all/job/a/") == "jobs/a"
+    assert relative_path(root, "http://other:8080/jenkins/view/v") == \
+        "views/v"
+    assert relative_path(root, root) is None
+    assert relative_path(root, root + "computer/agent/") is None
+
+
+def test_incremental_sync(tmp_path):
+    server = _MirrorServer()
+    jenkins, _ = _jenkins(server)
+
+    result = jenkins.sync_config_mirror(str(tmp_path))
+    assert result.fetched == ["jobs/a", "jobs/f", "jobs/f/jobs/b",
+                              "views/all", "views/my view"]
+    assert (tmp_path / "jobs" / "f" / "jobs" / "b" / "config.xml").read_text() \
+        == "<config url='http://server/job/f/job/b/config.xml'/>"
+    assert len(server.config_requests) == 5
+
+    server.jobs["f"]["jobs"]["b"]["description"] = "changed"
+    del server.jobs["a"]
+    server.config_requests = []
+    result = jenkins.sync_config_mirror(str(tmp_path))
+
+    assert result.fetched == ["jobs/f/jobs/b"]
+    assert result.unchanged == ["jobs/f", "views/all", "views/my view"]
+    assert result.removed == ["jobs/a"]
+    assert server.config_requests == [
+        "http://server/job/f/job/b/config.xml"]
+    assert not os.path.exists(tmp_path / "jobs" / "a")
+
+    result = jenkins.sync_config_mirror(str(tmp_path), full=True)
+    assert len(result.fetched) == 4
+
+
+def test_sync_nested_views(tmp_path):
+    server = _MirrorServer()
+    server.views["outer"] = {"views": {
+        "inner view": {"views": {"deepest": {}}}}}
+    jenkins, _ = _jenkins(server)
+
+    result = jenkins.sync_config_mirror(str(tmp_path))
+    assert "views/outer/views/inner view/views/deepest" in result.fetched
+    assert "http://server/view/outer/view/inner%20view/view/deepest/" \
+        "config.xml" in server.config_requests
+    assert len(server.view_requests) == 1
+
+    # views nested deeper than the query depth are loaded separately
+    # pylint: disable=protected-access
+    mirror = ConfigMirror(str(tmp_path))
+    server.view_requests = []
+    result = mirror.sync(jenkins._api, depth=1)
+    assert result.unchanged == [
+        "jobs/a", "jobs/f", "jobs/f/jobs/b", "views/all", "views/my view",
+        "views/outer", "views/outer/views/inner view",
+        "views/outer/views/inner view/views/deepest"]
+    assert len(server.view_requests) == 3
+
+
+def test_sync_jobs_deleted_during_sync(tmp_path):
+    server = _MirrorServer()
+    jenkins, _ = _jenkins(server)
+    jenkins.sync_config_mirror(str(tmp_path))
+
+    # deleted after being listed, but before its configuration was loaded
+    server.jobs["a"]["description"] = "changed"
+    server.errors["http://server/job/a/config.xml"] = 404
+    result = jenkins.sync_config_mirror(str(tmp_path))
+
+    assert result.fetched == []
+    assert result.removed == ["jobs/a"]
+    assert not os.path.exists(tmp_path / "jobs" / "a")
+
+
+def test_failed_sync_keeps_mirror(tmp_path):
+    server = _MirrorServer()
+    jenkins, _ = _jenkins(server)
+    jenkins.sync_config_mirror(str(tmp_path))
+
+    server.jobs["a"]["description"] = "changed"
+    server.jobs["f"]["description"] = "changed"
+    server.errors["http://server/job/f/config.xml"] = 500
+    with pytest.raises(HTTPError):
+        jenkins.sync_config_mirror(str(tmp_path))
+    server.config_requests = []
+    assert jenkins.mirrored_config("http://server/job/a")
+    assert server.config_requests == []
+
+    # the configurations which were out of date are downloaded by the next
+    # sync, including the one which loaded successfully before the failure
+    del server.errors["http://server/job/f/config.xml"]
+    result = jenkins.sync_config_mirror(str(tmp_path))
+    assert result.fetched == ["jobs/a", "jobs/f"]
+
+
+def test_configs_served_from_mirror(tmp_path):
+    server = _MirrorServer()
+    jenkins, session = _jenkins(server)
+    jenkins.sync_config_mirror(str(tmp_path))
+    server.config_requests = []
+
+    root = xml_backend.fromstring(
+        jenkins.mirrored_config("http://server/job/f/job/b"))
+    assert root.tag == "config"
+    assert root.attrib == {"url": "http://server/job/f/job/b/config.xml"}
+    assert server.config_requests == []
+
+    # changes made through the job invalidate the mirrored copy
+    # pylint: disable=protected-access
+    job = Job(jenkins._api.clone("http://server/job/f/job/b"))
+    job.disable()
+    session.post.assert_called_once()
+    assert "<config" in jenkins.mirrored_config(job._api.url)
+    assert server.config_requests == [
+        "http://server/job/f/job/b/config.xml"]
+
+    jenkins.disable_config_mirror()
+    assert jenkins.mirrored_config("http://server/job/a")
+    assert len(server.config_requests) == 2
+
+
+def test_config_updates_ignore_mirror(tmp_path):
+    server = _MirrorServer()
+    jenkins, session = _jenkins(server)
+    jenkins.sync_config_mirror(str(tmp_path))
+    (tmp_path / "jobs" / "a" / "config.xml").write_text("<stale/>")
+    server.config_requests = []
+
+    # pylint: disable=protected-access
+    job = Job(jenkins._api.clone("http://server/job/a"))
+    assert jenkins.mirrored_config(job._api.url) == "<stale/>"
+    assert "<config" in job.config_xml
+    assert server.config_requests == ["http://server/job/a/config.xml"]
+    session.post.assert_not_called()
+
+
+def test_mirror_max_age(tmp_path):
+    server = _MirrorServer()
+    jenkins, _ = _jenkins(server)
+    with patch("pyjen.utils.config_mirror.time.time", return_value=1000):
+        jenkins.sync_config_mirror(str(tmp_path))
+    (tmp_path / "jobs" / "a" / "config.xml").write_text("<stale/>")
+    server.config_requests = []
+
+    with patch("pyjen.utils.config_mirror.time.time", return_value=1060):
+        assert jenkins.mirrored_config("http://server/job/a") == "<stale/>"
+        assert jenkins.mirrored_config(
+            "http://server/job/a", max_age=120) == "<stale/>"
+        assert server.config_requests == []
+
+        # too old: reloaded from the server, and the mirror is updated
+        assert "<config" in jenkins.mirrored_config(
+            "http://server/job/a", max_age=30)
+        assert "<config" in jenkins.mirrored_config(
+            "http://server/job/a", max_age=30)
+        assert server.config_requests == ["http://server/job/a/config.xml"]
+
+    with patch("pyjen.utils.config_mirror.time.time", return_value=1100):
+        result = jenkins.sync_config_mirror(str(tmp_path), max_age=50)
+    assert result.fetched == ["jobs/f", "jobs/f/jobs/b", "views/all",
+                              "views/my view"]
+    assert result.unchanged == ["jobs/a"]
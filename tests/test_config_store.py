@@ -0,0 +1,91 @@
+from pyjen.jenkins import Jenkins
+from pyjen.plugins.freestylejob import FreestyleJob, FreestyleXML
+from pyjen.utils.config_store import ConfigStore, fetch_configs
+from pyjen.utils.jenkins_api import JenkinsAPI
+from .utils import FakeServer, mock_response
+
+_TEMPLATE = FreestyleJob.template_config_xml()
+_CUSTOM = _TEMPLATE.replace("<properties/>", "<quietPeriod>5</quietPeriod>"
+                            "<properties/>")
+
+
+def _config_session(configs):
+    """Mock session serving the config.xml of several jobs, keyed by name"""
+    def respond(url):
+        if "/job/" not in url:
+            # version check made before posting changes
+            return mock_response()
+        name = url.split("/job/")[1].split("/")[0]
+        return mock_response(text=configs[name])
+    return FakeServer(respond).session
+
+
+def test_store_dedupes_documents():
+    store = ConfigStore()
+
+    first = store.add(_TEMPLATE)
+    second = store.add(_CUSTOM)
+
+    assert store.add(_TEMPLATE) is first
+    assert first is not second
+    assert len(store) == 2
+    assert first.root is first.root
+    assert first.root.tag == "project"
+
+
+def test_fetch_configs_order():
+    session = _config_session({"a": _TEMPLATE, "b": _CUSTOM, "c": _TEMPLATE})
+    api = JenkinsAPI("http://server", session)
+    apis = [api.clone(f"http://server/job/{name}") for name in "abc"]
+
+    documents = fetch_configs(apis, workers=2)
+
+    assert [cur.text for cur in documents] == [_TEMPLATE, _CUSTOM, _TEMPLATE]
+    assert documents[0] is documents[2]
+    assert session.get.call_count == 3
+    assert fetch_configs([]) == []
+
+
+def test_jenkins_fetch_configs_shared_trees():
+    session = _config_session({"a": _TEMPLATE, "b": _CUSTOM, "c": _TEMPLATE})
+    jenkins = Jenkins("http://server", session)
+    api = JenkinsAPI("http://server", session)
+    jobs = [FreestyleJob(api.clone(f"http://server/job/{name}"))
+            for name in "abc"]
+
+    configs = jenkins.fetch_configs(jobs)
+
+    assert all(isinstance(cur, FreestyleXML) for cur in configs)
+    assert [cur.quiet_period for cur in configs] == [None, 5, None]
+    # pylint: disable=protected-access
+    assert configs[0]._root is not configs[2]._root
+    assert session.get.call_count == 3
+    session.get.reset_mock()
+
+    # edits apply to a private copy of the shared tree
+    with configs[0].edit():
+        configs[0].quiet_period = 10
+    assert configs[0].quiet_period == 10
+    assert configs[2].quiet_period is None
+    assert session.post.call_count == 1
+    assert all("/job/" not in cur[0][0]
+               for cur in session.get.call_args_list)
+
+
+def test_setters_do_not_modify_shared_trees():
+    session = _config_session({"a": _TEMPLATE, "b": _TEMPLATE})
+    jenkins = Jenkins("http://server", session)
+    api = JenkinsAPI("http://server", session)
+    jobs = [FreestyleJob(api.clone(f"http://server/job/{name}"))
+            for name in "ab"]
+
+    configs = jenkins.fetch_configs(jobs)
+    configs[0].quiet_period = 10
+    configs[0].update()
+
+    assert configs[0].quiet_period == 10
+    assert configs[1].quiet_period is None
+    assert "<quietPeriod>" not in configs[1].xml
+    assert session.post.call_count == 1
+    assert "<quietPeriod>10</quietPeriod>" in \
+        session.post.call_args[1]["data"]
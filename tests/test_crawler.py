@@ -0,0 +1,61 @@
+from mock import MagicMock
+from pyjen.utils.crawler import crawl_jobs, _job_tree
+from pyjen.utils.jenkins_api import JenkinsAPI
+
+FOLDER_CLASS = "com.cloudbees.hudson.plugins.folder.Folder"
+JOB_CLASS = "hudson.model.FreeStyleProject"
+
+
+def _listing(name, url, jobs=None):
+    retval = {"name": name, "url": url}
+    if jobs is None:
+        retval["_class"] = JOB_CLASS
+        retval["color"] = "blue"
+    else:
+        retval["_class"] = FOLDER_CLASS
+        retval["jobs"] = jobs
+    return retval
+
+
+def test_job_tree():
+    assert _job_tree(1) == "jobs[name,url,color,_class,jobs[url]]"
+    assert _job_tree(2) == \
+        "jobs[name,url,color,_class,jobs[name,url,color,_class,jobs[url]]]"
+
+
+def test_crawl_jobs():
+    root = "http://server/"
+    folder1 = root + "job/f1/"
+    folder2 = folder1 + "job/f2/"
+    responses = {
+        root: {"jobs": [
+            _listing("f1", folder1, [
+                _listing("j2", folder1 + "job/j2/"),
+                _listing("f2", folder2, [{"url": folder2 + "job/j3/"}]),
+            ]),
+            _listing("j1", root + "job/j1/"),
+            _listing("empty", root + "job/empty/", []),
+        ]},
+        folder2: {"jobs": [
+            _listing("j3", folder2 + "job/j3/"),
+        ]},
+    }
+    session = MagicMock()
+
+    def mock_get(url):
+        response = MagicMock()
+        response.json.return_value = responses[url.split("api/json")[0]]
+        return response
+    session.get.side_effect = mock_get
+    api = JenkinsAPI(root, session)
+
+    jobs, children = crawl_jobs(api, depth=2, max_workers=2)
+
+    assert session.get.call_count == 2
+    assert [cur_job.name for cur_job in jobs] == \
+        ["f1", "j2", "f2", "j3", "j1", "empty"]
+    assert [cur_job.name for cur_job in children[root]] == \
+        ["f1", "j1", "empty"]
+    assert [cur_job.name for cur_job in children[folder1]] == ["j2", "f2"]
+    assert [cur_job.name for cur_job in children[folder2]] == ["j3"]
+    assert children[root + "job/empty/"] == []
@@ -0,0 +1,160 @@
+import pytest
+from mock import patch
+from requests.exceptions import HTTPError
+from pyjen.utils.jenkins_api import JenkinsAPI
+from pyjen.job import Job
+from pyjen.view import View
+from .utils import FakeServer, mock_response, mock_session
+
+
+def _mock_session(crumbs=("abc",), post_codes=(200,)):
+    """Generates a mock HTTP session for a Jenkins v2 server
+
+    Args:
+        crumbs (list):
+            sequence of crumb values to be issued by the crumb endpoint
+        post_codes (list):
+            sequence of HTTP status codes to be returned by POST operations
+    """
+    headers_response = mock_response(headers={"x-jenkins": "2.345"})
+
+    crumb_responses = [
+        mock_response({"crumbRequestField": "Jenkins-Crumb",
+                       "crumb": cur_crumb})
+        for cur_crumb in crumbs
+    ]
+
+    def respond(url):
+        if url.endswith("crumbIssuer/api/json"):
+            return crumb_responses.pop(0)
+        return headers_response
+
+    post_responses = [mock_response(status_code=cur_code)
+                      for cur_code in post_codes]
+
+    session = FakeServer(respond).session
+    session.post.side_effect = lambda *args, **kwargs: post_responses.pop(0)
+    return session
+
+
+def test_clones_share_crumb_and_version():
+    session = _mock_session()
+    api = JenkinsAPI("https://0.0.0.0", session)
+    job1 = api.clone("https://0.0.0.0/job/job1")
+    job2 = api.clone("https://0.0.0.0/job/job2")
+    build = job1.clone("https://0.0.0.0/job/job1/1")
+
+    assert job1.jenkins_version == (2, 345)
+    assert build.jenkins_version == (2, 345)
+    assert job1.crumb == {"Jenkins-Crumb": "abc"}
+    assert job2.crumb == {"Jenkins-Crumb": "abc"}
+    assert build.crumb == {"Jenkins-Crumb": "abc"}
+
+    # One request for the version headers and one for the crumb
+    assert session.get.call_count == 2
+
+
+def test_post_refreshes_expired_crumb():
+    session = _mock_session(crumbs=("old", "new"), post_codes=(403, 200))
+    api = JenkinsAPI("https://0.0.0.0", session)
+    job = api.clone("https://0.0.0.0/job/job1")
+
+    res = job.post(job.url + "disable")
+
+    assert res.status_code == 200
+    assert session.post.call_count == 2
+    last_headers = session.post.call_args[1]["headers"]
+    assert last_headers == {"Jenkins-Crumb": "new"}
+    assert api.crumb == {"Jenkins-Crumb": "new"}
+
+
+def test_post_without_crumb_is_not_retried():
+    session = _mock_session(post_codes=(403,))
+    crumb_response = mock_response(status_code=404)
+    headers_response = mock_response(headers={"x-jenkins": "2.345"})
+    session.get.side_effect = lambda url, **kwargs: \
+        crumb_response if url.endswith("crumbIssuer/api/json") \
+        else headers_response
+    api = JenkinsAPI("https://0.0.0.0", session)
+
+    with pytest.raises(HTTPError):
+        api.post(api.url + "quietDown")
+
+    assert session.post.call_count == 1
+
+
+def test_instantiate_hydrates_job():
+    session = mock_session({"name": "job1", "color": "red"})
+    api = JenkinsAPI("http://server", session)
+    job = Job.instantiate({
+        "_class": "hudson.model.FreeStyleProject",
+        "name": "job1",
+        "url": "http://server/job/job1/",
+        "color": "blue",
+    }, api)
+
+    assert job.name == "job1"
+    assert job.is_failing is False
+    session.get.assert_not_called()
+
+
+def test_instantiate_hydrates_view():
+    session = mock_session({})
+    api = JenkinsAPI("http://server", session)
+    view = View.instantiate({
+        "_class": "hudson.model.ListView",
+        "name": "view1",
+        "url": "http://server/view/view1/",
+    }, api)
+
+    assert view.name == "view1"
+    session.get.assert_not_called()
+
+
+def test_seeded_data_is_copied():
+    api = JenkinsAPI("http://server/job/job1", mock_session({}))
+    api.seed({"name": "job1", "color": "blue"})
+
+    data = api.get_api_data(fields=["color"])
+    data["color"] = "red"
+
+    assert api.get_api_data(fields=["color"]) == \
+        {"name": "job1", "color": "blue"}
+
+
+def test_seeded_status_expires():
+    session = mock_session({"name": "job1", "color": "red"})
+    api = JenkinsAPI("http://server/job/job1", session)
+    job = Job(api)
+    with patch("pyjen.utils.api_state.time.monotonic") as clock:
+        clock.return_value = 100
+        api.seed({"name": "job1", "color": "blue"})
+        clock.return_value = 100 + api._context.seed_ttl
+        # identity fields never expire, status fields do
+        assert job.name == "job1"
+        session.get.assert_not_called()
+        assert job.is_failing is True
+        session.get.assert_called_once()
+
+
+def test_seeded_status_discarded_after_modification():
+    session = mock_session({"name": "job2", "color": "disabled"})
+    api = JenkinsAPI("http://server", session)
+    job1 = Job.instantiate({
+        "_class": "hudson.model.FreeStyleProject",
+        "name": "job1",
+        "url": "http://server/job/job1/",
+        "color": "blue",
+    }, api)
+    job2 = Job.instantiate({
+        "_class": "hudson.model.FreeStyleProject",
+        "name": "job2",
+        "url": "http://server/job/job2/",
+        "color": "blue",
+    }, api)
+
+    job1.disable()
+    session.get.reset_mock()
+    assert job2.name == "job2"
+    assert job2.is_disabled is True
+    session.get.assert_called_once_with("http://server/job/job2/api/json")
@@ -1,14 +1,19 @@
+import re
 import pytest
 import timeit
+from mock import MagicMock
 from datetime import datetime
 from datetime import timedelta
 import xml.etree.ElementTree as ElementTree
-from .utils import async_assert, clean_job
+from .utils import FakeServer, async_assert, clean_job, mock_response
 from pyjen.plugins.freestylejob import FreestyleJob
 from pyjen.build import Build
+from pyjen.job import Job
+from pyjen.utils.jenkins_api import JenkinsAPI
 from pyjen.plugins.buildtriggerpublisher import BuildTriggerPublisher
 from pyjen.plugins.shellbuilder import ShellBuilder
 from pyjen.plugins.nullscm import NullSCM
+from pyjen.plugins.buildblocker import BuildBlockerProperty
 
 
 @pytest.mark.vcr()
@@ -542,3 +547,126 @@ def test_find_build_by_queue_id_no_match(jenkins_api):
 
         bld = jb.find_build_by_queue_id(test_id)
         assert bld is None
+
+
+def _paged_builds_session(build_count):
+    """Generates a mock HTTP session serving pages of a jobs' build history
+
+    Args:
+        build_count (int):
+            number of builds in the history of the job
+    """
+    def respond(url):
+        start, end = re.search(r"\{(\d+),(\d+)\}", url).groups()
+        numbers = range(build_count, 0, -1)[int(start):int(end)]
+        return mock_response({"allBuilds": [
+            {"number": i, "result": "SUCCESS",
+             "url": f"http://server/job/job1/{i}/"} for i in numbers
+        ]})
+    return FakeServer(respond).session
+
+
+def test_iter_builds():
+    session = _paged_builds_session(5)
+    jb = Job(JenkinsAPI("http://server/job/job1/", session))
+
+    builds = list(jb.iter_builds(page_size=2, fields=["number", "result"]))
+
+    assert [cur_build.number for cur_build in builds] == [5, 4, 3, 2, 1]
+    assert all(cur_build.result == "SUCCESS" for cur_build in builds)
+    assert session.get.call_count == 3
+    assert "allBuilds[url,number,result]{0,2}" in \
+        session.get.call_args_list[0][0][0]
+
+
+def test_iter_builds_stops_early():
+    session = _paged_builds_session(100)
+    jb = Job(JenkinsAPI("http://server/job/job1/", session))
+
+    builds = jb.iter_builds(page_size=10)
+    first = next(builds)
+    builds.close()
+
+    assert first.url == "http://server/job/job1/100/"
+    # the first page, plus at most one page loaded in the background
+    assert session.get.call_count <= 2
+
+
+def test_get_builds_in_time_range_single_request():
+    origin = datetime(2022, 5, 1)
+    session = MagicMock()
+    session.get.return_value.json.return_value = {"allBuilds": [
+        {
+            "number": i,
+            "url": f"http://server/job/job1/{i}/",
+            "timestamp": (origin + timedelta(hours=i)).timestamp() * 1000,
+        } for i in range(1000, 0, -1)
+    ]}
+    jb = Job(JenkinsAPI("http://server/job/job1/", session))
+
+    builds = jb.get_builds_in_time_range(
+        origin + timedelta(hours=10), origin + timedelta(hours=12))
+
+    assert [cur_build.number for cur_build in builds] == [12, 11, 10]
+    assert builds[0].start_time == origin + timedelta(hours=12)
+    assert session.get.call_count == 1
+
+
+def _config_api():
+    api = MagicMock(url="http://server/job/job1/")
+    api.get_text.return_value = FreestyleJob.template_config_xml()
+    return api
+
+
+def test_edit_posts_once():
+    api = _config_api()
+    jb = FreestyleJob(api)
+
+    with jb.edit() as cfg:
+        cfg.quiet_period = 5
+        cfg.assigned_node = "linux"
+        cfg.custom_workspace = "/tmp/ws"
+        cfg.add_builder(ShellBuilder.instantiate("make"))
+        with cfg.edit():
+            blocker = BuildBlockerProperty.instantiate(["other"])
+            cfg.add_property(blocker)
+            # changes made through plugins are deferred as well
+            blocker.disable()
+        api.post.assert_not_called()
+
+    api.post.assert_called_once()
+    posted = ElementTree.fromstring(api.post.call_args[0][1]["data"])
+    assert posted.find("quietPeriod").text == "5"
+    assert posted.find("assignedNode").text == "linux"
+    assert posted.find("customWorkspace").text == "/tmp/ws"
+    assert len(posted.find("builders")) == 1
+    assert len(posted.find("properties")) == 1
+    assert api.get_text.call_count == 1
+
+
+def test_edit_without_changes():
+    api = _config_api()
+    jb = FreestyleJob(api)
+
+    with jb.edit() as cfg:
+        cfg.quiet_period = 5
+        cfg.quiet_period = -1
+
+    api.post.assert_not_called()
+
+
+def test_edit_discarded_on_error():
+    api = _config_api()
+    jb = FreestyleJob(api)
+
+    with pytest.raises(RuntimeError):
+        with jb.edit() as cfg:
+            cfg.quiet_period = 5
+            raise RuntimeError("abort")
+
+    api.post.assert_not_called()
+    assert jb.quiet_period_enabled is False
+
+    # changes made outside of an edit are posted right away
+    jb.quiet_period = 7
+    api.post.assert_called_once()
@@ -0,0 +1,84 @@
+import re
+import pytest
+from mock import MagicMock
+from pyjen.utils.log_search import search_console_logs
+
+
+def _mock_build(url, chunks):
+    """Generates a mock build producing a console log in the given chunks"""
+    retval = MagicMock()
+    retval.url = url
+    retval.closed = False
+
+    def iter_console(**_kwargs):
+        try:
+            for cur_chunk in chunks:
+                yield cur_chunk
+        finally:
+            retval.closed = True
+    retval.iter_console.side_effect = iter_console
+    return retval
+
+
+def test_search_across_chunk_boundaries():
+    bld = _mock_build("b1", ["Sta", "rted\r\nERR", "OR: disk ", "full\nDone"])
+
+    hits = list(search_console_logs([bld], ["ERROR", "disk full", "Done"]))
+
+    assert hits == [
+        (bld, 2, "ERROR", "ERROR: disk full"),
+        (bld, 2, "disk full", "ERROR: disk full"),
+        (bld, 3, "Done", "Done"),
+    ]
+    assert bld.closed
+
+
+def test_search_multiple_builds():
+    bld1 = _mock_build("b1", ["ok\nfailed: 1\n"])
+    bld2 = _mock_build("b2", ["ok\n", "ok\n", "FAILED: 2\n"])
+    bld3 = _mock_build("b3", ["all good\n"])
+    pattern = re.compile("failed", re.IGNORECASE)
+
+    hits = list(search_console_logs([bld1, bld2, bld3], [pattern],
+                                    max_workers=2))
+
+    assert sorted((cur_hit[0].url, cur_hit[1]) for cur_hit in hits) == \
+        [("b1", 2), ("b2", 3)]
+    assert all(cur_hit[2] is pattern for cur_hit in hits)
+
+
+def test_first_hit_only():
+    bld = _mock_build("b1", ["error 1\n", "error 2\n", "error 3\n"])
+
+    hits = list(search_console_logs([bld], ["error"], first_hit_only=True))
+
+    assert [cur_hit[1] for cur_hit in hits] == [1]
+    assert bld.closed
+
+
+def test_mixed_pattern_flags():
+    bld = _mock_build("b1", ["Warning\nwarning\n"])
+    patterns = [re.compile("warning", re.IGNORECASE), "^warning"]
+
+    hits = list(search_console_logs([bld], patterns))
+
+    assert [(cur_hit[1], cur_hit[2]) for cur_hit in hits] == \
+        [(1, patterns[0]), (2, patterns[0]), (2, patterns[1])]
+
+
+def test_errors_propagate():
+    bld = MagicMock()
+    bld.iter_console.side_effect = RuntimeError("connection lost")
+
+    with pytest.raises(RuntimeError):
+        list(search_console_logs([bld], ["error"]))
+
+
+def test_numbered_backreferences():
+    bld = _mock_build("b1", ["x\nfailed failed\nfailed once\n"])
+    patterns = ["(x)y", r"(\w+) \1"]
+
+    hits = list(search_console_logs([bld], patterns))
+
+    assert [(cur_hit[1], cur_hit[2]) for cur_hit in hits] == \
+        [(2, patterns[1])]
@@ -1,7 +1,10 @@
 import pytest
-from .utils import clean_job, async_assert
+from mock import MagicMock
+from .utils import clean_job, async_assert, mock_response
 from pyjen.plugins.shellbuilder import ShellBuilder
 from pyjen.plugins.freestylejob import FreestyleJob
+from pyjen.jenkins import Jenkins
+from pyjen.node import Node
 
 
 @pytest.mark.vcr()
@@ -139,3 +142,105 @@ def test_wait_for_idle_timeout(jenkins_api):
         assert node.wait_for_idle(2) is False
 
         async_assert(lambda: jb.last_good_build)
+
+
+def _snapshot_session(states):
+    """Mock session reporting the given busy states for two nodes, one
+    response per request"""
+    responses = []
+    for agent1_idle, agent2_idle in states:
+        responses.append(mock_response({"computer": [
+            {"displayName": "Built-In Node", "idle": True, "offline": False,
+             "numExecutors": 2},
+            {"displayName": "agent1", "idle": agent1_idle, "offline": False,
+             "numExecutors": 1},
+            {"displayName": "agent2", "idle": agent2_idle, "offline": True,
+             "numExecutors": 4},
+        ]}))
+    session = MagicMock()
+    session.get.side_effect = responses
+    return session
+
+
+def test_node_snapshots():
+    session = _snapshot_session([(True, False)])
+    jenkins = Jenkins("http://server", session)
+
+    snapshots = jenkins.node_snapshots
+
+    assert [cur.name for cur in snapshots] == \
+        ["Built-In Node", "agent1", "agent2"]
+    assert snapshots[2].is_idle is False
+    assert snapshots[2].is_offline is True
+    assert snapshots[2].number_of_executors == 4
+    session.get.assert_called_once_with(
+        "http://server/computer/api/json"
+        "?tree=computer[displayName,idle,offline,numExecutors]")
+
+
+def test_wait_for_nodes_idle():
+    session = _snapshot_session([(False, False), (True, False), (True, True)])
+    jenkins = Jenkins("http://server", session)
+    nodes = [Node(jenkins._api.clone("http://server/computer/" + cur))
+             for cur in ("agent1", "agent2")]
+
+    assert jenkins.wait_for_nodes_idle(nodes, poll_interval=0.01) is True
+    assert session.get.call_count == 3
+
+
+def test_wait_for_nodes_idle_timeout():
+    session = _snapshot_session([(True, False)] * 100)
+    jenkins = Jenkins("http://server", session)
+    nodes = [Node(jenkins._api.clone("http://server/computer/agent2"))]
+
+    assert jenkins.wait_for_nodes_idle(nodes, timeout=0.1,
+                                       poll_interval=0.02) is False
+
+
+def test_nodes_loaded_with_one_request():
+    session = _snapshot_session([(True, False)] * 2)
+    jenkins = Jenkins("http://server", session)
+
+    nodes = jenkins.nodes
+    agent2 = jenkins.find_node("agent2")
+
+    assert [cur.name for cur in nodes] == \
+        ["Built-In Node", "agent1", "agent2"]
+    assert agent2.url == "http://server/computer/agent2/"
+    assert agent2.is_offline is True
+    assert agent2.is_idle is False
+    assert agent2.number_of_executors == 4
+    assert session.get.call_count == 1
+
+    # unknown nodes may have been added since the nodes were loaded
+    assert jenkins.find_node("agent3") is None
+    assert session.get.call_count == 2
+
+
+def test_wait_for_nodes_idle_special_names():
+    states = [False, True]
+    responses = []
+    for idle in states:
+        responses.append(mock_response({"computer": [
+            {"displayName": "Built-In Node", "idle": idle, "offline": False,
+             "numExecutors": 2},
+            {"displayName": "my agent", "idle": idle, "offline": False,
+             "numExecutors": 1},
+        ]}))
+    session = MagicMock()
+    session.get.side_effect = responses
+    jenkins = Jenkins("http://server", session)
+    nodes = [Node(jenkins._api.clone("http://server/computer/" + cur))
+             for cur in ("my%20agent", "(built-in)")]
+
+    assert jenkins.wait_for_nodes_idle(nodes, poll_interval=0.01) is True
+    assert session.get.call_count == 2
+
+
+def test_wait_for_unknown_nodes():
+    session = _snapshot_session([(True, True)])
+    jenkins = Jenkins("http://server", session)
+    nodes = [Node(jenkins._api.clone("http://server/computer/agent3"))]
+
+    with pytest.raises(ValueError):
+        jenkins.wait_for_nodes_idle(nodes, timeout=1)
@@ -1,14 +1,27 @@
+import sys
+import subprocess
+import pytest
 from mock import patch, MagicMock
 from .utils import count_plugins
-from pyjen.utils.plugin_api import find_plugin, get_all_plugins
+from pyjen.utils.plugin_api import find_plugin, get_all_plugins, \
+    invalidate_plugins, refresh_plugins
 from pyjen.view import View
 from pyjen.job import Job
 
 
+@pytest.fixture(autouse=True)
+def clean_registry():
+    """Makes sure mocked entry points never leak into the plugin registry"""
+    invalidate_plugins()
+    yield
+    invalidate_plugins()
+
+
 def test_unsupported_plugin(caplog):
     with patch("pyjen.utils.plugin_api.iter_entry_points") as entry_points:
         mock_plugin_class = MagicMock(spec=[])
         mock_ep = MagicMock()
+        mock_ep.name = "some_plugin"
         mock_ep.load.return_value = mock_plugin_class
         entry_points.return_value = [mock_ep]
 
@@ -24,6 +37,7 @@ def test_one_supported_plugin(caplog):
         mock_plugin_class.get_jenkins_plugin_name.return_value = expected_plugin_name
 
         mock_ep = MagicMock()
+        mock_ep.name = "some_plugin"
         mock_ep.load.return_value = mock_plugin_class
 
         entry_points.return_value = [mock_ep]
@@ -44,8 +58,10 @@ def test_multiple_supported_plugin(caplog):
         mock_plugin_class2.get_jenkins_plugin_name.return_value = expected_plugin_name
 
         mock_ep1 = MagicMock()
+        mock_ep1.name = "some_plugin"
         mock_ep1.load.return_value = mock_plugin_class1
         mock_ep2 = MagicMock()
+        mock_ep2.name = "some_plugin"
         mock_ep2.load.return_value = mock_plugin_class2
 
         entry_points.return_value = [mock_ep1, mock_ep2]
@@ -56,6 +72,106 @@ def test_multiple_supported_plugin(caplog):
         assert "multiple plugins detected" in caplog.text
 
 
+def test_registry_loads_entry_points_once():
+    with patch("pyjen.utils.plugin_api.iter_entry_points") as entry_points:
+        mock_plugin_class = MagicMock()
+        mock_plugin_class.get_jenkins_plugin_name.return_value = "some_plugin"
+        mock_ep = MagicMock()
+        mock_ep.name = "some_plugin"
+        mock_ep.load.return_value = mock_plugin_class
+        entry_points.return_value = [mock_ep]
+
+        assert find_plugin("some_plugin") == mock_plugin_class
+        assert find_plugin("some_plugin") == mock_plugin_class
+        assert find_plugin("other_plugin") is None
+        assert entry_points.call_count == 1
+        assert mock_ep.load.call_count == 1
+
+
+def test_duplicate_warning_logged_once(caplog):
+    with patch("pyjen.utils.plugin_api.iter_entry_points") as entry_points:
+        mock_plugin_class1 = MagicMock()
+        mock_plugin_class1.get_jenkins_plugin_name.return_value = "some_plugin"
+        mock_plugin_class2 = MagicMock()
+        mock_plugin_class2.get_jenkins_plugin_name.return_value = "some_plugin"
+        mock_ep1 = MagicMock()
+        mock_ep1.name = "some_plugin"
+        mock_ep1.load.return_value = mock_plugin_class1
+        mock_ep2 = MagicMock()
+        mock_ep2.name = "some_plugin"
+        mock_ep2.load.return_value = mock_plugin_class2
+        entry_points.return_value = [mock_ep1, mock_ep2]
+
+        find_plugin("some_plugin")
+        find_plugin("some_plugin")
+        assert caplog.text.count("multiple plugins detected") == 1
+
+
+def test_refresh_plugins():
+    with patch("pyjen.utils.plugin_api.iter_entry_points") as entry_points:
+        entry_points.return_value = []
+        assert find_plugin("some_plugin") is None
+
+        mock_plugin_class = MagicMock()
+        mock_plugin_class.get_jenkins_plugin_name.return_value = "some_plugin"
+        mock_ep = MagicMock()
+        mock_ep.name = "some_plugin"
+        mock_ep.load.return_value = mock_plugin_class
+        entry_points.return_value = [mock_ep]
+
+        # Lookups keep using the registry until it is explicitly rebuilt
+        assert find_plugin("some_plugin") is None
+        refresh_plugins()
+        assert find_plugin("some_plugin") == mock_plugin_class
+        assert entry_points.call_count == 2
+
+
+def test_lookup_only_imports_matching_plugin():
+    with patch("pyjen.utils.plugin_api.iter_entry_points") as entry_points:
+        mock_plugin_class = MagicMock()
+        mock_plugin_class.get_jenkins_plugin_name.return_value = "a.b.Plugin"
+        mock_ep = MagicMock()
+        mock_ep.name = "a.b.Plugin"
+        mock_ep.load.return_value = mock_plugin_class
+        other_ep = MagicMock()
+        other_ep.name = "a.b.Other"
+        entry_points.return_value = [mock_ep, other_ep]
+
+        assert find_plugin("a.b.Plugin") == mock_plugin_class
+        assert find_plugin("a.b.Unknown") is None
+        other_ep.load.assert_not_called()
+
+
+def test_legacy_entry_point_names():
+    with patch("pyjen.utils.plugin_api.iter_entry_points") as entry_points:
+        mock_plugin_class = MagicMock()
+        mock_plugin_class.get_jenkins_plugin_name.return_value = "a.b.Plugin"
+        mock_ep = MagicMock()
+        mock_ep.name = "myplugin"
+        mock_ep.load.return_value = mock_plugin_class
+        entry_points.return_value = [mock_ep]
+
+        assert find_plugin("a.b.Plugin") == mock_plugin_class
+        assert find_plugin("a.b.Unknown") is None
+        assert mock_ep.load.call_count == 1
+
+
+def test_imports_are_lazy():
+    # Importing the package or its main entry point must not pull in
+    # pkg_resources or any of the plugin modules, which are only loaded
+    # once a plugin is looked up
+    script = (
+        "import sys\n"
+        "import pyjen, pyjen.jenkins\n"
+        "plugins = [m for m in sys.modules if m.startswith('pyjen.plugins.')]\n"
+        "print('pkg_resources' in sys.modules, len(plugins))\n"
+    )
+    output = subprocess.check_output([sys.executable, "-c", script], text=True)
+    has_pkg_resources, num_plugins = output.split()
+    assert has_pkg_resources == "False"
+    assert num_plugins == "0"
+
+
 def test_list_plugins():
     res = get_all_plugins()
     assert res is not None
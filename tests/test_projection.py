@@ -0,0 +1,94 @@
+import pytest
+from pyjen.utils.jenkins_api import JenkinsAPI
+from pyjen.utils.projection import resolve_fields, top_level_field, \
+    tree_query, JSONProperty, property_fields
+from pyjen.job import Job
+from pyjen.build import Build
+from .utils import mock_session
+
+
+def test_properties_declare_fields():
+    assert isinstance(Job.name, JSONProperty)
+    assert Job.name.fields == ("name",)
+    assert Job.is_disabled.fields == ("color",)
+    assert Build.result.fields == ("result",)
+
+
+def test_setter_preserves_fields():
+    assert Build.description.fields == ("description",)
+    assert Build.description.fset is not None
+
+
+def test_property_fields():
+    assert property_fields(Job, "last_build") == ("lastBuild[url]",)
+    with pytest.raises(AttributeError):
+        property_fields(Job, "recent_builds")
+    with pytest.raises(AttributeError):
+        property_fields(Job, "missing")
+
+
+def test_resolve_fields():
+    fields = resolve_fields(
+        Job, ["name", "is_disabled", "is_failing", "lastBuild[number]"])
+    assert fields == ["name", "color", "lastBuild[number]"]
+
+
+def test_tree_helpers():
+    assert top_level_field("lastBuild[url]") == "lastBuild"
+    assert top_level_field("allBuilds[url]{0,10}") == "allBuilds"
+    assert top_level_field("name") == "name"
+    assert tree_query(["name", "color"]) == "tree=name,color"
+
+
+def test_projections_disabled_by_default():
+    session = mock_session({"name": "job1"})
+    job = Job(JenkinsAPI("http://server/job/job1", session))
+
+    assert job.name == "job1"
+    session.get.assert_called_once_with("http://server/job/job1/api/json")
+
+
+def test_projected_property():
+    session = mock_session({"name": "job1"})
+    api = JenkinsAPI("http://server", session)
+    api.projections = True
+    job = Job(api.clone("http://server/job/job1"))
+
+    assert job.name == "job1"
+    session.get.assert_called_once_with(
+        "http://server/job/job1/api/json?tree=name")
+
+
+def test_fetch_multiple_properties():
+    session = mock_session({
+        "name": "job1",
+        "color": "red",
+        "healthReport": [{"description": "Build stability: ok", "score": 40}]
+    })
+    job = Job(JenkinsAPI("http://server/job/job1", session))
+
+    job.fetch(["name", "is_failing", "build_health"])
+    session.get.assert_called_once_with(
+        "http://server/job/job1/api/json?"
+        "tree=name,color,healthReport[description,score]")
+
+    assert job.name == "job1"
+    assert job.is_failing is True
+    assert job.is_disabled is False
+    assert job.build_health == 40
+    assert session.get.call_count == 1
+
+    # properties that were not fetched still go to the server
+    session.get.return_value.json.return_value = {"lastBuild": None}
+    assert job.last_build is None
+    assert session.get.call_count == 2
+
+
+def test_fetched_data_discarded_on_invalidate():
+    session = mock_session({"name": "job1"})
+    job = Job(JenkinsAPI("http://server/job/job1", session))
+
+    job.fetch(["name"])
+    job.invalidate()
+    assert job.name == "job1"
+    assert session.get.call_count == 2
@@ -0,0 +1,111 @@
+from concurrent.futures import wait
+from mock import MagicMock
+from pyjen.queue import Queue
+from pyjen.queue_item import QueueItem
+from pyjen.utils.jenkins_api import JenkinsAPI
+from pyjen.utils.queue_watcher import QueueWatcher
+from .utils import FakeServer, async_assert, mock_response
+
+
+class _QueueServer(FakeServer):
+    """Mock HTTP session serving the state of a build queue"""
+
+    def __init__(self):
+        super().__init__()
+        self.queued = []
+        self.running = {}
+        self.items = {}
+
+    def respond(self, url):
+        if url.startswith("http://server/queue/api/json"):
+            return mock_response(
+                {"items": [{"id": cur_id} for cur_id in self.queued]})
+        if url.startswith("http://server/computer/api/json"):
+            executors = [
+                {"currentExecutable": {"url": cur_url, "queueId": cur_id}}
+                for cur_id, cur_url in self.running.items()
+            ]
+            return mock_response(
+                {"computer": [{"executors": executors + [{}],
+                               "oneOffExecutors": []}]})
+        uid = int(url.split("/")[-3])
+        if uid not in self.items:
+            return mock_response(status_code=404)
+        return mock_response(self.items[uid])
+
+
+def _setup(server):
+    api = JenkinsAPI("http://server", server.session)
+    return api, lambda uid: QueueItem(
+        api.clone(f"http://server/queue/item/{uid}"))
+
+
+def test_poll_resolves_departed_items():
+    server = _QueueServer()
+    api, make_item = _setup(server)
+    watcher = QueueWatcher(api)
+    # poll synchronously, without the background thread
+    watcher._thread = MagicMock()
+    futures = [watcher.watch(make_item(uid)) for uid in (1, 2, 3, 4, 5)]
+
+    server.queued = [4]
+    server.running = {1: "http://server/job/a/7/"}
+    server.items = {
+        2: {"executable": {"url": "http://server/job/a/8/"}},
+        3: {"cancelled": True},
+        5: {"executable": None, "cancelled": False},
+    }
+    assert watcher.poll() is True
+
+    assert futures[0].result(0).url == "http://server/job/a/7/"
+    assert futures[1].result(0).url == "http://server/job/a/8/"
+    assert futures[2].result(0) is None
+    assert not futures[3].done()
+    assert not futures[4].done()
+
+
+def test_idle_queue_not_rechecked():
+    server = _QueueServer()
+    api, make_item = _setup(server)
+    watcher = QueueWatcher(api)
+    watcher._thread = MagicMock()
+    server.queued = [1]
+    future = watcher.watch(make_item(1))
+    assert watcher.poll() is True
+    server.urls.clear()
+
+    assert watcher.poll() is False
+    assert server.urls == ["http://server/queue/api/json?tree=items[id]"]
+    assert not future.done()
+
+
+def test_watch_with_callback():
+    server = _QueueServer()
+    api, make_item = _setup(server)
+    queue = Queue(api.clone("http://server/queue"))
+    items = [make_item(uid) for uid in (1, 2)]
+    server.running = {1: "http://server/job/a/1/", 2: "http://server/job/a/2/"}
+    resolved = []
+
+    futures = queue.watch(items, lambda item, bld: resolved.append(
+        (item.uid, bld.url)), poll_interval=0.01)
+    done, _ = wait(futures, timeout=5)
+
+    assert len(done) == 2
+    async_assert(lambda: len(resolved) == 2)
+    assert sorted(resolved) == [(1, "http://server/job/a/1/"),
+                                (2, "http://server/job/a/2/")]
+    # the whole queue is checked at once rather than polling each item
+    assert not [cur_url for cur_url in server.urls if "/item/" in cur_url]
+
+
+def test_poll_errors_reported():
+    session = MagicMock()
+    session.get.side_effect = RuntimeError("connection refused")
+    api = JenkinsAPI("http://server", session)
+    queue = Queue(api.clone("http://server/queue"))
+    item = QueueItem(api.clone("http://server/queue/item/1"))
+
+    future = queue.watch([item], poll_interval=0.01)[0]
+
+    assert isinstance(future.exception(timeout=5), RuntimeError)
@@ -0,0 +1,134 @@
+import pytest
+from mock import MagicMock, patch
+from pyjen.utils.response_cache import ResponseCache
+from pyjen.utils.jenkins_api import JenkinsAPI
+from pyjen.job import Job
+from .utils import mock_session
+
+
+def test_cache_expiry():
+    cache = ResponseCache(ttl=10)
+    with patch("pyjen.utils.response_cache.time.monotonic") as clock:
+        clock.return_value = 100
+        cache.put("http://server/job/a/api/json", {"name": "a"})
+        clock.return_value = 109
+        assert cache.get("http://server/job/a/api/json") == {"name": "a"}
+        clock.return_value = 110
+        assert cache.get("http://server/job/a/api/json") is None
+    assert len(cache) == 0
+
+
+def test_cache_lru_eviction():
+    cache = ResponseCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_cache_prefix_invalidation():
+    cache = ResponseCache()
+    cache.put("http://server/job/a/api/json", 1)
+    cache.put("http://server/job/a/1/api/json", 2)
+    cache.put("http://server/job/ab/api/json", 3)
+    cache.invalidate("http://server/job/a/")
+    assert cache.get("http://server/job/a/api/json") is None
+    assert cache.get("http://server/job/a/1/api/json") is None
+    assert cache.get("http://server/job/ab/api/json") == 3
+
+
+def test_invalid_cache_parameters():
+    with pytest.raises(ValueError):
+        ResponseCache(ttl=0)
+    with pytest.raises(ValueError):
+        ResponseCache(max_size=0)
+
+
+def _mock_session():
+    return mock_session({
+        "name": "job1",
+        "color": "blue",
+        "healthReport": [],
+    })
+
+
+def test_job_properties_share_cached_response():
+    session = _mock_session()
+    api = JenkinsAPI("http://server", session)
+    api.enable_cache(ttl=60)
+    job = Job(api.clone("http://server/job/job1"))
+
+    assert job.name == "job1"
+    assert job.is_disabled is False
+    assert job.is_failing is False
+    assert job.build_health == 0
+    assert session.get.call_count == 1
+
+
+def test_cache_disabled_by_default():
+    session = _mock_session()
+    api = JenkinsAPI("http://server", session)
+    job = Job(api.clone("http://server/job/job1"))
+
+    assert job.name == "job1"
+    assert job.name == "job1"
+    assert session.get.call_count == 2
+
+
+def test_post_invalidates_cached_response():
+    session = _mock_session()
+    api = JenkinsAPI("http://server", session)
+    api.enable_cache(ttl=60)
+    job = Job(api.clone("http://server/job/job1"))
+
+    assert job.is_disabled is False
+    job.disable()
+    session.get.reset_mock()
+    assert job.is_disabled is False
+    # The job data must be reloaded after the post operation
+    session.get.assert_called_once_with("http://server/job/job1/api/json")
+
+
+def test_explicit_refresh_and_invalidate():
+    session = _mock_session()
+    api = JenkinsAPI("http://server", session)
+    api.enable_cache(ttl=60)
+    job = Job(api.clone("http://server/job/job1"))
+
+    assert job.name == "job1"
+    job.refresh()
+    assert job.name == "job1"
+    assert session.get.call_count == 2
+
+    job.invalidate()
+    assert job.name == "job1"
+    assert session.get.call_count == 3
+
+
+def test_cached_data_is_copied():
+    cache = ResponseCache()
+    data = {"jobs": [{"name": "a"}]}
+    cache.put("http://server/api/json", data)
+    data["jobs"].append({"name": "b"})
+
+    result = cache.get("http://server/api/json")
+    assert result == {"jobs": [{"name": "a"}]}
+    result["jobs"].clear()
+    assert cache.get("http://server/api/json") == {"jobs": [{"name": "a"}]}
+
+
+def test_post_invalidates_parent_listings():
+    session = _mock_session()
+    api = JenkinsAPI("http://server", session)
+    api.enable_cache(ttl=60)
+    job = Job(api.clone("http://server/job/job1"))
+
+    api.get_api_data(query_params="tree=jobs[name]")
+    job.disable()
+    session.get.reset_mock()
+    api.get_api_data(query_params="tree=jobs[name]")
+    session.get.assert_called_once_with(
+        "http://server/api/json?tree=jobs[name]")
@@ -0,0 +1,89 @@
+from datetime import datetime
+import pytest
+from mock import MagicMock
+from pyjen.jenkins import Jenkins
+from pyjen.utils.jenkins_api import JenkinsAPI
+from pyjen.utils.utilization import UtilizationSampler, UtilizationSeries
+from .utils import async_assert, mock_response
+
+
+def _computer_session(*states):
+    """Mock session reporting the busy state of the executors on two nodes,
+    one response per request"""
+    responses = []
+    for agent1, agent2 in states:
+        responses.append(mock_response({"computer": [
+            {"displayName": "agent1", "offline": False,
+             "executors": [{"idle": not busy} for busy in agent1]},
+            {"displayName": "agent2", "offline": agent2 is None,
+             "executors": [{"idle": not busy} for busy in agent2 or [0]]},
+        ]}))
+    session = MagicMock()
+    session.get.side_effect = responses
+    return session
+
+
+def test_series_wraps_around():
+    series = UtilizationSeries(capacity=3)
+    for cur_time in range(5):
+        series.append(cur_time, cur_time, 4)
+
+    assert len(series) == 3
+    assert [cur[1] for cur in series.samples()] == [2, 3, 4]
+    assert series.samples()[0][0] == datetime.fromtimestamp(2)
+    assert series.mean() == pytest.approx(9 / 12)
+    assert series.mean(since=datetime.fromtimestamp(4)) == 1
+
+
+def test_series_percentiles():
+    series = UtilizationSeries()
+    for busy in (0, 1, 2, 3, 4):
+        series.append(0, busy, 4)
+    series.append(0, 0, 0)
+
+    assert series.percentile(0) == 0
+    assert series.percentile(50) == 0.5
+    assert series.percentile(90) == pytest.approx(0.9)
+    assert series.percentile(100) == 1
+    with pytest.raises(ValueError):
+        series.percentile(101)
+
+
+def test_empty_series():
+    series = UtilizationSeries()
+
+    assert series.mean() is None
+    assert series.percentile(95) is None
+
+
+def test_sample_nodes():
+    session = _computer_session(([1, 0], [1, 1, 0, 0]), ([1, 1], None))
+    sampler = UtilizationSampler(JenkinsAPI("http://server", session))
+
+    sampler.sample()
+    sampler.sample()
+
+    assert sorted(sampler.node_names) == ["agent1", "agent2"]
+    assert sampler.mean_utilization("agent1") == 0.75
+    # executors on offline nodes are not available to run builds
+    assert [cur[1:] for cur in sampler.series("agent2").samples()] == \
+        [(2, 4), (0, 0)]
+    assert sampler.mean_utilization("agent2") == 0.5
+    assert sampler.mean_utilization() == 5 / 8
+    assert sampler.percentile_utilization(100) == 1
+    assert sampler.mean_utilization("unknown") is None
+    session.get.assert_called_with(
+        "http://server/computer/api/json"
+        "?tree=computer[displayName,offline,executors[idle]]")
+
+
+def test_background_sampling():
+    session = _computer_session(*[([1], [0])] * 1000)
+    jenkins = Jenkins("http://server", session)
+
+    with jenkins.start_utilization_sampler(interval=0.01) as sampler:
+        async_assert(lambda: len(sampler.series()) >= 3)
+    count = len(sampler.series())
+
+    assert sampler.mean_utilization() == 0.5
+    assert len(sampler.series()) == count
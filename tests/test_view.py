@@ -1,7 +1,9 @@
 import pytest
+from mock import MagicMock
 from .utils import clean_view, clean_job
 from pyjen.plugins.listview import ListView
 from pyjen.plugins.freestylejob import FreestyleJob
+from pyjen.view import View
 
 
 @pytest.mark.vcr()
@@ -144,3 +146,59 @@ def test_rename_view(jenkins_api):
         tmp_view = jenkins_api.find_view(expected_name)
         assert tmp_view is not None
         assert tmp_view.name == expected_name
+
+
+def test_get_view_metrics_recursive():
+    folder_url = "http://server/job/folder1/"
+    deep_url = "http://server/job/folder1/job/folder2/"
+    listings = {
+        "http://server/view/nested/": {
+            "jobs": [{
+                "_class": "hudson.model.FreeStyleProject",
+                "name": "job1",
+                "url": "http://server/job/job1/",
+                "color": "red",
+            }],
+            "views": [{
+                "_class": "hudson.model.ListView",
+                "url": "http://server/view/nested/view/sub/",
+                "jobs": [{
+                    "_class": "com.cloudbees.hudson.plugins.folder.Folder",
+                    "name": "folder1",
+                    "url": folder_url,
+                    "jobs": [{"url": deep_url}],
+                }, {
+                    "_class": "hudson.model.FreeStyleProject",
+                    "name": "job1",
+                    "url": "http://server/job/job1/",
+                    "color": "red",
+                }],
+                "views": [],
+            }],
+        },
+        folder_url: {
+            "jobs": [{
+                "_class": "com.cloudbees.hudson.plugins.folder.Folder",
+                "name": "folder2",
+                "url": deep_url,
+                "jobs": [{
+                    "_class": "hudson.model.FreeStyleProject",
+                    "name": "job2",
+                    "url": deep_url + "job/job2/",
+                    "color": "disabled",
+                }],
+            }],
+        },
+    }
+    api = MagicMock()
+    api.url = "http://server/view/nested/"
+    api.get_api_data.side_effect = \
+        lambda target_url, query_params: listings[target_url]
+    view = View(api)
+
+    result = view.get_view_metrics(recursive=True, depth=2)
+
+    assert api.get_api_data.call_count == 2
+    assert result["broken_jobs_count"] == 1
+    assert result["disabled_jobs_count"] == 1
+    assert result["unstable_jobs_count"] == 0
@@ -0,0 +1,109 @@
+import pytest
+from mock import MagicMock
+from pyjen.utils import xml_backend
+from pyjen.plugins.freestylejob import FreestyleXML
+from pyjen.plugins.shellbuilder import ShellBuilder
+from pyjen.plugins.runcondition_always import AlwaysRun
+from pyjen.plugins.runcondition_not import NotCondition
+
+_CONFIG = """<?xml version='1.1' encoding='UTF-8'?>
+<project>
+  <description>café</description>
+  <builders/>
+</project>"""
+
+
+@pytest.fixture(params=[xml_backend.ETREE, xml_backend.LXML])
+def backend(request):
+    original = xml_backend.backend()
+    if request.param == xml_backend.LXML:
+        pytest.importorskip("lxml")
+    xml_backend.use_backend(request.param)
+    yield request.param
+    xml_backend.use_backend(original)
+
+
+def test_round_trip(backend):
+    assert xml_backend.backend() == backend
+    root = xml_backend.fromstring(_CONFIG)
+    assert root.find("description").text == "café"
+
+    builders = root.find("builders")
+    xml_backend.SubElement(builders, "step", {"class": "a"}, id="1")
+    builders.append(xml_backend.Element("step", {"class": "b"}))
+
+    result = xml_backend.tostring(root)
+    assert isinstance(result, str)
+    assert not result.startswith("<?xml")
+    steps = xml_backend.fromstring(result).findall("builders/step")
+    assert [cur.attrib["class"] for cur in steps] == ["a", "b"]
+    assert steps[0].attrib["id"] == "1"
+
+
+def test_large_text_nodes(backend):
+    script = "echo hello\n" * 1500000
+    root = xml_backend.fromstring(
+        f"<definition><script>{script}</script></definition>")
+    assert root.find("script").text == script
+
+
+def test_plugins(backend):
+    builder = ShellBuilder.instantiate("echo hello")
+    assert builder.script == "echo hello"
+    assert isinstance(str(builder), str)
+    assert "<command>echo hello</command>" in str(builder)
+
+
+def test_comments_ignored(backend):
+    config = """<?xml version='1.1' encoding='UTF-8'?>
+<!-- managed by a script -->
+<project>
+  <?editor mode="xml"?>
+  <builders>
+    <!-- build step -->
+    <hudson.tasks.Shell>
+      <command>echo hello</command>
+    </hudson.tasks.Shell>
+  </builders>
+</project>"""
+    api = MagicMock()
+    api.get_text.return_value = config
+
+    builders = FreestyleXML(api).builders
+
+    assert [cur.script for cur in builders] == ["echo hello"]
+
+
+def test_added_plugins_are_copied(backend):
+    source_api = MagicMock()
+    source_api.get_text.return_value = _CONFIG.replace(
+        "<builders/>",
+        "<builders><hudson.tasks.Shell><command>make</command>"
+        "</hudson.tasks.Shell></builders>")
+    target_api = MagicMock()
+    target_api.get_text.return_value = _CONFIG
+    source = FreestyleXML(source_api)
+    target = FreestyleXML(target_api)
+
+    builder = source.builders[0]
+    target.add_builder(builder)
+
+    # the job the plugin was loaded from keeps its build step
+    assert [cur.script for cur in source.builders] == ["make"]
+    assert [cur.script for cur in target.builders] == ["make"]
+
+    # later changes made through the plugin only apply to its new parent
+    builder.unstable_return_code = 2
+    assert target.builders[0].unstable_return_code == 2
+    assert source.builders[0].unstable_return_code is None
+
+    # plugins nested within other plugins are left intact as well
+    condition = AlwaysRun.instantiate()
+    first = NotCondition.instantiate(condition)
+    second = NotCondition.instantiate(condition)
+    assert len(first.node) == len(second.node) == 1
+
+
+def test_unsupported_backend():
+    with pytest.raises(ValueError):
+        xml_backend.use_backend("minidom")
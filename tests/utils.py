@@ -2,7 +2,10 @@
 import os
 import glob
 import time
+from copy import deepcopy
 from contextlib import contextmanager
+from mock import MagicMock
+from requests.exceptions import HTTPError
 
 
 @contextmanager
@@ -122,6 +125,193 @@ def assert_elements_equal(element1, element2):
         assert_elements_equal(child1, child2)
 
 
+def mock_response(data=None, text=None, headers=None, status_code=200):
+    """Generates a mock HTTP response as returned by a Jenkins server
+
+    Args:
+        data:
+            decoded JSON data returned by the response
+        text (str):
+            text of the response body
+        headers (dict):
+            HTTP headers of the response. Defaults to the headers of a
+            Jenkins v1 server
+        status_code (int):
+            HTTP status code of the response. Error codes cause
+            raise_for_status to raise an HTTPError
+
+    Returns:
+        mock.MagicMock:
+            mock response object
+    """
+    response = MagicMock()
+    response.json.return_value = data
+    response.text = text
+    response.headers = {"x-jenkins": "1.651"} if headers is None else headers
+    response.status_code = status_code
+    if status_code >= 400:
+        response.raise_for_status.side_effect = HTTPError(response=response)
+    return response
+
+
+def mock_session(data=None, **kwargs):
+    """Generates a mock HTTP session returning the same response to every
+    request
+
+    Args:
+        data:
+            decoded JSON data returned by every request
+        kwargs:
+            additional properties of the response, as accepted by
+            :func:`mock_response`
+
+    Returns:
+        mock.MagicMock:
+            mock session object
+    """
+    response = mock_response(data, **kwargs)
+    session = MagicMock()
+    session.get.return_value = response
+    session.post.return_value = response
+    return session
+
+
+class FakeServer:
+    """Mock HTTP session serving responses generated from the URL requested
+
+    Tests either provide a function mapping URLs to responses, or derive from
+    this class and override :meth:`respond`. The URLs of all GET requests are
+    recorded so tests can check which requests were made.
+
+    Args:
+        respond:
+            optional function accepting the URL of a request and returning
+            the response to it
+    """
+    def __init__(self, respond=None):
+        self.urls = []
+        self.session = MagicMock()
+        self.session.get.side_effect = self.get
+        if respond is not None:
+            self.respond = respond
+
+    def get(self, url, **_kwargs):
+        """Records a GET request and returns the response to it
+
+        Args:
+            url (str):
+                URL being requested
+
+        Returns:
+            mock.MagicMock:
+                mock response object
+        """
+        self.urls.append(url)
+        return self.respond(url)
+
+    def respond(self, url):
+        """Generates the response to a request
+
+        Args:
+            url (str):
+                URL being requested
+
+        Returns:
+            mock.MagicMock:
+                mock response object
+        """
+        raise NotImplementedError()
+
+
+class FakeAsyncResponse:
+    """Mock aiohttp response, usable as an asynchronous context manager
+
+    Args:
+        url (str):
+            URL the response was returned for
+        status (int):
+            HTTP status code of the response
+        data:
+            decoded JSON data, text or bytes returned by the response
+        headers (dict):
+            HTTP headers of the response
+    """
+    def __init__(self, url, status=200, data=None, headers=None):
+        self.url = url
+        self.status = status
+        self.data = data
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def raise_for_status(self):
+        """Raises an aiohttp error for HTTP error codes"""
+        if self.status >= 400:
+            import aiohttp
+            raise aiohttp.ClientResponseError(
+                None, (), status=self.status, message=str(self.url))
+
+    async def json(self, content_type=None):
+        """
+        Returns:
+            decoded JSON data of the response
+        """
+        return self.data
+
+    async def text(self):
+        """
+        Returns:
+            str: text of the response body
+        """
+        return self.data
+
+    async def read(self):
+        """
+        Returns:
+            bytes: raw response body
+        """
+        return self.data
+
+
+class FakeAsyncSession:
+    """Mock aiohttp session serving canned responses keyed by URL
+
+    All requests are recorded, including their arguments, so tests can check
+    which requests were made.
+
+    Args:
+        responses (dict):
+            maps 2-tuples of HTTP method and URL to lists of arguments for
+            :class:`FakeAsyncResponse`. Responses are consumed one per
+            request, except for the last one which is reused by every later
+            request.
+    """
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = []
+
+    def _respond(self, method, url, kwargs):
+        self.requests.append((method, url, deepcopy(kwargs)))
+        responses = self.responses[(method, url)]
+        response = responses.pop(0) if len(responses) > 1 else responses[0]
+        return FakeAsyncResponse(url, *response)
+
+    def get(self, url, **kwargs):
+        """Records a GET request and returns the response to it"""
+        return self._respond("GET", url, kwargs)
+
+    def post(self, url, **kwargs):
+        """Records a POST request and returns the response to it"""
+        return self._respond("POST", url, kwargs)
+
+    async def close(self):
+        """Closes the session"""
+
+
 if __name__ == "__main__":
     pass
 